@@ -86,10 +86,17 @@ def extract_query_results(agent_response: AgentRunResult) -> list[BigQueryExecut
         tool_response_obj = tool_returns.get(tool_call_id)
 
         if tool_response_obj:
-            tool_data = BigQueryExecution(
+            # The model only sees the encoded rows, the full response travels in the metadata
+            full_response = tool_response_obj.metadata
+            # The results were already validated by the tool, avoid copying them again
+            tool_data = BigQueryExecution.model_construct(
                 query_id=tool_call_id,
                 query=tool_call_obj.args.get("query"),
-                results=tool_response_obj.content.results,
+                results=full_response.results,
+                status=full_response.status,
+                estimated_bytes_processed=full_response.estimated_bytes_processed,
+                total_rows=full_response.total_rows,
+                result_handle=full_response.result_handle,
             )
             query_results.append(tool_data)
         else:
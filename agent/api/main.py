@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
@@ -35,12 +36,21 @@ from .auxiliars import (
     prepare_to_read_chat_history,
 )
 from .gcs_utils import generate_upload_url
+from ..tools.url_scraper.tool_functions import scrape_engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the connection pool of the scraper, bound to the server loop
+    await scrape_engine.aclose()
 
 
 app = FastAPI(
     title="Lawyer Agent API",
     description="API for the Lawyer Agent",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
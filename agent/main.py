@@ -11,8 +11,12 @@ from .tools.bigquery import (
     list_bq_tables,
     get_bq_table_schema,
     execute_bq_query,
+    get_bq_result_page,
 )
-from .tools.url_scraper import scrape_and_convert_to_markdown
+from .tools.url_scraper import scrape_and_convert_to_markdown, scrape_urls
+from .tools.dof_search import search_dof
+from .tools.semantic_search import semantic_search
+from .tools.federal_laws import get_article
 
 
 current_date = datetime.now(timezone(timedelta(hours=-6))).strftime("%d/%m/%Y")
@@ -23,7 +27,12 @@ raw_tools = [
     list_bq_tables,
     get_bq_table_schema,
     execute_bq_query,
+    get_bq_result_page,
     scrape_and_convert_to_markdown,
+    scrape_urls,
+    search_dof,
+    semantic_search,
+    get_article,
 ]
 
 system_prompt = f"""
@@ -48,10 +57,13 @@ To ensure optimal recall, you must NEVER rely on a single search term. Legal ter
   3. Related Article/Law (e.g., "Código Penal Art...").
   4. Broader context (Category of law).
   5. Specific jurisdiction variation (Federal vs Local terms).
+  Use `semantic_search` for this: it matches DOF notes and federal law articles by meaning, and the 5 phrasings go in the `queries` of a SINGLE call.
 
 - **FOR BIGQUERY (SQL):**
   When filtering text columns (WHERE clause), do not filter by a single keyword. You must construct robust filters using `OR` logic with multiple synonyms.
   *Example:* `WHERE descripcion LIKE '%robo%' OR descripcion LIKE '%hurto%' OR descripcion LIKE '%despojo%'`
+  To find DOF notes by subject, call `search_dof` first (it ranks titles and bodies from an in-memory index without running SQL, with every synonym in the same query: 'robo hurto despojo'), then use SQL for exact filters and aggregates (and for notes older than its `indexed_since`).
+  For the DOF table, prefer its structured columns (`authority`, `document_type`, `referenced_laws`, `article_numbers`, see their descriptions in the schema) with equality filters, and always bound `published_date`.
 
 ### 2. SQL QUERY PROTOCOL (STRICT)
 You are FORBIDDEN from generating a SQL query based on assumptions. Follow this sequence:
@@ -59,6 +71,9 @@ You are FORBIDDEN from generating a SQL query based on assumptions. Follow this
 - **STEP 2: INSPECTION.** Call `get_bq_table_schema`.
 - **STEP 3: GENERATION.** ONLY AFTER receiving the schema, generate the SQL query using `StandardSQL`. Generate at least 5 distinct queries, each with a different WHERE clause to
   try to cover all possible cases. (See FOR RAG/INTERNAL TOOLS for more details)
+- **LARGE RESULTS.** If the result is too large, `execute_bq_query` returns column statistics, a sample and a `result_handle`. Prefer aggregated queries; use `get_bq_result_page` only if you need the individual rows.
+- **DOF STATISTICS.** For counts and trends of DOF publications (e.g. decretos per month of an authority) query the pre-aggregated `dof_stats` table (`SUM(notes_count)`) instead of counting rows of `dof`.
+- **COST LIMIT.** If `execute_bq_query` answers with a `rejected` status, use `estimated_bytes_processed` to narrow the query (fewer columns, date ranges, filters) and try again.
 
 ### 3. DOCUMENT & EVIDENCE ANALYSIS PROTOCOL (NEW)
 When the user provides files (PDFs, Images, Videos) for analysis:
@@ -80,6 +95,10 @@ When the user provides files (PDFs, Images, Videos) for analysis:
 - **Reflection:**
     - Did the 5 queries yield consistent results? If one term returned 0 results but another returned 50, prioritize the successful terminology for the final synthesis.
     - if more information is required, to give all the context, use the 'scrape_and_convert_to_markdown' tool.
+      When several pages are needed (e.g. many DOF links), use 'scrape_urls' to fetch them all in a single call.
+      Scraped content is paged: if `total_pages` is greater than 1 and the answer is not in the first page, request the next pages with the `page` field.
+      For a specific article of a federal law (law and article number known), call `get_article` instead of scraping the law PDF; cite its pages as "(Página X)".
+      For PDFs (e.g. federal laws) check `pdf_total_pages` and use `page_range` to read only the relevant pages; cite them as "(Página X)" using the `## Página X` headings.
 
 ### 5. RESPONSE FORMAT (STRICT):
 Structure your answer as follows:
@@ -3,6 +3,7 @@ from .tool_functions import (
     list_bq_tables,
     get_bq_table_schema,
     execute_bq_query,
+    get_bq_result_page,
 )
 
 __all__ = [
@@ -10,4 +11,5 @@ __all__ = [
     "list_bq_tables",
     "get_bq_table_schema",
     "execute_bq_query",
+    "get_bq_result_page",
 ]
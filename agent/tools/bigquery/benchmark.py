@@ -0,0 +1,102 @@
+"""
+Benchmark of the two ways execute_bq_query can materialize results:
+
+    - dict path: RowIterator -> [dict(row) for row in rows]
+    - arrow path: RowIterator -> pyarrow.Table (Storage Read API when available) -> to_pylist()
+
+Each path runs in its own process so peak memory is not polluted by the other one.
+Python allocations are measured with tracemalloc and Arrow buffers with the Arrow memory pool.
+
+Usage:
+    uv run --group agent -m agent.tools.bigquery.benchmark \
+        --query "SELECT * FROM lawyer_agent.dof WHERE published_date >= '2024-01-01'" --repeat 3
+"""
+
+import argparse
+import multiprocessing
+import time
+import tracemalloc
+
+
+def _dict_path(query: str) -> int:
+    from .bq_utils import query_data
+
+    results = [dict(row) for row in query_data(query)]
+    return len(results)
+
+
+def _arrow_path(query: str) -> int:
+    from .bq_utils import query_to_arrow
+
+    results = query_to_arrow(query).to_pylist()
+    return len(results)
+
+
+PATHS = {
+    "dict": _dict_path,
+    "arrow": _arrow_path,
+}
+
+
+def _measure(path_name: str, query: str, queue: multiprocessing.Queue) -> None:
+    """
+    Run one path in the current (child) process and report its metrics through the queue.
+    """
+    import pyarrow
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = PATHS[path_name](query)
+    elapsed = time.perf_counter() - start
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    queue.put(
+        {
+            "path": path_name,
+            "rows": rows,
+            "seconds": elapsed,
+            "rows_per_second": rows / elapsed if elapsed else float("inf"),
+            "python_peak_mb": python_peak / 1024**2,
+            "arrow_peak_mb": pyarrow.default_memory_pool().max_memory() / 1024**2,
+        }
+    )
+
+
+def run_benchmark(query: str, repeat: int) -> list[dict]:
+    """
+    Run every path `repeat` times, each run in a fresh process.
+
+    Args:
+        query (str): Query to benchmark. BigQuery's result cache makes runs after the first one cheap.
+        repeat (int): Number of runs per path.
+
+    Returns:
+        list[dict]: One dictionary of metrics per run.
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    metrics = []
+
+    for _ in range(repeat):
+        for path_name in PATHS:
+            process = context.Process(target=_measure, args=(path_name, query, queue))
+            process.start()
+            metrics.append(queue.get())
+            process.join()
+
+    return metrics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dict vs Arrow result paths.")
+    parser.add_argument("--query", type=str, required=True, help="Read-only query to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path")
+    args = parser.parse_args()
+
+    print(f"{'path':<6} {'rows':>8} {'seconds':>9} {'rows/s':>12} {'py peak MB':>11} {'arrow peak MB':>14}")
+    for run in run_benchmark(args.query, args.repeat):
+        print(
+            f"{run['path']:<6} {run['rows']:>8} {run['seconds']:>9.3f} {run['rows_per_second']:>12.0f} "
+            f"{run['python_peak_mb']:>11.1f} {run['arrow_peak_mb']:>14.1f}"
+        )
@@ -1,6 +1,15 @@
 from google.cloud import bigquery
 from google.cloud.bigquery.schema import SchemaField
 from loguru import logger
+import pyarrow
+
+# The BigQuery Storage Read API is optional, without it results are downloaded through the REST API
+try:
+    from google.cloud import bigquery_storage  # noqa: F401
+
+    BQSTORAGE_AVAILABLE = True
+except ImportError:
+    BQSTORAGE_AVAILABLE = False
 
 
 client = bigquery.Client()
@@ -144,12 +153,57 @@ def get_table_schema(
         raise ValueError(f"Error getting table schema: {e}")
 
 
-def query_data(query: str) -> list:
+def get_table_description(
+    table_name: str, dataset_name: str, project_id: str
+) -> str | None:
+    """
+    Get the description of a table in BigQuery (what it holds and how to query it).
+
+    Args:
+        table_name (str): The name of the table.
+        dataset_name (str): The name of the dataset.
+        project_id (str): The project ID.
+
+    Returns:
+        str | None: The description, None if the table has none.
+    """
+    table_id = f"{project_id}.{dataset_name}.{table_name}"
+    try:
+        return client.get_table(table_id).description
+    except Exception as e:
+        raise ValueError(f"Error getting table description: {e}")
+
+
+def dry_run_query(query: str) -> int:
+    """
+    Validate a query and estimate its cost without executing it. Dry runs are free of charge.
+
+    Args:
+        query (str): The SQL query to estimate.
+
+    Returns:
+        int: Estimated number of bytes the query would process.
+    """
+    if not isinstance(query, str) or query == "":
+        raise ValueError("The query must be a non-empty string.")
+
+    job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+
+    try:
+        query_job = client.query(query, job_config=job_config)
+        return query_job.total_bytes_processed or 0
+
+    except Exception as e:
+        raise ValueError(f"Error during the query dry run: {e}")
+
+
+def query_data(query: str, maximum_bytes_billed: int | None = None) -> list:
     """
     Query data from a table in BigQuery.
 
     Args:
         query (str): The SQL query to execute.
+        maximum_bytes_billed (int | None): If set, BigQuery fails the job instead of billing more bytes than this.
 
     Returns:
         list: A list of rows returned by the query.
@@ -157,10 +211,41 @@ def query_data(query: str) -> list:
     if not isinstance(query, str) or query == "":
         raise ValueError("The query must be a non-empty string.")
 
+    job_config = bigquery.QueryJobConfig(maximum_bytes_billed=maximum_bytes_billed)
+
     try:
-        query_job = client.query(query)
+        query_job = client.query(query, job_config=job_config)
         results = query_job.result()
         return results
 
     except Exception as e:
         raise ValueError(f"Error querying the data: {e}")
+
+
+def query_to_arrow(query: str, maximum_bytes_billed: int | None = None) -> pyarrow.Table:
+    """
+    Query data from a table in BigQuery and keep the results columnar.
+    Large results are downloaded with the BigQuery Storage Read API when it is installed.
+
+    Args:
+        query (str): The SQL query to execute.
+        maximum_bytes_billed (int | None): If set, BigQuery fails the job instead of billing more bytes than this.
+
+    Returns:
+        pyarrow.Table: The rows returned by the query.
+    """
+    if not isinstance(query, str) or query == "":
+        raise ValueError("The query must be a non-empty string.")
+
+    job_config = bigquery.QueryJobConfig(maximum_bytes_billed=maximum_bytes_billed)
+
+    try:
+        query_job = client.query(query, job_config=job_config)
+        # The client only switches to the Storage Read API when the results do not fit in the first page
+        return query_job.result().to_arrow(
+            create_bqstorage_client=BQSTORAGE_AVAILABLE,
+            progress_bar_type=None,
+        )
+
+    except Exception as e:
+        raise ValueError(f"Error querying the data: {e}")
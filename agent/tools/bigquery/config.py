@@ -29,3 +29,107 @@ class BQConfig(BaseSettings):
             description="GCP Project ID",
         ),
     ]
+    MAX_BYTES_BILLED: Annotated[
+        int,
+        Field(
+            default=1_000_000_000,
+            description="Hard cap of bytes billed per query job. BigQuery fails the job if it would exceed it.",
+            gt=0,
+        ),
+    ]
+    DRY_RUN_MAX_BYTES: Annotated[
+        int,
+        Field(
+            default=500_000_000,
+            description="Queries whose dry-run estimate exceeds this amount of bytes are rejected before execution.",
+            gt=0,
+        ),
+    ]
+    MAX_RESULT_ROWS: Annotated[
+        int,
+        Field(
+            default=50_000,
+            description="LIMIT injected into (or clamped on) every agent query. Large results are summarized before reaching the model.",
+            gt=0,
+        ),
+    ]
+    METADATA_MAX_ROWS: Annotated[
+        int,
+        Field(
+            default=1000,
+            description="Rows of each result kept in the tool metadata (returned and persisted as queries_executed). Larger results are paged through result_handle.",
+            gt=0,
+        ),
+    ]
+    MAX_CELL_CHARS: Annotated[
+        int,
+        Field(
+            default=300,
+            description="Text values longer than this are truncated in the results sent to the model.",
+            gt=0,
+        ),
+    ]
+    SUMMARY_ROW_THRESHOLD: Annotated[
+        int,
+        Field(
+            default=200,
+            description="Results with more rows than this are summarized instead of sent in full to the model.",
+            gt=0,
+        ),
+    ]
+    SUMMARY_BYTE_THRESHOLD: Annotated[
+        int,
+        Field(
+            default=60_000,
+            description="Results whose encoded size exceeds this amount of bytes are summarized instead of sent in full to the model.",
+            gt=0,
+        ),
+    ]
+    SUMMARY_SAMPLE_ROWS: Annotated[
+        int,
+        Field(
+            default=30,
+            description="Number of rows of the stratified sample included in a summary.",
+            gt=0,
+        ),
+    ]
+    SUMMARY_TOP_K: Annotated[
+        int,
+        Field(
+            default=10,
+            description="Number of most frequent values reported per text column in a summary.",
+            gt=0,
+        ),
+    ]
+    RESULT_PAGE_ROWS: Annotated[
+        int,
+        Field(
+            default=100,
+            description="Rows per page returned by get_bq_result_page.",
+            gt=0,
+        ),
+    ]
+    RESULT_STORE_MAX_ENTRIES: Annotated[
+        int,
+        Field(
+            default=64,
+            description="Maximum number of summarized results kept in memory to be paged.",
+            gt=0,
+        ),
+    ]
+    RESULT_STORE_MAX_BYTES: Annotated[
+        int,
+        Field(
+            default=512_000_000,
+            description="Maximum memory used by the summarized results kept in memory.",
+            gt=0,
+        ),
+    ]
+    RESULT_STORE_TTL_SECONDS: Annotated[
+        int,
+        Field(
+            default=3_600,
+            description="Seconds a result handle stays valid.",
+            gt=0,
+        ),
+    ]
@@ -0,0 +1,66 @@
+import pyarrow
+
+
+def _format_cell(value, max_cell_chars: int) -> tuple[str, bool]:
+    """
+    Format a single value for the TSV encoding.
+
+    Returns:
+        tuple[str, bool]: The formatted value and whether it was truncated.
+    """
+    if value is None:
+        return "", False
+
+    if hasattr(value, "isoformat"):
+        text = value.isoformat()
+    else:
+        text = str(value)
+
+    # Tabs and new lines would break the layout of the table
+    text = " ".join(text.split()) if any(char in text for char in "\t\r\n") else text
+
+    if len(text) > max_cell_chars:
+        return text[: max_cell_chars - 1] + "…", True
+    return text, False
+
+
+def encode_table(table: pyarrow.Table, max_cell_chars: int) -> tuple[str, int]:
+    """
+    Encode query results as tab separated values: one header line with the column names and one
+    line per row. Column names are written once instead of once per row as in a list of dictionaries.
+
+    Args:
+        table (pyarrow.Table): Results of the query.
+        max_cell_chars (int): Values longer than this are truncated and end with "…".
+
+    Returns:
+        tuple[str, int]: The encoded table and the number of truncated values.
+    """
+    truncated_cells = 0
+    encoded_columns = []
+
+    # Encode column by column, rows only exist when the lines are joined
+    for column in table.columns:
+        encoded_column = []
+        for value in column.to_pylist():
+            text, truncated = _format_cell(value, max_cell_chars)
+            truncated_cells += truncated
+            encoded_column.append(text)
+        encoded_columns.append(encoded_column)
+
+    lines = ["\t".join(table.column_names)]
+    lines.extend("\t".join(row) for row in zip(*encoded_columns))
+
+    return "\n".join(lines), truncated_cells
+
+
+def truncation_note(truncated_cells: int, max_cell_chars: int) -> str | None:
+    """
+    Message telling the model that some values are incomplete, None if nothing was truncated.
+    """
+    if not truncated_cells:
+        return None
+    return (
+        f"{truncated_cells} values were longer than {max_cell_chars} characters and were truncated (they end with '…'). "
+        "Use SUBSTR(<column>, <start>, <length>) to read them in parts."
+    )
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from threading import Lock
+import secrets
+import time
+import pyarrow
+from loguru import logger
+
+
+class ResultStore:
+    """
+    In-memory LRU store of query results, so the agent can page through results that were summarized.
+    Bounded by number of entries, total Arrow bytes and age of the entries.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[pyarrow.Table, float]] = OrderedDict()
+        self._total_bytes = 0
+        # Sync tools run in worker threads
+        self._lock = Lock()
+
+    def _evict(self, handle: str) -> None:
+        table, _ = self._entries.pop(handle)
+        self._total_bytes -= table.nbytes
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            handle
+            for handle, (_, created_at) in self._entries.items()
+            if now - created_at > self.ttl_seconds
+        ]
+        for handle in expired:
+            self._evict(handle)
+
+    def put(self, table: pyarrow.Table) -> str | None:
+        """
+        Store a table and return the handle to retrieve it.
+
+        Args:
+            table (pyarrow.Table): Results to store.
+
+        Returns:
+            str | None: The handle, or None if the table alone is bigger than the store.
+        """
+        if table.nbytes > self.max_bytes:
+            logger.warning(
+                f"Result of {table.nbytes} bytes does not fit in the result store ({self.max_bytes} bytes)"
+            )
+            return None
+
+        handle = f"res_{secrets.token_hex(6)}"
+        with self._lock:
+            self._evict_expired()
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or self._total_bytes + table.nbytes > self.max_bytes
+            ):
+                self._evict(next(iter(self._entries)))
+
+            self._entries[handle] = (table, time.monotonic())
+            self._total_bytes += table.nbytes
+
+        return handle
+
+    def get(self, handle: str) -> pyarrow.Table | None:
+        """
+        Retrieve a stored table.
+
+        Args:
+            handle (str): Handle returned by put.
+
+        Returns:
+            pyarrow.Table | None: The table, or None if the handle is unknown or expired.
+        """
+        with self._lock:
+            self._evict_expired()
+            entry = self._entries.get(handle)
+            if entry is None:
+                return None
+            self._entries.move_to_end(handle)
+            return entry[0]
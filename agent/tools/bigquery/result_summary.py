@@ -0,0 +1,126 @@
+import pyarrow
+import pyarrow.compute as pc
+from .schemas import BigQueryColumnSummary, BigQueryValueCount
+
+
+def _is_text(data_type: pyarrow.DataType) -> bool:
+    return pyarrow.types.is_string(data_type) or pyarrow.types.is_large_string(data_type)
+
+
+def _is_ordered(data_type: pyarrow.DataType) -> bool:
+    return (
+        pyarrow.types.is_integer(data_type)
+        or pyarrow.types.is_floating(data_type)
+        or pyarrow.types.is_decimal(data_type)
+        or pyarrow.types.is_temporal(data_type)
+    )
+
+
+def _as_text(scalar: pyarrow.Scalar) -> str | None:
+    value = scalar.as_py()
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def summarize_columns(
+    table: pyarrow.Table, top_k: int, max_value_chars: int
+) -> list[BigQueryColumnSummary]:
+    """
+    Compute per column statistics with Arrow compute kernels (no Python loop over rows).
+
+    Args:
+        table (pyarrow.Table): Results of the query.
+        top_k (int): Number of most frequent values reported for text columns.
+        max_value_chars (int): Reported values longer than this are truncated.
+
+    Returns:
+        list[BigQueryColumnSummary]: One summary per column.
+    """
+    summaries = []
+    for name, column in zip(table.column_names, table.columns):
+        data_type = column.type
+        summary = BigQueryColumnSummary(
+            name=name,
+            data_type=str(data_type),
+            non_null_count=len(column) - column.null_count,
+            distinct_count=pc.count_distinct(column).as_py() if not pyarrow.types.is_nested(data_type) else 0,
+        )
+
+        if _is_ordered(data_type) and summary.non_null_count:
+            min_max = pc.min_max(column)
+            summary.min_value = _as_text(min_max["min"])
+            summary.max_value = _as_text(min_max["max"])
+
+        # Top values are only informative if some values repeat
+        if _is_text(data_type) and 0 < summary.distinct_count < summary.non_null_count:
+            value_counts = pc.value_counts(column.drop_null())
+            counts = value_counts.field("counts")
+            top_indices = pc.array_sort_indices(counts, order="descending")[:top_k]
+            values = value_counts.field("values")
+            summary.top_values = [
+                BigQueryValueCount(
+                    value=values[i].as_py()[:max_value_chars], count=counts[i].as_py()
+                )
+                for i in top_indices.to_pylist()
+            ]
+
+        summaries.append(summary)
+
+    return summaries
+
+
+def _strata_column(table: pyarrow.Table, sample_rows: int) -> str | None:
+    """
+    Text column used to stratify the sample: the one with the fewest distinct values, as long as
+    it has between 2 and sample_rows of them (e.g. the DOF section).
+    """
+    candidates = []
+    for name, column in zip(table.column_names, table.columns):
+        if not _is_text(column.type):
+            continue
+        distinct_count = pc.count_distinct(column).as_py()
+        if 2 <= distinct_count <= sample_rows:
+            candidates.append((distinct_count, name))
+    return min(candidates)[1] if candidates else None
+
+
+def _evenly_spaced(indices: list[int], size: int) -> list[int]:
+    if size >= len(indices):
+        return indices
+    step = len(indices) / size
+    return [indices[int(position * step)] for position in range(size)]
+
+
+def stratified_sample(table: pyarrow.Table, sample_rows: int) -> pyarrow.Table:
+    """
+    Take a deterministic sample of the table. When a suitable text column exists, every one of its
+    values is represented and the sample is allocated proportionally to their frequency.
+
+    Args:
+        table (pyarrow.Table): Results of the query.
+        sample_rows (int): Size of the sample.
+
+    Returns:
+        pyarrow.Table: The sampled rows, in their original order.
+    """
+    if table.num_rows <= sample_rows:
+        return table
+
+    strata_column = _strata_column(table, sample_rows)
+    if strata_column is None:
+        return table.take(_evenly_spaced(list(range(table.num_rows)), sample_rows))
+
+    column = table.column(strata_column).combine_chunks()
+    value_counts = pc.value_counts(column).to_pylist()
+    selected = []
+    for value_count in value_counts:
+        value, count = value_count["values"], value_count["counts"]
+        mask = pc.is_null(column) if value is None else pc.equal(column, value)
+        stratum = pc.indices_nonzero(pc.fill_null(mask, False)).to_pylist()
+        # At least one row per stratum, the rest proportional to its size
+        quota = max(1, round(sample_rows * count / table.num_rows))
+        selected.extend(_evenly_spaced(stratum, quota))
+
+    # Bounded by sample_rows plus one extra row per stratum due to rounding
+    return table.take(sorted(selected))
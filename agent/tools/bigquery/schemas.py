@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict, field_serializer, BeforeValidator
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional
 from enum import StrEnum
 from google.cloud.bigquery.schema import SchemaField
 from .config import BQConfig
@@ -86,6 +86,10 @@ class BigQueryTableSchema(BigQueryGetSchemaRequest):
         list[SchemaField],
         Field(description="The fields of the table."),
     ]
+    description: Annotated[
+        str | None,
+        Field(description="What the table holds and how to query it, if documented."),
+    ] = None
 
     @field_serializer("fields")
     def serialize_fields(self, fields: list[SchemaField], _info: Any) -> list[dict]:
@@ -97,9 +101,155 @@ class BigQueryExecuteQueryRequest(BaseModel):
     query: Annotated[str, Field(description="The SQL query to execute.")]
 
 
-class BigQueryExecuteQueryResponse(BigQueryExecuteQueryRequest):
+class BigQueryQueryStatus(BigQueryExecuteQueryRequest):
+    status: Annotated[
+        str,
+        Field(
+            default="success",
+            description="Processing status, e.g., 'success', 'rejected: <reason>' or 'error: <reason>'.",
+        ),
+    ]
+    estimated_bytes_processed: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            description="Bytes the query scans according to the dry run. Narrow the columns, dates or filters to reduce it.",
+            ge=0,
+        ),
+    ]
+
+
+class BigQueryExecuteQueryResponse(BigQueryQueryStatus):
     results: Annotated[
-        list[dict], Field(description="List of rows returned by the query.")
+        list[dict],
+        Field(description="Rows returned by the query, at most METADATA_MAX_ROWS."),
+    ]
+    total_rows: Annotated[
+        int,
+        Field(
+            default=0,
+            description="Number of rows returned by the query, `results` may hold fewer.",
+            ge=0,
+        ),
+    ]
+    result_handle: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Handle to page through the full result with get_bq_result_page, only present for summarized results.",
+        ),
+    ]
+
+
+class BigQueryValueCount(BaseModel):
+    value: Annotated[str, Field(description="A value of the column.")]
+    count: Annotated[int, Field(description="Rows holding the value.", ge=0)]
+
+
+class BigQueryColumnSummary(BaseModel):
+    name: Annotated[str, Field(description="Name of the column.")]
+    data_type: Annotated[str, Field(description="Arrow type of the column.")]
+    non_null_count: Annotated[int, Field(description="Rows with a value.", ge=0)]
+    distinct_count: Annotated[int, Field(description="Number of distinct values.", ge=0)]
+    min_value: Annotated[
+        Optional[str],
+        Field(default=None, description="Minimum value, for dates and numbers."),
+    ]
+    max_value: Annotated[
+        Optional[str],
+        Field(default=None, description="Maximum value, for dates and numbers."),
+    ]
+    top_values: Annotated[
+        list[BigQueryValueCount],
+        Field(
+            default_factory=list,
+            description="Most frequent values, for text columns.",
+        ),
+    ]
+
+
+class BigQueryEncodedQueryResponse(BigQueryQueryStatus):
+    total_rows: Annotated[
+        int,
+        Field(
+            default=0,
+            description="Number of rows returned by the query.",
+            ge=0,
+        ),
+    ]
+    data: Annotated[
+        str,
+        Field(
+            default="",
+            description="Rows returned by the query as tab separated values. The first line is the header.",
+        ),
+    ]
+    note: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Remarks about the encoding, e.g. values that were truncated.",
+        ),
+    ]
+    column_summaries: Annotated[
+        Optional[list[BigQueryColumnSummary]],
+        Field(
+            default=None,
+            description="Statistics of every column, only present when the result was too large and `data` holds a sample.",
+        ),
+    ]
+    result_handle: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Handle to page through the full result with get_bq_result_page, only present for summarized results.",
+        ),
+    ]
+    total_pages: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            description="Number of pages available through get_bq_result_page.",
+            ge=0,
+        ),
+    ]
+
+
+class BigQueryResultPageRequest(BaseModel):
+    result_handle: Annotated[
+        str,
+        Field(description="Handle returned by execute_bq_query for a summarized result."),
+        STRING_NORMALIZER,
+    ]
+    page: Annotated[
+        int,
+        Field(default=1, description="Page number to retrieve, starting at 1.", ge=1),
+    ]
+
+
+class BigQueryResultPageResponse(BigQueryResultPageRequest):
+    status: Annotated[
+        str,
+        Field(
+            default="success",
+            description="Processing status, e.g., 'success' or 'error: <reason>'.",
+        ),
+    ]
+    total_pages: Annotated[int, Field(default=0, description="Number of pages.", ge=0)]
+    total_rows: Annotated[int, Field(default=0, description="Rows of the full result.", ge=0)]
+    data: Annotated[
+        str,
+        Field(
+            default="",
+            description="Rows of the page as tab separated values. The first line is the header.",
+        ),
+    ]
+    note: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Remarks about the encoding, e.g. values that were truncated.",
+        ),
     ]
 
 
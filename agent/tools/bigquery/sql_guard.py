@@ -0,0 +1,196 @@
+from functools import lru_cache
+from typing import Callable, Optional
+import sqlglot
+from sqlglot import exp
+from loguru import logger
+
+
+DIALECT = "bigquery"
+
+# Any of these nodes, at any depth, makes a statement a write
+WRITE_EXPRESSIONS = (
+    exp.DML,
+    exp.Insert,
+    exp.Create,
+    exp.Drop,
+    exp.Alter,
+    exp.TruncateTable,
+    exp.Command,
+)
+
+# Type of the callable used to expand SELECT *: (project_id, dataset_name, table_name) -> column names
+ColumnsLookup = Callable[[str, str, str], list[str]]
+
+
+@lru_cache(maxsize=512)
+def _parse(query: str) -> exp.Expression:
+    """
+    Parse a raw query. Cached by its text (the model often repeats the same query), callers
+    must .copy() the tree before modifying it.
+    """
+    try:
+        statements = [
+            statement
+            for statement in sqlglot.parse(query, read=DIALECT)
+            if statement is not None
+        ]
+    except sqlglot.errors.ParseError as e:
+        raise ValueError(f"The query could not be parsed: {e}")
+
+    if len(statements) != 1:
+        raise ValueError("Exactly one SQL statement per query is allowed.")
+
+    return statements[0]
+
+
+def _validate_read_only(tree: exp.Expression) -> None:
+    """
+    Raise a ValueError if the statement is not a plain SELECT (or set operation of SELECTs).
+    """
+    if not isinstance(tree, exp.Query):
+        raise ValueError(
+            f"Only read-only queries are allowed. Forbidden: {tree.key.upper()}"
+        )
+
+    write_node = tree.find(*WRITE_EXPRESSIONS)
+    if write_node is not None:
+        raise ValueError(
+            f"Only read-only queries are allowed. Forbidden: {write_node.key.upper()}"
+        )
+
+
+def _relation_names(select: exp.Select) -> set[str]:
+    """
+    Aliases (or names) of the relations in the FROM clause and joins of a SELECT.
+    """
+    from_clause = select.args.get("from") or select.args.get("from_")
+    relations = [from_clause.this] if from_clause else []
+    relations += [join.this for join in select.args.get("joins") or []]
+    return {relation.alias_or_name for relation in relations if relation.alias_or_name}
+
+
+def _has_join_predicate(select: exp.Select, join: exp.Join) -> bool:
+    """
+    Tells if the WHERE clause of a comma/cross join relates the joined relation with another one:
+    an equality between a column qualified with the joined relation and a column qualified with a
+    different relation of the same SELECT. Unqualified columns cannot be attributed to a relation
+    and do not count.
+    """
+    where = select.args.get("where")
+    if where is None:
+        return False
+
+    joined_name = join.this.alias_or_name
+    other_names = _relation_names(select) - {joined_name}
+    for equality in where.find_all(exp.EQ):
+        left, right = equality.this, equality.expression
+        if not (isinstance(left, exp.Column) and isinstance(right, exp.Column)):
+            continue
+        tables = {left.table, right.table}
+        if len(tables) == 2 and joined_name in tables and (tables - {joined_name}) <= other_names:
+            return True
+    return False
+
+
+def _reject_cross_joins(tree: exp.Expression) -> None:
+    """
+    Raise a ValueError for joins that produce a cartesian product between two relations.
+    Joins against UNNEST(...) are allowed, they are the BigQuery way to flatten arrays.
+    """
+    for select in tree.find_all(exp.Select):
+        for join in select.args.get("joins") or []:
+            if isinstance(join.this, exp.Unnest) or join.args.get("on") or join.args.get("using"):
+                continue
+            if join.kind and join.kind.upper() != "CROSS":
+                continue
+            if _has_join_predicate(select, join):
+                continue
+            raise ValueError(
+                f"Cross joins are not allowed (joined relation: {join.this.sql(dialect=DIALECT)}). "
+                "Add an ON/USING condition."
+            )
+
+
+def _expand_stars(
+    tree: exp.Expression, columns_lookup: ColumnsLookup, default_project: str
+) -> None:
+    """
+    Replace SELECT * over a single table with the explicit list of columns returned by columns_lookup.
+    Stars with modifiers (EXCEPT, REPLACE) or over several relations are left untouched.
+    """
+    for select in tree.find_all(exp.Select):
+        stars = [
+            projection
+            for projection in select.expressions
+            if isinstance(projection, exp.Star)
+        ]
+        if len(stars) != 1 or any(stars[0].args.values()) or select.args.get("joins"):
+            continue
+
+        from_clause = select.args.get("from") or select.args.get("from_")
+        table = from_clause.this if from_clause else None
+        if not isinstance(table, exp.Table) or not table.db:
+            continue
+
+        project_id = table.catalog or default_project
+        try:
+            columns = columns_lookup(project_id, table.db, table.name)
+        except Exception as e:
+            logger.warning(f"Could not expand SELECT * for {table.sql(dialect=DIALECT)}: {e}")
+            continue
+        if not columns:
+            continue
+
+        select.set(
+            "expressions",
+            [exp.column(column, quoted=True) for column in columns],
+        )
+
+
+def _enforce_limit(tree: exp.Query, max_rows: int) -> None:
+    """
+    Inject a LIMIT if the query has none, or clamp it to max_rows.
+    """
+    limit = tree.args.get("limit")
+    if limit is not None:
+        value = limit.expression
+        if isinstance(value, exp.Literal) and value.is_int and int(value.this) <= max_rows:
+            return
+
+    tree.set("limit", exp.Limit(expression=exp.Literal.number(max_rows)))
+
+
+def prepare_read_query(
+    query: str,
+    max_rows: int,
+    columns_lookup: Optional[ColumnsLookup] = None,
+    default_project: str = "",
+) -> str:
+    """
+    Parse an agent generated query and return the SQL that is safe to execute.
+
+    The statement must be a single read-only query without cartesian joins. A LIMIT of max_rows
+    is injected (or clamped) and, if columns_lookup is given, SELECT * over a single table is
+    expanded to the explicit columns it returns.
+
+    Args:
+        query (str): SQL query written by the agent.
+        max_rows (int): Maximum number of rows the query is allowed to return.
+        columns_lookup (Optional[ColumnsLookup]): Returns the columns to use instead of *.
+        default_project (str): Project used for tables referenced without one.
+
+    Returns:
+        str: The rewritten query in BigQuery Standard SQL.
+    """
+    if not isinstance(query, str) or query.strip() == "":
+        raise ValueError("The query must be a non-empty string.")
+
+    tree = _parse(query).copy()
+
+    _validate_read_only(tree)
+    _reject_cross_joins(tree)
+    if columns_lookup is not None:
+        _expand_stars(tree, columns_lookup, default_project)
+    _enforce_limit(tree, max_rows)
+
+    return tree.sql(dialect=DIALECT)
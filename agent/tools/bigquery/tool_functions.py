@@ -1,10 +1,15 @@
 from loguru import logger
-import re
+from functools import lru_cache
+from pydantic_ai import RunContext, ToolReturn
+import math
+import pyarrow
 from .bq_utils import (
-    query_data,
+    query_to_arrow,
+    dry_run_query,
     list_datasets,
     list_dataset_tables,
     get_table_schema,
+    get_table_description,
 )
 from .schemas import (
     BigQueryTableSchema,
@@ -15,7 +20,39 @@ from .schemas import (
     BigQueryGetSchemaRequest,
     BigQueryExecuteQueryRequest,
     BigQueryExecuteQueryResponse,
+    BigQueryEncodedQueryResponse,
+    BigQueryResultPageRequest,
+    BigQueryResultPageResponse,
 )
+from .config import BQConfig
+from .sql_guard import prepare_read_query
+from .result_encoding import encode_table, truncation_note
+from .result_store import ResultStore
+from .result_summary import summarize_columns, stratified_sample
+from ..url_scraper import prefetch_urls_from_results
+
+bq_config = BQConfig()
+result_store = ResultStore(
+    max_entries=bq_config.RESULT_STORE_MAX_ENTRIES,
+    max_bytes=bq_config.RESULT_STORE_MAX_BYTES,
+    ttl_seconds=bq_config.RESULT_STORE_TTL_SECONDS,
+)
+
+# Column types left out when SELECT * is expanded, they are heavy and rarely needed to answer
+STAR_EXCLUDED_TYPES = {"RECORD", "STRUCT", "JSON", "BYTES", "GEOGRAPHY"}
+
+
+@lru_cache(maxsize=128)
+def _star_columns(project_id: str, dataset_name: str, table_name: str) -> list[str]:
+    """
+    Columns used to replace SELECT * over a table: every scalar, non repeated column.
+    """
+    schema_fields = get_table_schema(table_name, dataset_name, project_id)
+    return [
+        field.name
+        for field in schema_fields
+        if field.field_type not in STAR_EXCLUDED_TYPES and field.mode != "REPEATED"
+    ]
 
 
 def list_bq_datasets(
@@ -94,54 +131,225 @@ def get_bq_table_schema(
         dataset_name=request.dataset_name,
         project_id=request.project_id,
         fields=schema_fields_objects,
+        description=get_table_description(table_name, dataset_name, project_id),
     )
 
 
-def execute_bq_query(
+def _execute_query(
     request: BigQueryExecuteQueryRequest,
-) -> BigQueryExecuteQueryResponse:
+) -> tuple[BigQueryExecuteQueryResponse, pyarrow.Table | None]:
     """
-    Execute a read-only query in BigQuery and return the results as a list of dictionaries.
+    Run the parse stage, the dry run and the query itself.
 
     Args:
         request (BigQueryExecuteQueryRequest): The request object containing the query.
 
     Returns:
-        BigQueryExecuteQueryResponse: A list of dictionaries representing the rows returned by the query.
-    """
-    query = request.query
-    logger.info(f"Executing query: {query}")
-    forbidden_keywords = [
-        "INSERT",
-        "UPDATE",
-        "DELETE",
-        "DROP",
-        "ALTER",
-        "CREATE",
-        "MERGE",
-        "TRUNCATE",
-    ]
-    upper_query = query.upper()
-    for keyword in forbidden_keywords:
-        if re.search(rf"\b{keyword}\b", upper_query):
-            logger.warning(f"Query contains forbidden keyword: {keyword}")
-            raise ValueError(
-                f"Only read-only queries are allowed. Forbidden: {keyword}"
-            )
+        tuple[BigQueryExecuteQueryResponse, pyarrow.Table | None]: The full response and, if the query
+        was executed, its results as an Arrow table.
+    """
+    logger.info(f"Executing query: {request.query}")
+
+    # Parse stage: read-only check, no cartesian joins, SELECT * expansion and LIMIT injection
+    try:
+        query = prepare_read_query(
+            request.query,
+            max_rows=bq_config.MAX_RESULT_ROWS,
+            columns_lookup=_star_columns,
+            default_project=bq_config.PROJECT_ID,
+        )
+    except ValueError as e:
+        logger.warning(f"Query rejected by the SQL guard: {e}")
+        return BigQueryExecuteQueryResponse(
+            results=[],
+            query=request.query,
+            status=f"rejected: {e}",
+        ), None
+
+    if query != request.query:
+        logger.info(f"Query rewritten to: {query}")
 
+    # Dry run: estimate the scanned bytes before paying for them
     try:
-        row_iterator = query_data(query)
-        # Convert Row objects to dictionaries
-        results = [dict(row) for row in row_iterator]
-        logger.info(f"Query returned {len(results)} rows")
+        estimated_bytes = dry_run_query(query)
+    except ValueError as e:
+        logger.error(f"Dry run failed: {e}")
+        return BigQueryExecuteQueryResponse(
+            results=[],
+            query=query,
+            status=f"error: {e}",
+        ), None
 
+    logger.info(f"Dry run estimate: {estimated_bytes} bytes processed")
+    if estimated_bytes > bq_config.DRY_RUN_MAX_BYTES:
+        logger.warning(
+            f"Query rejected: {estimated_bytes} bytes estimated, limit is {bq_config.DRY_RUN_MAX_BYTES}"
+        )
         return BigQueryExecuteQueryResponse(
-            results=results,
+            results=[],
             query=query,
+            status=(
+                f"rejected: the query would process {estimated_bytes} bytes and the limit is "
+                f"{bq_config.DRY_RUN_MAX_BYTES}. Select fewer columns or filter by date/section."
+            ),
+            estimated_bytes_processed=estimated_bytes,
+        ), None
+
+    try:
+        results_table = query_to_arrow(
+            query, maximum_bytes_billed=bq_config.MAX_BYTES_BILLED
         )
+        logger.info(f"Query returned {results_table.num_rows} rows")
+
+        # Rows come straight from BigQuery, model_construct skips re-validating (and copying) each dict.
+        # Only the first METADATA_MAX_ROWS are kept, the response is returned and persisted with the chat
+        return BigQueryExecuteQueryResponse.model_construct(
+            results=results_table.slice(0, bq_config.METADATA_MAX_ROWS).to_pylist(),
+            query=query,
+            status="success",
+            estimated_bytes_processed=estimated_bytes,
+            total_rows=results_table.num_rows,
+            result_handle=None,
+        ), results_table
     except Exception as e:
         logger.error(f"An error occurred while executing the query: {e}")
         return BigQueryExecuteQueryResponse(
             results=[],
             query=query,
+            status=f"error: {e}",
+            estimated_bytes_processed=estimated_bytes,
+        ), None
+
+
+def execute_bq_query(
+    ctx: RunContext,
+    request: BigQueryExecuteQueryRequest,
+) -> ToolReturn:
+    """
+    Execute a read-only query in BigQuery.
+    The query is parsed first: only single SELECT statements without cross joins are accepted,
+    SELECT * is expanded to the table columns and a LIMIT of MAX_RESULT_ROWS is enforced.
+    Then it is dry-run, queries estimated above DRY_RUN_MAX_BYTES are rejected and the
+    estimate is returned so the query can be narrowed.
+    URLs in the results (e.g. DOF links) are prefetched in the background for the scraper tools.
+
+    Args:
+        ctx (RunContext): The context of the agent run.
+        request (BigQueryExecuteQueryRequest): The request object containing the query.
+
+    Returns:
+        ToolReturn: The model receives a BigQueryEncodedQueryResponse (rows as tab separated values),
+        the BigQueryExecuteQueryResponse (at most METADATA_MAX_ROWS rows plus the result_handle of
+        summarized results) is kept in the metadata for the application.
+    """
+    response, results_table = _execute_query(request)
+
+    encoded_response = BigQueryEncodedQueryResponse(
+        query=response.query,
+        status=response.status,
+        estimated_bytes_processed=response.estimated_bytes_processed,
+    )
+    if results_table is None:
+        return ToolReturn(return_value=encoded_response, metadata=response)
+
+    # Scraping the links of the rows is almost always the next step, take it off the critical path
+    try:
+        prefetch_urls_from_results(ctx.run_id, results_table)
+    except Exception as e:
+        logger.warning(f"Could not prefetch the URLs of the results: {e}")
+
+    encoded_response.total_rows = results_table.num_rows
+    data, truncated_cells = None, 0
+    if results_table.num_rows <= bq_config.SUMMARY_ROW_THRESHOLD:
+        data, truncated_cells = encode_table(results_table, bq_config.MAX_CELL_CHARS)
+
+    if data is not None and len(data.encode()) <= bq_config.SUMMARY_BYTE_THRESHOLD:
+        encoded_response.data = data
+        encoded_response.note = truncation_note(truncated_cells, bq_config.MAX_CELL_CHARS)
+    else:
+        _summarize(encoded_response, results_table)
+        response.result_handle = encoded_response.result_handle
+
+    return ToolReturn(return_value=encoded_response, metadata=response)
+
+
+def _summarize(
+    encoded_response: BigQueryEncodedQueryResponse, results_table: pyarrow.Table
+) -> None:
+    """
+    Fill the response of an oversized result with column statistics, a stratified sample and a
+    handle to page through the full result, so that its size does not depend on the number of rows.
+    """
+    logger.info(f"Summarizing result of {results_table.num_rows} rows")
+
+    encoded_response.column_summaries = summarize_columns(
+        results_table, bq_config.SUMMARY_TOP_K, bq_config.MAX_CELL_CHARS
+    )
+    sample = stratified_sample(results_table, bq_config.SUMMARY_SAMPLE_ROWS)
+    data, truncated_cells = encode_table(sample, bq_config.MAX_CELL_CHARS)
+    encoded_response.data = data
+
+    notes = [
+        f"The result has {results_table.num_rows} rows, too many to return. `column_summaries` describes "
+        f"every column and `data` holds a sample of {sample.num_rows} rows. Prefer an aggregated query (GROUP BY, COUNT) "
+        "to answer quantitative questions."
+    ]
+    handle = result_store.put(results_table)
+    if handle is not None:
+        encoded_response.result_handle = handle
+        encoded_response.total_pages = math.ceil(
+            results_table.num_rows / bq_config.RESULT_PAGE_ROWS
+        )
+        notes.append(
+            f"Use get_bq_result_page with result_handle '{handle}' to read the full result "
+            f"({encoded_response.total_pages} pages)."
         )
+    truncated = truncation_note(truncated_cells, bq_config.MAX_CELL_CHARS)
+    if truncated:
+        notes.append(truncated)
+    encoded_response.note = " ".join(notes)
+
+
+def get_bq_result_page(
+    request: BigQueryResultPageRequest,
+) -> BigQueryResultPageResponse:
+    """
+    Get one page of a query result that execute_bq_query summarized because it was too large.
+
+    Args:
+        request (BigQueryResultPageRequest): The request object containing the result_handle and the page number.
+
+    Returns:
+        BigQueryResultPageResponse: The rows of the page as tab separated values.
+    """
+    logger.info(f"Getting page {request.page} of result {request.result_handle}")
+    results_table = result_store.get(request.result_handle)
+    if results_table is None:
+        return BigQueryResultPageResponse(
+            result_handle=request.result_handle,
+            page=request.page,
+            status="error: unknown or expired result_handle, execute the query again.",
+        )
+
+    page_rows = bq_config.RESULT_PAGE_ROWS
+    total_pages = math.ceil(results_table.num_rows / page_rows)
+    if request.page > total_pages:
+        return BigQueryResultPageResponse(
+            result_handle=request.result_handle,
+            page=request.page,
+            status=f"error: page out of range, the result has {total_pages} pages.",
+            total_pages=total_pages,
+            total_rows=results_table.num_rows,
+        )
+
+    page_table = results_table.slice((request.page - 1) * page_rows, page_rows)
+    data, truncated_cells = encode_table(page_table, bq_config.MAX_CELL_CHARS)
+
+    return BigQueryResultPageResponse(
+        result_handle=request.result_handle,
+        page=request.page,
+        total_pages=total_pages,
+        total_rows=results_table.num_rows,
+        data=data,
+        note=truncation_note(truncated_cells, bq_config.MAX_CELL_CHARS),
+    )
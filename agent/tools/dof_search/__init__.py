@@ -0,0 +1,9 @@
+from .tool_functions import search_dof
+from .schemas import DofSearchInput, DofSearchOutput, DofSearchHit
+
+__all__ = [
+    "search_dof",
+    "DofSearchInput",
+    "DofSearchOutput",
+    "DofSearchHit",
+]
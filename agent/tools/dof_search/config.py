@@ -0,0 +1,109 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+from typing import Annotated
+
+
+class DofSearchConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        validate_assignment=True,
+    )
+    """
+    Class that holds configuration values for the DOF full-text search tool.
+    """
+
+    SEARCH_ENABLED: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Build the index at startup and expose the search. Disabled, the tool answers with an error.",
+        ),
+    ]
+    DOF_TABLE: Annotated[
+        str,
+        Field(
+            default="lawyer_agent.dof",
+            description="Table with the DOF index loaded by the DOF pipeline ([project.]dataset.table).",
+        ),
+    ]
+    DOF_BODIES_TABLE: Annotated[
+        str,
+        Field(
+            default="lawyer_agent.dof_bodies",
+            description="Table with the DOF note bodies ([project.]dataset.table). Empty indexes the titles only.",
+        ),
+    ]
+    DOF_EXPORT_PATH: Annotated[
+        str,
+        Field(
+            default="",
+            description="Parquet file or directory exported from BigQuery (same columns as the query of the loader). When set, the index is built from it instead of querying BigQuery.",
+        ),
+    ]
+    INDEX_WINDOW_DAYS: Annotated[
+        int,
+        Field(
+            default=5 * 365,
+            description="Only the notes published in the last days are indexed, older ones are queried in BigQuery. 0 indexes the whole history (several GB, see the README).",
+            ge=0,
+        ),
+    ]
+    INDEX_BODY_CHARS: Annotated[
+        int,
+        Field(
+            default=1_500,
+            description="Characters of every note body that are indexed (the beginning of a note states its subject). 0 indexes the titles only.",
+            ge=0,
+        ),
+    ]
+    INDEX_REFRESH_SECONDS: Annotated[
+        int,
+        Field(
+            default=6 * 3_600,
+            description="Seconds between rebuilds of the index, so it picks up the notes loaded by the pipeline. 0 builds it only at startup.",
+            ge=0,
+        ),
+    ]
+    INDEX_WAIT_SECONDS: Annotated[
+        float,
+        Field(
+            default=30,
+            description="How long a search waits for the first build of the index before answering with an error.",
+            ge=0,
+        ),
+    ]
+    TITLE_WEIGHT: Annotated[
+        float,
+        Field(
+            default=3.0,
+            description="Weight of a title term relative to a body term.",
+            gt=0,
+        ),
+    ]
+    BM25_K1: Annotated[
+        float,
+        Field(
+            default=1.2,
+            description="BM25 term frequency saturation.",
+            gt=0,
+        ),
+    ]
+    BM25_B: Annotated[
+        float,
+        Field(
+            default=0.75,
+            description="BM25 length normalization, 0 disables it.",
+            ge=0,
+            le=1,
+        ),
+    ]
+    MAX_SEARCH_RESULTS: Annotated[
+        int,
+        Field(
+            default=50,
+            description="Maximum number of notes a search can return.",
+            gt=0,
+        ),
+    ]
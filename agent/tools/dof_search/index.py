@@ -0,0 +1,204 @@
+from array import array
+from collections import Counter
+import datetime
+import math
+import time
+import numpy as np
+import pyarrow
+from loguru import logger
+from .text import analyze, fold
+
+EPOCH = datetime.date(1970, 1, 1)
+
+
+def _days(value: datetime.date) -> int:
+    return (value - EPOCH).days
+
+
+class Bm25Index:
+    """
+    In-memory inverted index over DOF notes ranked with BM25.
+
+    Postings are stored in CSR form (one NumPy slice of document ids and weighted term frequencies
+    per term), so a query adds one vectorized contribution per term to a dense score array and
+    date, section, authority and document type filters are boolean masks over it.
+
+    Title terms count TITLE_WEIGHT times a body term (a simple BM25F), since the title of a DOF note
+    summarizes it.
+    """
+
+    def __init__(self, notes: pyarrow.Table, title_weight: float = 3.0, k1: float = 1.2, b: float = 0.75):
+        """
+        Build the index.
+
+        Args:
+            notes (pyarrow.Table): published_date, section, authority, document_type, title, link and,
+                optionally, body.
+            title_weight (float): Weight of a title term relative to a body term.
+            k1 (float): BM25 term frequency saturation.
+            b (float): BM25 length normalization.
+        """
+        started_at = time.perf_counter()
+        self.k1 = k1
+        self.b = b
+
+        columns = set(notes.column_names)
+        self.titles = notes.column("title").to_pylist()
+        self.links = notes.column("link").to_pylist()
+        self.sections = notes.column("section").to_pylist()
+        self.authorities = notes.column("authority").to_pylist() if "authority" in columns else [None] * len(self.titles)
+        self.document_types = (
+            notes.column("document_type").to_pylist() if "document_type" in columns else [None] * len(self.titles)
+        )
+        self.dates = notes.column("published_date").to_pylist()
+        self.date_days = np.array([_days(value) for value in self.dates], dtype=np.int32)
+        # Indexed range, reported with every search
+        self.first_date = min(self.dates) if self.dates else None
+        self.last_date = max(self.dates) if self.dates else None
+        bodies = notes.column("body").to_pylist() if "body" in columns else [None] * len(self.titles)
+
+        # Categorical columns as integer codes, filters compare codes instead of strings
+        self._section_codes, self._section_values = self._encode(self.sections)
+        self._authority_codes, self._authority_values = self._encode(self.authorities)
+        self._document_type_codes, self._document_type_values = self._encode(self.document_types)
+
+        vocabulary: dict[str, int] = {}
+        term_ids, doc_ids, weights = array("i"), array("i"), array("f")
+        lengths = np.zeros(len(self.titles), dtype=np.float32)
+        for doc_id, (title, body) in enumerate(zip(self.titles, bodies)):
+            frequencies = Counter()
+            for term in analyze(title or ""):
+                frequencies[term] += title_weight
+            for term in analyze(body or ""):
+                frequencies[term] += 1.0
+            lengths[doc_id] = sum(frequencies.values())
+            for term, frequency in frequencies.items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                doc_ids.append(doc_id)
+                weights.append(frequency)
+
+        # Sort the postings by term (stable, so documents stay in order) and keep the offsets
+        term_ids_array = np.frombuffer(term_ids, dtype=np.int32)
+        order = np.argsort(term_ids_array, kind="stable")
+        self._doc_ids = np.frombuffer(doc_ids, dtype=np.int32)[order]
+        self._weights = np.frombuffer(weights, dtype=np.float32)[order]
+        self._offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids_array, minlength=len(vocabulary)), out=self._offsets[1:])
+        self.vocabulary = vocabulary
+
+        self.size = len(self.titles)
+        self._length_norm = (
+            1 - b + b * lengths / max(float(lengths.mean()) if self.size else 1.0, 1e-9)
+        ).astype(np.float32)
+        logger.info(
+            f"BM25 index built: {self.size} notes, {len(vocabulary)} terms, {len(self._doc_ids)} postings "
+            f"in {time.perf_counter() - started_at:.1f}s"
+        )
+
+    @staticmethod
+    def _encode(values: list[str | None]) -> tuple[np.ndarray, list[str | None]]:
+        distinct = list(dict.fromkeys(values))
+        code_of = {value: code for code, value in enumerate(distinct)}
+        return np.array([code_of[value] for value in values], dtype=np.int32), distinct
+
+    @staticmethod
+    def _codes_matching(values: list[str | None], wanted: str, substring: bool) -> list[int]:
+        wanted = fold(wanted).strip()
+        return [
+            code
+            for code, value in enumerate(values)
+            if value is not None and (wanted in fold(value) if substring else fold(value) == wanted)
+        ]
+
+    def _filter_mask(
+        self,
+        start_date: datetime.date | None,
+        end_date: datetime.date | None,
+        section: str | None,
+        authority: str | None,
+        document_type: str | None,
+    ) -> np.ndarray | None:
+        mask = None
+
+        def restrict(condition: np.ndarray) -> None:
+            nonlocal mask
+            mask = condition if mask is None else mask & condition
+
+        if start_date:
+            restrict(self.date_days >= _days(start_date))
+        if end_date:
+            restrict(self.date_days <= _days(end_date))
+        if section:
+            restrict(np.isin(self._section_codes, self._codes_matching(self._section_values, section, substring=True)))
+        if authority:
+            restrict(np.isin(self._authority_codes, self._codes_matching(self._authority_values, authority, substring=False)))
+        if document_type:
+            restrict(
+                np.isin(
+                    self._document_type_codes,
+                    self._codes_matching(self._document_type_values, document_type, substring=False),
+                )
+            )
+        return mask
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        start_date: datetime.date | None = None,
+        end_date: datetime.date | None = None,
+        section: str | None = None,
+        authority: str | None = None,
+        document_type: str | None = None,
+    ) -> list[dict]:
+        """
+        Notes that best match a query. Every query term contributes (OR semantics), so synonyms can
+        be searched together in a single query.
+
+        Args:
+            query (str): Words to search, in Spanish, with or without accents.
+            limit (int): Maximum number of notes returned.
+            start_date (datetime.date | None): First publication date.
+            end_date (datetime.date | None): Last publication date.
+            section (str | None): Part of the section name (accents and case are ignored).
+            authority (str | None): Authority acronym, e.g. SHCP.
+            document_type (str | None): Document type, e.g. decreto.
+
+        Returns:
+            list[dict]: The notes (published_date, section, authority, document_type, title, link,
+            score), best first.
+        """
+        term_ids = [self.vocabulary[term] for term in dict.fromkeys(analyze(query)) if term in self.vocabulary]
+        if not term_ids or not self.size:
+            return []
+
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term_id in term_ids:
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            doc_ids = self._doc_ids[start:end]
+            frequencies = self._weights[start:end]
+            document_frequency = end - start
+            idf = math.log(1 + (self.size - document_frequency + 0.5) / (document_frequency + 0.5))
+            scores[doc_ids] += idf * frequencies * (self.k1 + 1) / (frequencies + self.k1 * self._length_norm[doc_ids])
+
+        mask = self._filter_mask(start_date, end_date, section, authority, document_type)
+        if mask is not None:
+            scores[~mask] = 0
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(scores[candidates], -limit)[-limit:]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [
+            {
+                "published_date": self.dates[doc_id],
+                "section": self.sections[doc_id],
+                "authority": self.authorities[doc_id],
+                "document_type": self.document_types[doc_id],
+                "title": self.titles[doc_id],
+                "link": self.links[doc_id],
+                "score": round(float(scores[doc_id]), 3),
+            }
+            for doc_id in candidates
+        ]
@@ -0,0 +1,135 @@
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable, Generic, TypeVar
+import datetime
+import time
+import pyarrow
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from google.cloud import bigquery
+from loguru import logger
+
+IndexT = TypeVar("IndexT")
+
+NOTE_COLUMNS = ["published_date", "section", "authority", "document_type", "title", "link", "body"]
+
+
+def load_notes(
+    dof_table: str,
+    bodies_table: str = "",
+    body_chars: int = 0,
+    export_path: str = "",
+    start_date: datetime.date | None = None,
+    end_date: datetime.date | None = None,
+) -> pyarrow.Table:
+    """
+    DOF notes to index: one row per note with the beginning of its body, read from a Parquet export
+    if given, otherwise from BigQuery.
+
+    Args:
+        dof_table (str): Table with the DOF index ([project.]dataset.table).
+        bodies_table (str): Table with the note bodies, empty to index the titles only.
+        body_chars (int): Characters of every body to keep, 0 to index the titles only.
+        export_path (str): Parquet file or directory exported from BigQuery.
+        start_date (datetime.date | None): First publication date, all the notes if None.
+        end_date (datetime.date | None): Last publication date, all the notes if None.
+
+    Returns:
+        pyarrow.Table: published_date, section, authority, document_type, title, link and body.
+    """
+    if export_path:
+        notes = pq.read_table(Path(export_path))
+        notes = notes.select([name for name in NOTE_COLUMNS if name in notes.column_names])
+        if start_date:
+            notes = notes.filter(pc.field("published_date") >= start_date)
+        if end_date:
+            notes = notes.filter(pc.field("published_date") <= end_date)
+        logger.info(f"Read {notes.num_rows} DOF notes from the export {export_path}")
+        return notes
+
+    body_select, body_join = "CAST(NULL AS STRING) AS body", ""
+    if bodies_table and body_chars:
+        body_select = f"SUBSTR(bodies.body_markdown, 1, {int(body_chars)}) AS body"
+        body_join = f"""
+            LEFT JOIN (
+                SELECT link, ANY_VALUE(body_markdown) AS body_markdown
+                FROM `{bodies_table}`
+                -- Bodies share the date of their note, only the partitions of the range are read
+                WHERE published_date BETWEEN IFNULL(@start_date, DATE '1900-01-01') AND IFNULL(@end_date, DATE '9999-12-31')
+                GROUP BY link
+            ) AS bodies USING (link)
+        """
+    query = f"""
+        SELECT
+            notes.published_date, notes.section, notes.authority, notes.document_type, notes.title,
+            notes.link, {body_select}
+        FROM (
+            SELECT * FROM `{dof_table}`
+            WHERE title IS NOT NULL
+                AND published_date BETWEEN IFNULL(@start_date, DATE '1900-01-01') AND IFNULL(@end_date, DATE '9999-12-31')
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY published_date, link) = 1
+        ) AS notes
+        {body_join}
+        ORDER BY notes.published_date, notes.link
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+        ]
+    )
+    notes = bigquery.Client().query(query, job_config=job_config).to_arrow()
+    logger.info(f"Read {notes.num_rows} DOF notes from BigQuery")
+    return notes
+
+
+class RefreshingIndex(Generic[IndexT]):
+    """
+    Holds an index built in a background thread at startup and rebuilt every `refresh_seconds`.
+    Searches keep using the previous index while a new one is built, then it is swapped.
+    """
+
+    def __init__(self, name: str, build: Callable[[], IndexT], refresh_seconds: int):
+        self.name = name
+        self._build = build
+        self.refresh_seconds = refresh_seconds
+        self._index: IndexT | None = None
+        self._ready = Event()
+        self._lock = Lock()
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        """
+        Start the background builds (once).
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name=f"{self.name}-index", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._index = self._build()
+            except Exception as e:
+                logger.error(f"Could not build the {self.name} index: {e}")
+            finally:
+                # Waiting searches are released even if the build failed
+                self._ready.set()
+            if not self.refresh_seconds:
+                return
+            time.sleep(self.refresh_seconds)
+
+    def get(self, timeout: float) -> IndexT | None:
+        """
+        The current index, waiting (at most `timeout` seconds) for the first build.
+
+        Args:
+            timeout (float): Seconds to wait for the first build.
+
+        Returns:
+            IndexT | None: The index, None if it is not built yet or the build failed.
+        """
+        self.start()
+        self._ready.wait(timeout)
+        return self._index
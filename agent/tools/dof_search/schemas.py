@@ -0,0 +1,90 @@
+from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+import datetime
+
+
+class DofSearchInput(BaseModel):
+    query: Annotated[
+        str,
+        Field(
+            description="Words to search in the titles and bodies of DOF notes, in Spanish. Accents, case and word endings are ignored (reforma/reformas/reformar match). Put synonyms together in one query, any of them matches: 'robo hurto despojo'.",
+            min_length=1,
+            examples=["reforma ley federal del trabajo", "robo hurto despojo vehiculo"],
+        ),
+    ]
+    start_date: Annotated[
+        Optional[datetime.date],
+        Field(
+            default=None,
+            description="First publication date (YYYY-MM-DD).",
+        ),
+    ]
+    end_date: Annotated[
+        Optional[datetime.date],
+        Field(
+            default=None,
+            description="Last publication date (YYYY-MM-DD).",
+        ),
+    ]
+    section: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Part of the section name the notes are listed under, e.g. 'Hacienda'.",
+        ),
+    ]
+    authority: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Acronym of the issuing authority, e.g. SHCP, SEGOB, BANXICO.",
+        ),
+    ]
+    document_type: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Type of document, e.g. decreto, acuerdo, nom, aviso, convocatoria.",
+        ),
+    ]
+    limit: Annotated[
+        int,
+        Field(
+            default=10,
+            description="Maximum number of notes returned, best first.",
+            ge=1,
+        ),
+    ]
+
+
+class DofSearchHit(BaseModel):
+    published_date: Annotated[datetime.date, Field(description="Publication date of the note.")]
+    section: Annotated[Optional[str], Field(description="Section the note is listed under.")]
+    authority: Annotated[Optional[str], Field(description="Acronym of the issuing authority.")]
+    document_type: Annotated[Optional[str], Field(description="Type of document.")]
+    title: Annotated[str, Field(description="Title of the note.")]
+    link: Annotated[str, Field(description="URL of the note, scrape it to read the note.")]
+    score: Annotated[float, Field(description="BM25 relevance, higher is better.")]
+
+
+class DofSearchOutput(BaseModel):
+    results: Annotated[
+        list[DofSearchHit],
+        Field(description="Matching notes, best first."),
+    ]
+    status: Annotated[
+        str,
+        Field(description="Processing status, e.g., 'success' or an error message."),
+    ]
+    indexed_notes: Annotated[
+        int,
+        Field(default=0, description="Number of notes in the index."),
+    ]
+    indexed_since: Annotated[
+        Optional[datetime.date],
+        Field(default=None, description="First publication date in the index, older notes are only in BigQuery."),
+    ]
+    indexed_until: Annotated[
+        Optional[datetime.date],
+        Field(default=None, description="Last publication date in the index, newer notes are only in BigQuery."),
+    ]
@@ -0,0 +1,71 @@
+from functools import lru_cache
+import re
+import unicodedata
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Function words that carry no meaning for the search (already without accents)
+STOPWORDS = frozenset(
+    """
+    a al algo ante antes como con contra cual cuales cuando de del desde donde durante e el ella
+    ellas ellos en entre era es esa esas ese eso esos esta estas este esto estos fue ha hasta la
+    las le les lo los mas me mi mediante muy ni no nos o otra otras otro otros para pero por que
+    quien se segun ser si sin sobre son su sus tambien te tiene toda todas todo todos tras un una
+    unas uno unos y ya
+    """.split()
+)
+
+# Derivational and verbal suffixes of the light stemmer, longest first
+SUFFIXES = sorted(
+    """
+    amientos imientos amiento imiento aciones uciones adoras adores ancias encias idades ativas
+    ativos acion ucion adora ador ancia encia idad ativa ativo mente ables ibles able ible istas
+    ista ismos ismo ando iendo ados adas idos idas ado ada ido ida ar er ir
+    """.split(),
+    key=len,
+    reverse=True,
+)
+MIN_STEM_LENGTH = 3
+
+
+def fold(text: str) -> str:
+    """
+    Lower case text without accents or diacritics ('Resolución' -> 'resolucion', 'Año' -> 'ano').
+    """
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+@lru_cache(maxsize=200_000)
+def stem(token: str) -> str:
+    """
+    Light Spanish stemmer: strips one derivational or verbal suffix, then the plural and the final
+    vowel, so 'reforma', 'reformas', 'reformar' and 'reformado' share the stem 'reform'. Tokens must
+    already be folded.
+    """
+    if len(token) <= MIN_STEM_LENGTH or token.isdigit():
+        return token
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+            token = token[: -len(suffix)]
+            break
+    if token.endswith("es") and len(token) - 2 >= MIN_STEM_LENGTH:
+        token = token[:-2]
+    elif token.endswith("s") and len(token) - 1 >= MIN_STEM_LENGTH:
+        token = token[:-1]
+    if token[-1] in "aeo" and len(token) - 1 >= MIN_STEM_LENGTH:
+        token = token[:-1]
+    return token
+
+
+def analyze(text: str) -> list[str]:
+    """
+    Terms of a text as indexed and searched: folded, split into words, without stopwords and stemmed.
+
+    Args:
+        text (str): Title, body or query.
+
+    Returns:
+        list[str]: The terms, in order (with repetitions).
+    """
+    return [stem(token) for token in _TOKEN.findall(fold(text)) if token not in STOPWORDS]
@@ -0,0 +1,82 @@
+from loguru import logger
+import asyncio
+import datetime
+from .config import DofSearchConfig
+from .index import Bm25Index
+from .loader import RefreshingIndex, load_notes
+from .schemas import DofSearchInput, DofSearchOutput, DofSearchHit
+
+dof_search_config = DofSearchConfig()
+
+
+def build_dof_index() -> Bm25Index:
+    start_date = None
+    if dof_search_config.INDEX_WINDOW_DAYS:
+        start_date = datetime.date.today() - datetime.timedelta(days=dof_search_config.INDEX_WINDOW_DAYS)
+    notes = load_notes(
+        dof_table=dof_search_config.DOF_TABLE,
+        bodies_table=dof_search_config.DOF_BODIES_TABLE,
+        body_chars=dof_search_config.INDEX_BODY_CHARS,
+        export_path=dof_search_config.DOF_EXPORT_PATH,
+        start_date=start_date,
+    )
+    return Bm25Index(
+        notes,
+        title_weight=dof_search_config.TITLE_WEIGHT,
+        k1=dof_search_config.BM25_K1,
+        b=dof_search_config.BM25_B,
+    )
+
+
+dof_index = RefreshingIndex(
+    name="dof-bm25",
+    build=build_dof_index,
+    refresh_seconds=dof_search_config.INDEX_REFRESH_SECONDS,
+)
+if dof_search_config.SEARCH_ENABLED:
+    # Built at startup in the background, the agent is usable meanwhile
+    dof_index.start()
+
+
+async def search_dof(input_data: DofSearchInput) -> DofSearchOutput:
+    """
+    Full-text search over the titles and bodies of DOF notes, ranked by relevance (BM25), from
+    an in-memory index and without running SQL (while the index is first built it waits up to
+    INDEX_WAIT_SECONDS, then asks to query BigQuery instead). Accents, case and word endings are ignored, and every
+    word of the query matches on its own, so synonyms go together in a single query
+    (e.g. 'robo hurto despojo'). Results can be filtered by publication dates, section, authority
+    and document type. Use it to find the relevant notes first, then scrape their links to read them.
+
+    Args:
+        input_data (DofSearchInput): The query and the filters.
+
+    Returns:
+        DofSearchOutput: The matching notes (date, section, title, link), best first.
+    """
+    if not dof_search_config.SEARCH_ENABLED:
+        return DofSearchOutput(results=[], status="error: The DOF search is disabled, query the dof table in BigQuery.")
+
+    index = await asyncio.to_thread(dof_index.get, dof_search_config.INDEX_WAIT_SECONDS)
+    if index is None:
+        return DofSearchOutput(
+            results=[], status="error: The DOF search index is not available yet, query the dof table in BigQuery."
+        )
+
+    limit = min(input_data.limit, dof_search_config.MAX_SEARCH_RESULTS)
+    hits = index.search(
+        input_data.query,
+        limit=limit,
+        start_date=input_data.start_date,
+        end_date=input_data.end_date,
+        section=input_data.section,
+        authority=input_data.authority,
+        document_type=input_data.document_type,
+    )
+    logger.info(f"DOF search '{input_data.query}': {len(hits)} notes")
+    return DofSearchOutput(
+        results=[DofSearchHit(**hit) for hit in hits],
+        status="success" if hits else "success: no notes match, try synonyms or fewer filters.",
+        indexed_notes=index.size,
+        indexed_since=index.first_date,
+        indexed_until=index.last_date,
+    )
@@ -0,0 +1,8 @@
+from .tool_functions import get_article
+from .schemas import GetArticleInput, GetArticleOutput
+
+__all__ = [
+    "get_article",
+    "GetArticleInput",
+    "GetArticleOutput",
+]
@@ -0,0 +1,195 @@
+from collections import OrderedDict
+from difflib import SequenceMatcher, get_close_matches
+from threading import Lock
+import re
+import time
+import unicodedata
+from google.cloud import bigquery
+from loguru import logger
+
+# "Artículo 4o.", "3 Bis", "17-A", "41 ter 1". The ordinal "o" must not be the start of a word, as
+# in "10 Octies"
+_ARTICLE = re.compile(
+    r"(\d+)\s*(?:o(?![a-z])|º|°)?\.?\s*(?:-\s*([a-z])\b)?\s*(bis|ter|qu[aá]ter|quinquies|sexies|septies|octies)?\.?\s*(\d+)?",
+    re.IGNORECASE,
+)
+# Words skipped by the acronyms (Ley Federal del Trabajo -> LFT)
+_CONNECTORS = {"DE", "DEL", "LA", "LAS", "LOS", "EL", "Y", "E", "PARA", "EN", "A", "AL", "SOBRE", "CONTRA"}
+# Connectors some official acronyms keep (Ley del Impuesto sobre la Renta -> LISR, Ley Federal
+# contra la Delincuencia Organizada -> LFCDO) and others skip (Ley sobre el Contrato de Seguro -> LCS)
+_KEPT_CONNECTORS = {"SOBRE", "CONTRA"}
+
+
+def normalize(text: str) -> str:
+    """
+    Upper case text without accents and with single spaces, as the law_key of the table.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return " ".join("".join(char for char in decomposed if not unicodedata.combining(char)).upper().split())
+
+
+def normalize_article(article: str) -> str | None:
+    """
+    Article number as stored by the pipeline ('27', '4 BIS', '17-A', '41 TER 1'), None if the text
+    has no number.
+    """
+    match = _ARTICLE.search(article)
+    if match is None:
+        return None
+    number, letter, suffix, ordinal = match.groups()
+    normalized = str(int(number))
+    if letter:
+        normalized += f"-{letter.upper()}"
+    if suffix:
+        normalized += f" {normalize(suffix)}"
+    if ordinal:
+        normalized += f" {int(ordinal)}"
+    return normalized
+
+
+def acronyms(law_key: str) -> set[str]:
+    """
+    Acronyms of a law, with and without the connectors some official acronyms keep.
+    """
+    words = law_key.split()
+    return {
+        "".join(word[0] for word in words if word not in _CONNECTORS),
+        "".join(word[0] for word in words if word not in _CONNECTORS - _KEPT_CONNECTORS),
+    }
+
+
+class LawArticleStore:
+    """
+    Lookups of single articles in the articles table written by the federal laws pipeline
+    (`pipelines/federal_laws/articles.py`). The table is clustered by law_key and article, so a
+    lookup reads a few blocks only, but it is still a BigQuery job (around a second). Law names
+    given by the model are resolved against the list of laws (exact name, acronym, unique set of
+    words or close spelling), kept in memory, and the articles found are kept in an LRU cache of
+    `cache_size` entries; both are dropped every `refresh_seconds` to pick up new law versions.
+    """
+
+    def __init__(
+        self, table_id: str, refresh_seconds: int, match_cutoff: float, max_suggestions: int, cache_size: int
+    ):
+        self.table_id = table_id
+        self.refresh_seconds = refresh_seconds
+        self.match_cutoff = match_cutoff
+        self.max_suggestions = max_suggestions
+        self.cache_size = cache_size
+        self._client: bigquery.Client | None = None
+        self._lock = Lock()
+        self._laws: dict[str, str] = {}
+        self._articles: OrderedDict[tuple[str, str], dict] = OrderedDict()
+        self._loaded_at = 0.0
+
+    def _query(self, query: str, parameters: list) -> list:
+        if self._client is None:
+            self._client = bigquery.Client()
+        job_config = bigquery.QueryJobConfig(query_parameters=parameters)
+        return list(self._client.query(query, job_config=job_config).result())
+
+    def laws(self) -> dict[str, str]:
+        """
+        Names of the stored laws by law_key, read again every `refresh_seconds`.
+        """
+        with self._lock:
+            if not self._laws or time.monotonic() - self._loaded_at > self.refresh_seconds:
+                rows = self._query(f"SELECT DISTINCT law_key, law FROM `{self.table_id}`", [])
+                self._laws = {row["law_key"]: row["law"] for row in rows}
+                self._articles.clear()
+                self._loaded_at = time.monotonic()
+                logger.info(f"Loaded {len(self._laws)} federal law names")
+            return self._laws
+
+    def resolve_law(self, law: str) -> tuple[str | None, list[str]]:
+        """
+        law_key of a law name given by the model.
+
+        Args:
+            law (str): Name, partial name, acronym or misspelled name of the law.
+
+        Returns:
+            tuple[str | None, list[str]]: The law_key (None if it is ambiguous or unknown) and the
+            closest law names otherwise.
+        """
+        laws = self.laws()
+        key = normalize(law)
+        if key in laws:
+            return key, []
+
+        by_acronym = [law_key for law_key in laws if key.replace(".", "") in acronyms(law_key)]
+        if len(by_acronym) == 1:
+            return by_acronym[0], []
+
+        words = set(key.split()) - _CONNECTORS
+        containing = [law_key for law_key in laws if words and words <= set(law_key.split())]
+        if len(containing) == 1:
+            return containing[0], []
+
+        close = get_close_matches(key, list(laws), n=self.max_suggestions, cutoff=0.5)
+        if close and SequenceMatcher(None, key, close[0]).ratio() >= self.match_cutoff:
+            return close[0], []
+
+        candidates = list(dict.fromkeys(by_acronym + containing + close))[: self.max_suggestions]
+        return None, [laws[law_key] for law_key in candidates]
+
+    def get_article(self, law_key: str, article: str) -> dict | None:
+        """
+        An article of a law, from the cache or from the table.
+
+        Args:
+            law_key (str): Resolved law.
+            article (str): Normalized article number.
+
+        Returns:
+            dict | None: The row of the article, None if the law does not have it.
+        """
+        with self._lock:
+            cached = self._articles.get((law_key, article))
+            if cached is not None:
+                self._articles.move_to_end((law_key, article))
+                return cached
+
+        rows = self._query(
+            f"""
+            SELECT law, article, title, chapter, text, page_start, page_end, source_url,
+                CAST(last_update_date AS STRING) AS last_update_date
+            FROM `{self.table_id}`
+            WHERE law_key = @law_key AND article = @article
+            LIMIT 1
+            """,
+            [
+                bigquery.ScalarQueryParameter("law_key", "STRING", law_key),
+                bigquery.ScalarQueryParameter("article", "STRING", article),
+            ],
+        )
+        if not rows:
+            return None
+
+        row = dict(rows[0].items())
+        with self._lock:
+            self._articles[(law_key, article)] = row
+            while len(self._articles) > self.cache_size:
+                self._articles.popitem(last=False)
+        return row
+
+    def nearby_articles(self, law_key: str, article: str) -> list[str]:
+        """
+        Articles of a law with the closest numbers, for a lookup of an article it does not have.
+        """
+        number = int(article.split()[0].split("-")[0])
+        rows = self._query(
+            f"""
+            SELECT article
+            FROM `{self.table_id}`
+            WHERE law_key = @law_key
+            ORDER BY ABS(SAFE_CAST(REGEXP_EXTRACT(article, r'^\\d+') AS INT64) - @number), article_order
+            LIMIT @limit
+            """,
+            [
+                bigquery.ScalarQueryParameter("law_key", "STRING", law_key),
+                bigquery.ScalarQueryParameter("number", "INT64", number),
+                bigquery.ScalarQueryParameter("limit", "INT64", self.max_suggestions),
+            ],
+        )
+        return [row["article"] for row in rows]
@@ -0,0 +1,56 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+from typing import Annotated
+
+
+class FederalLawsConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        validate_assignment=True,
+    )
+    """
+    Class that holds configuration values for the federal law articles tool.
+    """
+
+    LAW_ARTICLES_TABLE: Annotated[
+        str,
+        Field(
+            default="lawyer_agent.federal_law_articles",
+            description="Table with the articles of the federal laws loaded by the federal laws pipeline ([project.]dataset.table).",
+        ),
+    ]
+    LAW_NAMES_REFRESH_SECONDS: Annotated[
+        int,
+        Field(
+            default=3_600,
+            description="Seconds the list of law names (used to resolve the law of a lookup) is kept before it is read again.",
+            ge=0,
+        ),
+    ]
+    ARTICLE_CACHE_SIZE: Annotated[
+        int,
+        Field(
+            default=512,
+            description="Articles kept in memory after a lookup, so repeated lookups do not query BigQuery. Dropped with the law names every LAW_NAMES_REFRESH_SECONDS.",
+            gt=0,
+        ),
+    ]
+    LAW_NAME_MATCH_CUTOFF: Annotated[
+        float,
+        Field(
+            default=0.85,
+            description="Minimum similarity (0 to 1) for a misspelled law name to be resolved to a law; below it the closest names are suggested.",
+            ge=0,
+            le=1,
+        ),
+    ]
+    MAX_SUGGESTIONS: Annotated[
+        int,
+        Field(
+            default=8,
+            description="Maximum number of law names or articles suggested when a lookup does not match.",
+            gt=0,
+        ),
+    ]
@@ -0,0 +1,41 @@
+from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+
+
+class GetArticleInput(BaseModel):
+    law: Annotated[
+        str,
+        Field(
+            description="Name of the federal law, with or without accents (e.g. 'Ley Federal del Trabajo'), or its acronym (e.g. LFT, CFF, CPEUM).",
+            min_length=2,
+            examples=["Ley Federal del Trabajo", "CPEUM", "Código Fiscal de la Federación"],
+        ),
+    ]
+    article: Annotated[
+        str,
+        Field(
+            description="Article number, e.g. '27', '4o', '3 Bis', '17-A'.",
+            min_length=1,
+            examples=["123", "3 Bis", "17-A"],
+        ),
+    ]
+
+
+class GetArticleOutput(BaseModel):
+    law: Annotated[Optional[str], Field(default=None, description="Name of the law the article belongs to.")]
+    article: Annotated[Optional[str], Field(default=None, description="Normalized article number.")]
+    title: Annotated[Optional[str], Field(default=None, description="Title (Título) of the law the article belongs to.")]
+    chapter: Annotated[Optional[str], Field(default=None, description="Chapter (Capítulo) the article belongs to.")]
+    text: Annotated[str, Field(default="", description="Current text of the article.")]
+    page_start: Annotated[Optional[int], Field(default=None, description="First page of the article in the law PDF.")]
+    page_end: Annotated[Optional[int], Field(default=None, description="Last page of the article in the law PDF.")]
+    source_url: Annotated[Optional[str], Field(default=None, description="URL of the law PDF.")]
+    last_update_date: Annotated[Optional[str], Field(default=None, description="Date of the last reform of the law (YYYY-MM-DD).")]
+    status: Annotated[
+        str,
+        Field(description="Processing status, e.g., 'success' or an error message."),
+    ]
+    suggestions: Annotated[
+        list[str],
+        Field(default_factory=list, description="When the law or the article is not found, the closest law names or articles."),
+    ]
@@ -0,0 +1,61 @@
+from loguru import logger
+import asyncio
+from .articles import LawArticleStore, normalize_article
+from .config import FederalLawsConfig
+from .schemas import GetArticleInput, GetArticleOutput
+
+federal_laws_config = FederalLawsConfig()
+article_store = LawArticleStore(
+    table_id=federal_laws_config.LAW_ARTICLES_TABLE,
+    refresh_seconds=federal_laws_config.LAW_NAMES_REFRESH_SECONDS,
+    match_cutoff=federal_laws_config.LAW_NAME_MATCH_CUTOFF,
+    max_suggestions=federal_laws_config.MAX_SUGGESTIONS,
+    cache_size=federal_laws_config.ARTICLE_CACHE_SIZE,
+)
+
+
+def _get_article(input_data: GetArticleInput) -> GetArticleOutput:
+    article = normalize_article(input_data.article)
+    if article is None:
+        return GetArticleOutput(status=f"error: '{input_data.article}' is not an article number, e.g. '27' or '3 Bis'.")
+
+    law_key, suggestions = article_store.resolve_law(input_data.law)
+    if law_key is None:
+        return GetArticleOutput(
+            status=f"error: Law '{input_data.law}' not found, use one of the suggested names.",
+            suggestions=suggestions,
+        )
+
+    row = article_store.get_article(law_key, article)
+    if row is None:
+        return GetArticleOutput(
+            law=article_store.laws()[law_key],
+            status=f"error: Article {article} not found in this law, see the closest articles.",
+            suggestions=article_store.nearby_articles(law_key, article),
+        )
+    return GetArticleOutput(**row, status="success")
+
+
+async def get_article(input_data: GetArticleInput) -> GetArticleOutput:
+    """
+    Current text of one article of a Mexican federal law (Constitution, laws and codes), with its
+    title, chapter and the pages of the law PDF it spans. The first lookup of an article is a
+    BigQuery query (around a second, one more when the article does not exist), repeated lookups
+    are answered from memory: prefer it to scraping the whole law PDF whenever the law and article
+    are known. If the law name is ambiguous or the article does not exist, the closest names or
+    articles are suggested.
+
+    Args:
+        input_data (GetArticleInput): The law and the article number.
+
+    Returns:
+        GetArticleOutput: The article and the status.
+    """
+    try:
+        output = await asyncio.to_thread(_get_article, input_data)
+    except Exception as e:
+        logger.error(f"Error looking up article {input_data.article} of {input_data.law}: {e}")
+        return GetArticleOutput(status=f"error: Could not read the law articles: {str(e)}")
+
+    logger.info(f"Article {input_data.article} of {input_data.law}: {output.status}")
+    return output
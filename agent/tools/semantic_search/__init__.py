@@ -0,0 +1,9 @@
+from .tool_functions import semantic_search
+from .schemas import SemanticSearchInput, SemanticSearchOutput, SemanticSearchHit
+
+__all__ = [
+    "semantic_search",
+    "SemanticSearchInput",
+    "SemanticSearchOutput",
+    "SemanticSearchHit",
+]
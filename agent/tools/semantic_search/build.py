@@ -0,0 +1,42 @@
+"""
+Builds the vector store of the semantic search out of band: embeds the DOF notes and the law
+articles that are new or changed since the last build. The agent instances only read the store
+(INGEST_IN_AGENT=false), so the documents are embedded once instead of once per instance.
+
+Rows are committed by rewriting `state.json` last, so a copy of the store to the volume the agent
+reads must copy `vectors.f32` and `items.jsonl` before `state.json` (see `make build-semantic-store`).
+
+Usage:
+    SEARCH_ENABLED=false SEMANTIC_SEARCH_ENABLED=false uv run --group agent -m agent.tools.semantic_search.build \
+        --store-dir /tmp/vectors
+"""
+
+import argparse
+from loguru import logger
+from .config import SemanticSearchConfig
+from .engine import SemanticEngine
+
+
+def build_store(store_dir: str | None = None) -> int:
+    """
+    Embed the new or changed documents into the vector store.
+
+    Args:
+        store_dir (str | None): Directory of the store, VECTOR_STORE_DIR if None.
+
+    Returns:
+        int: Number of vectors committed in the store.
+    """
+    config = SemanticSearchConfig()
+    if store_dir:
+        config.VECTOR_STORE_DIR = store_dir
+    store = SemanticEngine(config, ingest=True).ingest()
+    logger.info(f"The vector store {config.VECTOR_STORE_DIR} holds {store.size} vectors")
+    return store.size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the vector store of the semantic search.")
+    parser.add_argument("--store-dir", type=str, default=None, help="Directory of the store (VECTOR_STORE_DIR by default)")
+    args = parser.parse_args()
+    build_store(args.store_dir)
@@ -0,0 +1,152 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+from typing import Annotated, Literal, Optional
+import datetime
+
+
+class SemanticSearchConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        validate_assignment=True,
+    )
+    """
+    Class that holds configuration values for the semantic search tool.
+    """
+
+    SEMANTIC_SEARCH_ENABLED: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Ingest the documents in the background and expose the semantic search. Disabled, the tool answers with an error.",
+        ),
+    ]
+    EMBEDDER: Annotated[
+        Literal["vertex", "hashing"],
+        Field(
+            default="vertex",
+            description="Embedder of documents and queries: 'vertex' (Vertex AI embeddings, production) or 'hashing' (local feature hashing, for tests and development without credentials).",
+        ),
+    ]
+    EMBEDDING_MODEL: Annotated[
+        str,
+        Field(
+            default="text-multilingual-embedding-002",
+            description="Vertex AI embedding model.",
+        ),
+    ]
+    EMBEDDING_DIMENSION: Annotated[
+        int,
+        Field(
+            default=768,
+            description="Dimension of the vectors. Changing it (or the embedder) discards the stored vectors.",
+            gt=0,
+        ),
+    ]
+    EMBEDDING_BATCH_SIZE: Annotated[
+        int,
+        Field(
+            default=32,
+            description="Texts per embedding request.",
+            gt=0,
+        ),
+    ]
+    VECTOR_STORE_DIR: Annotated[
+        str,
+        Field(
+            default="/mnt/lawyer_agent/vectors",
+            description="Directory of the vector store, on persistent storage (e.g. a Cloud Storage volume) filled by the build command and only read by the agent.",
+        ),
+    ]
+    INGEST_IN_AGENT: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Embed the documents in the agent process instead of reading a store built out of band. Only for development: every instance embeds on its own.",
+        ),
+    ]
+    DOF_TABLE: Annotated[
+        str,
+        Field(
+            default="lawyer_agent.dof",
+            description="Table with the DOF index loaded by the DOF pipeline ([project.]dataset.table).",
+        ),
+    ]
+    DOF_BODIES_TABLE: Annotated[
+        str,
+        Field(
+            default="lawyer_agent.dof_bodies",
+            description="Table with the DOF note bodies ([project.]dataset.table). Empty embeds the titles only.",
+        ),
+    ]
+    DOF_EMBED_START_DATE: Annotated[
+        Optional[datetime.date],
+        Field(
+            default=datetime.date(2024, 1, 1),
+            description="First publication date of the DOF notes that are embedded (on the first build of the store, later builds resume from its watermark).",
+        ),
+    ]
+    EMBED_BODY_CHARS: Annotated[
+        int,
+        Field(
+            default=1_000,
+            description="Characters of every DOF note body that are embedded with its title.",
+            ge=0,
+        ),
+    ]
+    LAW_ARTICLES_TABLE: Annotated[
+        str,
+        Field(
+            default="lawyer_agent.federal_law_articles",
+            description="Table with the articles of the federal laws ([project.]dataset.table). Empty skips the laws.",
+        ),
+    ]
+    EMBED_ARTICLE_CHARS: Annotated[
+        int,
+        Field(
+            default=2_000,
+            description="Characters of every law article that are embedded.",
+            gt=0,
+        ),
+    ]
+    INGEST_WINDOW_DAYS: Annotated[
+        int,
+        Field(
+            default=90,
+            description="Days of DOF notes read and embedded at a time; the progress is saved after every window.",
+            gt=0,
+        ),
+    ]
+    INGEST_REFRESH_SECONDS: Annotated[
+        int,
+        Field(
+            default=3_600,
+            description="Seconds between reloads of the store when the build command committed new vectors (between ingestions with INGEST_IN_AGENT). 0 only at startup.",
+            ge=0,
+        ),
+    ]
+    SEARCH_BLOCK_ROWS: Annotated[
+        int,
+        Field(
+            default=65_536,
+            description="Vectors scored at a time by a search, bounds the memory of the score matrix.",
+            gt=0,
+        ),
+    ]
+    MAX_SEMANTIC_RESULTS: Annotated[
+        int,
+        Field(
+            default=30,
+            description="Maximum number of documents a search can return.",
+            gt=0,
+        ),
+    ]
+    SNIPPET_CHARS: Annotated[
+        int,
+        Field(
+            default=300,
+            description="Characters of every document returned as its snippet.",
+            gt=0,
+        ),
+    ]
@@ -0,0 +1,115 @@
+from typing import Protocol
+import math
+import zlib
+import numpy as np
+from google import genai
+from google.genai import types
+from loguru import logger
+from ..dof_search.text import analyze
+
+
+class Embedder(Protocol):
+    """
+    Turns texts into L2 normalized float32 vectors, so the dot product is the cosine similarity.
+    """
+
+    name: str
+    dimension: int
+
+    def embed_documents(self, texts: list[str]) -> np.ndarray: ...
+
+    def embed_queries(self, texts: list[str]) -> np.ndarray: ...
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+class HashingEmbedder:
+    """
+    Local embedder without model nor credentials: the stemmed terms and pairs of consecutive terms
+    of a text are hashed into a signed sparse vector (1 + log tf). It only captures shared words,
+    not meaning, so it is meant for tests and development.
+    """
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.name = f"hashing-{dimension}"
+
+    def _embed(self, text: str) -> np.ndarray:
+        terms = analyze(text)
+        frequencies: dict[str, int] = {}
+        for feature in terms + [f"{first} {second}" for first, second in zip(terms, terms[1:])]:
+            frequencies[feature] = frequencies.get(feature, 0) + 1
+
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for feature, frequency in frequencies.items():
+            # crc32 instead of hash(), which changes between processes
+            hashed = zlib.crc32(feature.encode())
+            sign = 1.0 if hashed & 0x80000000 else -1.0
+            vector[hashed % self.dimension] += sign * (1 + math.log(frequency))
+        return vector
+
+    def embed_documents(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimension), np.float32)
+        return _normalize(np.stack([self._embed(text) for text in texts]))
+
+    def embed_queries(self, texts: list[str]) -> np.ndarray:
+        return self.embed_documents(texts)
+
+
+class VertexEmbedder:
+    """
+    Vertex AI text embeddings (google-genai client, with the credentials and project of the
+    environment, like the model of the agent). Documents and queries are embedded with their
+    retrieval task types.
+    """
+
+    def __init__(self, model: str, dimension: int, batch_size: int):
+        self.model = model
+        self.dimension = dimension
+        self.batch_size = batch_size
+        self.name = f"vertex-{model}-{dimension}"
+        self._client = genai.Client(vertexai=True)
+
+    def _embed(self, texts: list[str], task_type: str) -> np.ndarray:
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            response = self._client.models.embed_content(
+                model=self.model,
+                contents=texts[start : start + self.batch_size],
+                config=types.EmbedContentConfig(task_type=task_type, output_dimensionality=self.dimension),
+            )
+            vectors.extend(embedding.values for embedding in response.embeddings)
+        if not vectors:
+            return np.zeros((0, self.dimension), np.float32)
+        return _normalize(np.array(vectors, dtype=np.float32))
+
+    def embed_documents(self, texts: list[str]) -> np.ndarray:
+        return self._embed(texts, "RETRIEVAL_DOCUMENT")
+
+    def embed_queries(self, texts: list[str]) -> np.ndarray:
+        return self._embed(texts, "RETRIEVAL_QUERY")
+
+
+def build_embedder(name: str, model: str, dimension: int, batch_size: int) -> Embedder:
+    """
+    The configured embedder.
+
+    Args:
+        name (str): 'vertex' or 'hashing'.
+        model (str): Vertex AI embedding model.
+        dimension (int): Dimension of the vectors.
+        batch_size (int): Texts per embedding request.
+
+    Returns:
+        Embedder: The embedder.
+    """
+    if name == "hashing":
+        return HashingEmbedder(dimension)
+    if name == "vertex":
+        return VertexEmbedder(model, dimension, batch_size)
+    logger.error(f"Unknown embedder {name}")
+    raise ValueError(f"Unknown embedder {name}, expected 'vertex' or 'hashing'.")
@@ -0,0 +1,145 @@
+from threading import Lock
+import datetime
+import numpy as np
+from loguru import logger
+from ..dof_search.loader import RefreshingIndex
+from .config import SemanticSearchConfig
+from .embedders import Embedder, build_embedder
+from .ingestion import ingest_dof, ingest_law_articles
+from .store import VectorStore
+
+
+class SemanticEngine:
+    """
+    Semantic retrieval over the DOF notes and the federal law articles: documents are embedded
+    into a memory-mapped vector store (only the new or changed ones on every ingestion) and
+    searches score every query against the committed vectors, so they work while an ingestion
+    is running.
+
+    The store is built out of band by the build command (`build.py`) and the agent only reads it,
+    reopening it every INGEST_REFRESH_SECONDS if new vectors were committed. With `ingest` (or
+    INGEST_IN_AGENT) the background thread embeds the documents itself instead.
+
+    The embedder and the store are created on first use, so a missing credential or volume does
+    not break the import of the agent.
+    """
+
+    def __init__(self, config: SemanticSearchConfig, ingest: bool | None = None):
+        self.config = config
+        self.ingests = config.INGEST_IN_AGENT if ingest is None else ingest
+        self._lock = Lock()
+        self._embedder: Embedder | None = None
+        self._store: VectorStore | None = None
+        self._ingestion = RefreshingIndex(
+            name="semantic",
+            build=self.ingest if self.ingests else self.reload,
+            refresh_seconds=config.INGEST_REFRESH_SECONDS,
+        )
+
+    def _open_store(self, embedder: Embedder) -> VectorStore:
+        return VectorStore(
+            self.config.VECTOR_STORE_DIR, embedder.name, embedder.dimension, read_only=not self.ingests
+        )
+
+    def _components(self) -> tuple[Embedder, VectorStore]:
+        with self._lock:
+            if self._store is None:
+                self._embedder = build_embedder(
+                    self.config.EMBEDDER,
+                    self.config.EMBEDDING_MODEL,
+                    self.config.EMBEDDING_DIMENSION,
+                    self.config.EMBEDDING_BATCH_SIZE,
+                )
+                self._store = self._open_store(self._embedder)
+            return self._embedder, self._store
+
+    def start(self) -> None:
+        """
+        Start the background reloads (or ingestion).
+        """
+        self._ingestion.start()
+
+    def reload(self) -> VectorStore:
+        """
+        Reopen the store if the build command committed new vectors since it was opened.
+        """
+        embedder, store = self._components()
+        if not store.has_new_commits():
+            return store
+        store = self._open_store(embedder)
+        with self._lock:
+            self._store = store
+        return store
+
+    def ingest(self) -> VectorStore:
+        """
+        Embed the DOF notes and law articles that are not in the store yet.
+        """
+        embedder, store = self._components()
+        ingest_dof(
+            store,
+            embedder,
+            dof_table=self.config.DOF_TABLE,
+            bodies_table=self.config.DOF_BODIES_TABLE,
+            body_chars=self.config.EMBED_BODY_CHARS,
+            first_date=self.config.DOF_EMBED_START_DATE,
+            window_days=self.config.INGEST_WINDOW_DAYS,
+            snippet_chars=self.config.SNIPPET_CHARS,
+        )
+        ingest_law_articles(
+            store,
+            embedder,
+            articles_table=self.config.LAW_ARTICLES_TABLE,
+            article_chars=self.config.EMBED_ARTICLE_CHARS,
+            snippet_chars=self.config.SNIPPET_CHARS,
+        )
+        return store
+
+    def search(
+        self,
+        queries: list[str],
+        limit: int,
+        sources: list[str] | None = None,
+        start_date: datetime.date | None = None,
+        end_date: datetime.date | None = None,
+    ) -> tuple[list[dict], int, str | None]:
+        """
+        Documents most similar to any of the queries. All the queries are embedded in one request
+        and scored in the same pass over the vectors; a document found by several queries is
+        returned once, with its best score.
+
+        Args:
+            queries (list[str]): Queries in natural language.
+            limit (int): Maximum number of documents returned.
+            sources (list[str] | None): Collections to search ('dof', 'law'), all if None.
+            start_date (datetime.date | None): First publication date of the DOF notes.
+            end_date (datetime.date | None): Last publication date of the DOF notes.
+
+        Returns:
+            tuple[list[dict], int, str | None]: The documents (stored metadata plus score and
+            query), best first; the number of indexed documents; and the DOF watermark.
+        """
+        embedder, store = self._components()
+        snapshot = store.snapshot()
+        query_vectors = embedder.embed_queries(queries)
+        matches = snapshot.search(
+            query_vectors,
+            limit=limit,
+            sources=sources,
+            start_date=start_date,
+            end_date=end_date,
+            block_rows=self.config.SEARCH_BLOCK_ROWS,
+        )
+
+        best: dict[int, tuple[float, str]] = {}
+        for query, query_matches in zip(queries, matches):
+            for row, score in query_matches:
+                if row not in best or score > best[row][0]:
+                    best[row] = (score, query)
+        rows = sorted(best, key=lambda row: best[row][0], reverse=True)[:limit]
+
+        results = [
+            {**snapshot.items[row], "score": round(best[row][0], 4), "query": best[row][1]} for row in rows
+        ]
+        logger.info(f"Semantic search of {len(queries)} queries over {snapshot.size} vectors: {len(results)} documents")
+        return results, int(np.count_nonzero(snapshot.alive)), store.watermark("dof")
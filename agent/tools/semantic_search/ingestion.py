@@ -0,0 +1,190 @@
+import datetime
+import hashlib
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery
+from loguru import logger
+from ..dof_search.loader import load_notes
+from .embedders import Embedder
+from .store import VectorStore
+
+# Last days of notes read again on every ingestion, for the notes the DOF pipeline loads late
+# (failed dates retried on later runs). Notes already stored are skipped by their content hash.
+DOF_RELOAD_DAYS = 7
+# Documents embedded and committed at a time
+COMMIT_DOCUMENTS = 512
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def ingest_documents(
+    store: VectorStore,
+    embedder: Embedder,
+    documents: list[dict],
+    snippet_chars: int,
+    watermark: tuple[str, str] | None = None,
+) -> int:
+    """
+    Embed and store the documents that are new or whose text changed.
+
+    Args:
+        store (VectorStore): Store to append to.
+        embedder (Embedder): Embedder of the documents.
+        documents (list[dict]): Documents with source, key and text, plus the metadata to store.
+        snippet_chars (int): Characters of the text stored as snippet.
+        watermark (tuple[str, str] | None): (source, value) committed once every document is stored.
+
+    Returns:
+        int: Number of documents embedded.
+    """
+    pending = []
+    for document in documents:
+        document["content_hash"] = content_hash(document["text"])
+        if not store.is_current(document["source"], document["key"], document["content_hash"]):
+            pending.append(document)
+
+    for start in range(0, len(pending), COMMIT_DOCUMENTS):
+        chunk = pending[start : start + COMMIT_DOCUMENTS]
+        vectors = embedder.embed_documents([document["text"] for document in chunk])
+        items = [
+            {
+                **{name: value for name, value in document.items() if name != "text"},
+                "snippet": document["text"][:snippet_chars],
+            }
+            for document in chunk
+        ]
+        is_last = start + COMMIT_DOCUMENTS >= len(pending)
+        store.add(items, vectors, watermark if is_last else None)
+
+    if not pending and watermark:
+        store.save_watermark(*watermark)
+    return len(pending)
+
+
+def dof_documents(notes) -> list[dict]:
+    """
+    Documents of DOF notes (pyarrow.Table from `load_notes`): title and beginning of the body.
+    """
+    documents = []
+    for note in notes.to_pylist():
+        documents.append(
+            {
+                "source": "dof",
+                "key": note["link"],
+                "text": f"{note['title']}\n{note.get('body') or ''}".strip(),
+                "title": note["title"],
+                "link": note["link"],
+                "published_date": note["published_date"].isoformat(),
+                "section": note.get("section"),
+            }
+        )
+    return documents
+
+
+def ingest_dof(
+    store: VectorStore,
+    embedder: Embedder,
+    dof_table: str,
+    bodies_table: str,
+    body_chars: int,
+    first_date: datetime.date | None,
+    window_days: int,
+    snippet_chars: int,
+) -> int:
+    """
+    Embed the DOF notes published since the watermark of the store, `window_days` at a time. The
+    watermark advances after every window, so an interrupted ingestion resumes where it stopped.
+
+    Returns:
+        int: Number of notes embedded.
+    """
+    today = datetime.date.today()
+    watermark = store.watermark("dof")
+    if watermark:
+        start_date = datetime.date.fromisoformat(watermark) - datetime.timedelta(days=DOF_RELOAD_DAYS)
+    else:
+        start_date = first_date or datetime.date(2000, 1, 1)
+
+    embedded = 0
+    while start_date <= today:
+        end_date = min(start_date + datetime.timedelta(days=window_days - 1), today)
+        notes = load_notes(dof_table, bodies_table, body_chars, start_date=start_date, end_date=end_date)
+        embedded += ingest_documents(
+            store, embedder, dof_documents(notes), snippet_chars, watermark=("dof", end_date.isoformat())
+        )
+        start_date = end_date + datetime.timedelta(days=1)
+
+    logger.info(f"Embedded {embedded} new DOF notes")
+    return embedded
+
+
+def ingest_law_articles(
+    store: VectorStore, embedder: Embedder, articles_table: str, article_chars: int, snippet_chars: int
+) -> int:
+    """
+    Embed the federal law articles updated since the watermark of the store. The table is written
+    by the federal laws pipeline; until it exists, the laws are skipped. Articles the pipeline
+    deleted from their law are removed from the store.
+
+    Returns:
+        int: Number of articles embedded.
+    """
+    if not articles_table:
+        return 0
+
+    try:
+        remove_deleted_law_articles(store, articles_table)
+    except NotFound:
+        logger.info(f"The law articles table {articles_table} does not exist yet, skipping the laws")
+        return 0
+
+    query = f"""
+        SELECT law, title, chapter, article, SUBSTR(text, 1, {int(article_chars)}) AS text, source_url,
+            updated_at
+        FROM `{articles_table}`
+        WHERE updated_at > IFNULL(@since, TIMESTAMP '1970-01-01')
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ScalarQueryParameter("since", "TIMESTAMP", store.watermark("law"))]
+    )
+    articles = bigquery.Client().query(query, job_config=job_config).to_arrow().to_pylist()
+    if not articles:
+        return 0
+
+    documents = []
+    for article in articles:
+        heading = ". ".join(part for part in (article["law"], article["title"], article["chapter"]) if part)
+        documents.append(
+            {
+                "source": "law",
+                "key": f"{article['law']}|{article['article']}",
+                "text": f"{heading}. Artículo {article['article']}. {article['text'] or ''}",
+                "title": f"{article['law']}, artículo {article['article']}",
+                "link": article["source_url"],
+                "law": article["law"],
+                "article": article["article"],
+            }
+        )
+    watermark = max(article["updated_at"] for article in articles).isoformat()
+    embedded = ingest_documents(store, embedder, documents, snippet_chars, watermark=("law", watermark))
+    logger.info(f"Embedded {embedded} new or updated law articles")
+    return embedded
+
+
+def remove_deleted_law_articles(store: VectorStore, articles_table: str) -> int:
+    """
+    Remove from the store the articles that are no longer in their law. The federal laws pipeline
+    deletes them from the table, so they never come back with a newer updated_at.
+
+    Returns:
+        int: Number of articles removed.
+    """
+    query = f"SELECT DISTINCT law, article FROM `{articles_table}`"
+    rows = bigquery.Client().query(query).to_arrow().to_pylist()
+    current_keys = {f"{row['law']}|{row['article']}" for row in rows}
+    deleted_keys = [key for key in store.keys("law") if key not in current_keys]
+    removed = store.remove("law", deleted_keys)
+    if removed:
+        logger.info(f"Removed {removed} law articles deleted from {articles_table}")
+    return removed
@@ -0,0 +1,78 @@
+from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional
+import datetime
+
+SemanticSource = Literal["dof", "law"]
+
+
+class SemanticSearchInput(BaseModel):
+    queries: Annotated[
+        list[str],
+        Field(
+            description="One or more descriptions of what is being looked for, in natural Spanish (a sentence, not keywords). Documents are matched by meaning, so different wording of the same idea is found without listing synonyms. Several phrasings or aspects can be searched in one call.",
+            min_length=1,
+            max_length=8,
+            examples=[["despido de una trabajadora embarazada", "protección de la maternidad en el empleo"]],
+        ),
+    ]
+    sources: Annotated[
+        list[SemanticSource],
+        Field(
+            default=["dof", "law"],
+            description="Collections to search: 'dof' (titles and beginning of the DOF notes) and 'law' (articles of the federal laws).",
+            min_length=1,
+        ),
+    ]
+    start_date: Annotated[
+        Optional[datetime.date],
+        Field(
+            default=None,
+            description="First publication date (YYYY-MM-DD) of the DOF notes. Law articles are not filtered by date.",
+        ),
+    ]
+    end_date: Annotated[
+        Optional[datetime.date],
+        Field(
+            default=None,
+            description="Last publication date (YYYY-MM-DD) of the DOF notes.",
+        ),
+    ]
+    limit: Annotated[
+        int,
+        Field(
+            default=10,
+            description="Maximum number of documents returned, most similar first.",
+            ge=1,
+        ),
+    ]
+
+
+class SemanticSearchHit(BaseModel):
+    source: Annotated[SemanticSource, Field(description="Collection of the document.")]
+    title: Annotated[str, Field(description="Title of the DOF note, or law and article.")]
+    link: Annotated[Optional[str], Field(description="URL of the document, scrape it to read it in full.")]
+    published_date: Annotated[Optional[datetime.date], Field(default=None, description="Publication date of a DOF note.")]
+    law: Annotated[Optional[str], Field(default=None, description="Law of an article.")]
+    article: Annotated[Optional[str], Field(default=None, description="Article number, e.g. '27' or '4 BIS'.")]
+    snippet: Annotated[str, Field(description="Beginning of the indexed text.")]
+    score: Annotated[float, Field(description="Cosine similarity with the closest query, higher is better.")]
+    query: Annotated[str, Field(description="Query the document is most similar to.")]
+
+
+class SemanticSearchOutput(BaseModel):
+    results: Annotated[
+        list[SemanticSearchHit],
+        Field(description="Most similar documents over all the queries, best first."),
+    ]
+    status: Annotated[
+        str,
+        Field(description="Processing status, e.g., 'success' or an error message."),
+    ]
+    indexed_documents: Annotated[
+        int,
+        Field(default=0, description="Number of documents in the index."),
+    ]
+    indexed_until: Annotated[
+        Optional[datetime.date],
+        Field(default=None, description="Publication date up to which the DOF notes are indexed, newer notes are only in BigQuery."),
+    ]
@@ -0,0 +1,325 @@
+from array import array
+from pathlib import Path
+from threading import Lock
+import datetime
+import json
+import os
+import shutil
+import numpy as np
+from loguru import logger
+
+SOURCES = ("dof", "law")
+EPOCH = datetime.date(1970, 1, 1)
+NO_DATE = np.iinfo(np.int32).min
+
+
+def _days(value: datetime.date) -> int:
+    return (value - EPOCH).days
+
+
+class VectorSnapshot:
+    """
+    Read-only view of the first `size` vectors of a store: a float32 memory-mapped matrix (the OS
+    pages it in and out, it does not need to fit in memory) and the metadata of its rows.
+    """
+
+    def __init__(
+        self, vectors: np.ndarray, items: list[dict], sources: np.ndarray, date_days: np.ndarray, alive: np.ndarray
+    ):
+        self.vectors = vectors
+        self.items = items
+        self.sources = sources
+        self.date_days = date_days
+        self.alive = alive
+        self.size = len(vectors)
+
+    def _filter_mask(
+        self, sources: list[str] | None, start_date: datetime.date | None, end_date: datetime.date | None
+    ) -> np.ndarray:
+        mask = self.alive.copy()
+        if sources:
+            mask &= np.isin(self.sources, [SOURCES.index(source) for source in sources])
+        # Dates only restrict the documents that have one (DOF notes), law articles are kept
+        dated = self.date_days != NO_DATE
+        if start_date:
+            mask &= ~dated | (self.date_days >= _days(start_date))
+        if end_date:
+            mask &= ~dated | (self.date_days <= _days(end_date))
+        return mask
+
+    def search(
+        self,
+        queries: np.ndarray,
+        limit: int,
+        sources: list[str] | None = None,
+        start_date: datetime.date | None = None,
+        end_date: datetime.date | None = None,
+        block_rows: int = 65_536,
+    ) -> list[list[tuple[int, float]]]:
+        """
+        Most similar rows to every query vector. The matrix is scored in blocks of `block_rows`
+        (one matrix product for all the queries) keeping only the best `limit` rows per query, so
+        memory does not grow with the store.
+
+        Args:
+            queries (np.ndarray): Normalized query vectors, one per row.
+            limit (int): Rows returned per query.
+            sources (list[str] | None): Sources to search, all if None.
+            start_date (datetime.date | None): First publication date of the dated documents.
+            end_date (datetime.date | None): Last publication date of the dated documents.
+            block_rows (int): Vectors scored at a time.
+
+        Returns:
+            list[list[tuple[int, float]]]: Per query, (row, cosine similarity) best first.
+        """
+        num_queries = len(queries)
+        best_scores = np.empty((num_queries, 0), dtype=np.float32)
+        best_rows = np.empty((num_queries, 0), dtype=np.int64)
+        if not self.size or not num_queries:
+            return [[] for _ in range(num_queries)]
+
+        mask = self._filter_mask(sources, start_date, end_date)
+        for start in range(0, self.size, block_rows):
+            end = min(start + block_rows, self.size)
+            block_mask = mask[start:end]
+            if not block_mask.any():
+                continue
+            scores = queries @ np.asarray(self.vectors[start:end]).T
+            scores[:, ~block_mask] = -np.inf
+
+            keep = min(limit, end - start)
+            top = np.argpartition(-scores, keep - 1, axis=1)[:, :keep]
+            best_scores = np.concatenate([best_scores, np.take_along_axis(scores, top, axis=1)], axis=1)
+            best_rows = np.concatenate([best_rows, top + start], axis=1)
+            if best_scores.shape[1] > limit:
+                top = np.argpartition(-best_scores, limit - 1, axis=1)[:, :limit]
+                best_scores = np.take_along_axis(best_scores, top, axis=1)
+                best_rows = np.take_along_axis(best_rows, top, axis=1)
+
+        results = []
+        for scores, rows in zip(best_scores, best_rows):
+            order = np.argsort(-scores, kind="stable")
+            results.append([(int(rows[i]), float(scores[i])) for i in order if np.isfinite(scores[i])])
+        return results
+
+
+class VectorStore:
+    """
+    Append-only vector store in a directory:
+
+    - `vectors.f32`: the vectors, float32 rows of `dimension` values one after the other.
+    - `items.jsonl`: the metadata of every row (source, key, content hash, title, link...).
+    - `state.json`: committed row count, embedder, ingestion watermarks and replaced rows.
+
+    Rows are appended first and committed by rewriting `state.json` atomically, so rows written by
+    an interrupted ingestion are discarded when the store is opened. A document whose content
+    changes gets a new row and its previous row is marked as replaced, as are the rows of removed
+    documents. The vectors of another embedder or dimension are discarded.
+
+    A `read_only` store (the agent reading a store built by another process) never writes: the
+    committed rows are read as they are and a missing or incompatible store is seen as empty.
+    """
+
+    def __init__(self, directory: str, embedder_name: str, dimension: int, read_only: bool = False):
+        self.directory = Path(directory)
+        self.embedder_name = embedder_name
+        self.dimension = dimension
+        self.read_only = read_only
+        self._vectors_path = self.directory / "vectors.f32"
+        self._items_path = self.directory / "items.jsonl"
+        self._state_path = self.directory / "state.json"
+        self._lock = Lock()
+        self._snapshot: VectorSnapshot | None = None
+
+        if not read_only:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.state = self._load_state()
+        self.items = self._load_items()
+        replaced = set(self.state["replaced"])
+        # Latest row of every document, removed documents have none
+        self._rows_by_key = {
+            (item["source"], item["key"]): row for row, item in enumerate(self.items) if row not in replaced
+        }
+        self._sources = array("b", (SOURCES.index(item["source"]) for item in self.items))
+        self._date_days = array(
+            "i",
+            (
+                _days(datetime.date.fromisoformat(item["published_date"])) if item.get("published_date") else NO_DATE
+                for item in self.items
+            ),
+        )
+        logger.info(f"Opened the vector store {self.directory}: {self.size} vectors of {embedder_name}")
+
+    @property
+    def size(self) -> int:
+        return self.state["count"]
+
+    def _load_state(self) -> dict:
+        empty_state = {
+            "embedder": self.embedder_name,
+            "dimension": self.dimension,
+            "count": 0,
+            "watermarks": {},
+            "replaced": [],
+        }
+        if not self._state_path.exists():
+            if not self.read_only:
+                self._reset()
+            return empty_state
+
+        state = json.loads(self._state_path.read_text())
+        if state["embedder"] != self.embedder_name or state["dimension"] != self.dimension:
+            if self.read_only:
+                logger.warning(
+                    f"The vector store {self.directory} holds vectors of {state['embedder']} ({state['dimension']}), "
+                    f"not of {self.embedder_name} ({self.dimension}), ignoring them"
+                )
+                return empty_state
+            logger.warning(
+                f"The vector store {self.directory} holds vectors of {state['embedder']} ({state['dimension']}), "
+                f"discarding them for {self.embedder_name} ({self.dimension})"
+            )
+            self._reset()
+            return empty_state
+        return state
+
+    def _reset(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._vectors_path.touch()
+        self._items_path.touch()
+
+    def _load_items(self) -> list[dict]:
+        count = self.size
+        if self.read_only:
+            if not count:
+                return []
+            # The writer only appends after the committed rows, the first `count` lines are stable
+            with open(self._items_path, encoding="utf-8") as items_file:
+                return [json.loads(line) for _, line in zip(range(count), items_file)]
+
+        # Discard the rows written after the last commit
+        with open(self._vectors_path, "r+b") as vectors_file:
+            vectors_file.truncate(count * self.dimension * 4)
+        with open(self._items_path, encoding="utf-8") as items_file:
+            lines = [line for _, line in zip(range(count), items_file)]
+        with open(self._items_path, "w", encoding="utf-8") as items_file:
+            items_file.writelines(lines)
+        return [json.loads(line) for line in lines]
+
+    def _write_state(self) -> None:
+        temporary_path = self._state_path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(self.state))
+        os.replace(temporary_path, self._state_path)
+
+    def has_new_commits(self) -> bool:
+        """
+        Whether another process committed to the store since it was opened.
+        """
+        try:
+            return json.loads(self._state_path.read_text()) != self.state
+        except FileNotFoundError:
+            return False
+
+    def watermark(self, source: str) -> str | None:
+        """
+        Ingestion watermark saved for a source.
+        """
+        return self.state["watermarks"].get(source)
+
+    def is_current(self, source: str, key: str, content_hash: str) -> bool:
+        """
+        Whether a document is stored with this content.
+        """
+        row = self._rows_by_key.get((source, key))
+        return row is not None and self.items[row]["content_hash"] == content_hash
+
+    def add(self, items: list[dict], vectors: np.ndarray, watermark: tuple[str, str] | None = None) -> None:
+        """
+        Append and commit documents with their vectors. Documents already stored are replaced.
+
+        Args:
+            items (list[dict]): Metadata of the documents, with source, key and content_hash.
+            vectors (np.ndarray): Normalized vectors, one row per document.
+            watermark (tuple[str, str] | None): (source, value) saved with the commit.
+        """
+        with self._lock:
+            with open(self._vectors_path, "ab") as vectors_file:
+                vectors_file.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+                vectors_file.flush()
+                os.fsync(vectors_file.fileno())
+            with open(self._items_path, "a", encoding="utf-8") as items_file:
+                items_file.writelines(json.dumps(item, ensure_ascii=False, default=str) + "\n" for item in items)
+
+            for item in items:
+                previous_row = self._rows_by_key.get((item["source"], item["key"]))
+                if previous_row is not None:
+                    self.state["replaced"].append(previous_row)
+                self._rows_by_key[(item["source"], item["key"])] = len(self.items)
+                self.items.append(item)
+                self._sources.append(SOURCES.index(item["source"]))
+                published_date = item.get("published_date")
+                self._date_days.append(_days(datetime.date.fromisoformat(str(published_date))) if published_date else NO_DATE)
+
+            self.state["count"] = len(self.items)
+            if watermark:
+                self.state["watermarks"][watermark[0]] = watermark[1]
+            self._write_state()
+            self._snapshot = None
+
+    def remove(self, source: str, keys: list[str]) -> int:
+        """
+        Commit the removal of documents (e.g. deleted from their table): their rows are marked as
+        replaced, so searches skip them.
+
+        Args:
+            source (str): Source of the documents.
+            keys (list[str]): Keys of the documents, the ones not stored are ignored.
+
+        Returns:
+            int: Number of documents removed.
+        """
+        with self._lock:
+            rows = [self._rows_by_key.pop((source, key)) for key in keys if (source, key) in self._rows_by_key]
+            if rows:
+                self.state["replaced"].extend(rows)
+                self._write_state()
+                self._snapshot = None
+            return len(rows)
+
+    def keys(self, source: str) -> list[str]:
+        """
+        Keys of the documents of a source currently stored.
+        """
+        return [key for stored_source, key in self._rows_by_key if stored_source == source]
+
+    def save_watermark(self, source: str, value: str) -> None:
+        """
+        Commit a watermark without documents (e.g. a window without new notes).
+        """
+        with self._lock:
+            self.state["watermarks"][source] = value
+            self._write_state()
+
+    def snapshot(self) -> VectorSnapshot:
+        """
+        Read-only view of the committed vectors, reused until the next commit.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                count = self.size
+                vectors = (
+                    np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(count, self.dimension))
+                    if count
+                    else np.zeros((0, self.dimension), dtype=np.float32)
+                )
+                alive = np.ones(count, dtype=bool)
+                alive[self.state["replaced"]] = False
+                self._snapshot = VectorSnapshot(
+                    vectors=vectors,
+                    items=self.items,
+                    sources=np.array(self._sources, dtype=np.int8),
+                    date_days=np.array(self._date_days, dtype=np.int32),
+                    alive=alive,
+                )
+            return self._snapshot
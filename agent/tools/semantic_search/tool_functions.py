@@ -0,0 +1,54 @@
+from loguru import logger
+import asyncio
+import datetime
+from .config import SemanticSearchConfig
+from .engine import SemanticEngine
+from .schemas import SemanticSearchInput, SemanticSearchOutput, SemanticSearchHit
+
+semantic_search_config = SemanticSearchConfig()
+semantic_engine = SemanticEngine(semantic_search_config)
+if semantic_search_config.SEMANTIC_SEARCH_ENABLED:
+    # The store built out of band is reloaded in the background, searches use the vectors committed so far
+    semantic_engine.start()
+
+
+async def semantic_search(input_data: SemanticSearchInput) -> SemanticSearchOutput:
+    """
+    Search DOF notes and federal law articles by meaning instead of by words: a query like
+    'despido de una trabajadora embarazada' also finds documents worded 'terminación de la relación
+    laboral durante la gestación'. Several phrasings or aspects can go in the same call, which
+    replaces several exploratory keyword searches. Use it to discover the relevant notes and
+    articles, then read them (scrape the links) before citing them.
+
+    Args:
+        input_data (SemanticSearchInput): The queries, the collections and the date filters.
+
+    Returns:
+        SemanticSearchOutput: The most similar documents (title, link, snippet), best first.
+    """
+    if not semantic_search_config.SEMANTIC_SEARCH_ENABLED:
+        return SemanticSearchOutput(results=[], status="error: The semantic search is disabled.")
+
+    try:
+        results, indexed_documents, dof_watermark = await asyncio.to_thread(
+            semantic_engine.search,
+            input_data.queries,
+            min(input_data.limit, semantic_search_config.MAX_SEMANTIC_RESULTS),
+            input_data.sources,
+            input_data.start_date,
+            input_data.end_date,
+        )
+    except Exception as e:
+        logger.error(f"Semantic search failed: {e}")
+        return SemanticSearchOutput(results=[], status=f"error: Semantic search failed: {str(e)}")
+
+    if not indexed_documents:
+        return SemanticSearchOutput(
+            results=[], status="error: The semantic index is empty (not built yet), use search_dof or BigQuery meanwhile."
+        )
+    return SemanticSearchOutput(
+        results=[SemanticSearchHit(**result) for result in results],
+        status="success",
+        indexed_documents=indexed_documents,
+        indexed_until=datetime.date.fromisoformat(dof_watermark) if dof_watermark else None,
+    )
@@ -1,8 +1,17 @@
-from .tool_functions import scrape_and_convert_to_markdown
-from .schemas import UrlScraperInput, UrlScraperOutput
+from .tool_functions import scrape_and_convert_to_markdown, scrape_urls, prefetch_urls_from_results
+from .schemas import (
+    UrlScraperInput,
+    UrlScraperOutput,
+    UrlScraperBatchInput,
+    UrlScraperBatchOutput,
+)
 
 __all__ = [
     "scrape_and_convert_to_markdown",
+    "scrape_urls",
+    "prefetch_urls_from_results",
     "UrlScraperInput",
     "UrlScraperOutput",
+    "UrlScraperBatchInput",
+    "UrlScraperBatchOutput",
 ]
@@ -0,0 +1,128 @@
+"""
+Benchmark of the HTML to Markdown converters over a corpus of saved pages:
+
+    - markdownify: BeautifulSoup extraction + markdownify (reference output)
+    - lxml: lxml (libxml2) extraction + single pass Markdown rendering
+
+For every page it reports the conversion time of each converter (best of `repeat` runs) and the
+fidelity of the lxml output against the reference: F1 over the words of both outputs plus the
+number of headings, table rows and links each one kept.
+
+Save the pages to compare first, e.g.:
+
+    mkdir -p dof_pages
+    curl -k -o dof_pages/5777376.html "https://dof.gob.mx/nota_detalle.php?codigo=5777376"
+
+Usage:
+    uv run --group agent -m agent.tools.url_scraper.benchmark --pages-dir dof_pages --repeat 3
+"""
+
+import argparse
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from .converters import CONVERTERS
+
+REFERENCE_CONVERTER = "markdownify"
+
+_WORD = re.compile(r"\w+")
+_HEADING = re.compile(r"^#{1,6} ", re.MULTILINE)
+_TABLE_ROW = re.compile(r"^\|.*\|$", re.MULTILINE)
+_LINK = re.compile(r"\]\(")
+
+
+def word_f1(reference: str, candidate: str) -> float:
+    """
+    F1 between the multisets of words of two outputs (1.0 means the same words, in any order).
+    """
+    reference_words = Counter(_WORD.findall(reference.lower()))
+    candidate_words = Counter(_WORD.findall(candidate.lower()))
+    common = sum((reference_words & candidate_words).values())
+    if not reference_words and not candidate_words:
+        return 1.0
+    if not common:
+        return 0.0
+    precision = common / sum(candidate_words.values())
+    recall = common / sum(reference_words.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def structure(markdown_content: str) -> tuple[int, int, int]:
+    """
+    Headings, table rows and links of a Markdown output.
+    """
+    return (
+        len(_HEADING.findall(markdown_content)),
+        len(_TABLE_ROW.findall(markdown_content)),
+        len(_LINK.findall(markdown_content)),
+    )
+
+
+def run_benchmark(pages_dir: Path, url: str, repeat: int) -> list[dict]:
+    """
+    Convert every saved page with every converter.
+
+    Args:
+        pages_dir (Path): Directory with the saved pages (*.html, *.htm).
+        url (str): URL the pages are attributed to, it selects the site extractor.
+        repeat (int): Runs per page and converter, the best time is kept.
+
+    Returns:
+        list[dict]: One dictionary of metrics per page.
+    """
+    pages = sorted(path for path in pages_dir.iterdir() if path.suffix.lower() in (".html", ".htm"))
+    if not pages:
+        raise ValueError(f"No saved pages (*.html) found in {pages_dir}")
+
+    metrics = []
+    for path in pages:
+        content = path.read_bytes()
+        outputs, seconds = {}, {}
+        for name, converter in CONVERTERS.items():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                outputs[name] = converter(url, content, None)
+                best = min(best, time.perf_counter() - start)
+            seconds[name] = best
+
+        reference = outputs[REFERENCE_CONVERTER]
+        for name, output in outputs.items():
+            metrics.append(
+                {
+                    "page": path.name,
+                    "kb": len(content) / 1024,
+                    "converter": name,
+                    "seconds": seconds[name],
+                    "speedup": seconds[REFERENCE_CONVERTER] / seconds[name] if seconds[name] else float("inf"),
+                    "word_f1": word_f1(reference, output),
+                    "structure": structure(output),
+                }
+            )
+
+    return metrics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark HTML to Markdown converters.")
+    parser.add_argument("--pages-dir", type=Path, required=True, help="Directory with saved pages")
+    parser.add_argument(
+        "--url",
+        type=str,
+        default="https://www.dof.gob.mx/nota_detalle.php",
+        help="URL the pages come from, used to choose the site extractor",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per page and converter")
+    args = parser.parse_args()
+
+    print(
+        f"{'page':<24} {'KB':>8} {'converter':<12} {'seconds':>9} {'speedup':>8} {'word F1':>8} "
+        f"{'headings':>9} {'rows':>7} {'links':>6}"
+    )
+    for run in run_benchmark(args.pages_dir, args.url, args.repeat):
+        headings, rows, links = run["structure"]
+        print(
+            f"{run['page'][:24]:<24} {run['kb']:>8.0f} {run['converter']:<12} {run['seconds']:>9.3f} "
+            f"{run['speedup']:>8.1f} {run['word_f1']:>8.3f} {headings:>9} {rows:>7} {links:>6}"
+        )
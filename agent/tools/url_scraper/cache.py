@@ -0,0 +1,151 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock, get_ident
+from urllib.parse import urlparse
+import hashlib
+import os
+import time
+from loguru import logger
+from .schemas import CachedPage
+
+
+# Bump when the stored content changes (e.g. a new extraction), so old entries are never served
+CACHE_FORMAT_VERSION = 2
+
+
+def cache_key(url: str, variant: str = "") -> str:
+    """
+    Key of a URL in the cache. The variant tells apart conversions of the same URL (e.g. the converter).
+    """
+    return hashlib.sha256(f"v{CACHE_FORMAT_VERSION}:{variant}:{url}".encode()).hexdigest()
+
+
+def ttl_for_url(url: str, host_ttls: dict[str, int], default_ttl: int) -> int:
+    """
+    TTL of a URL according to its host. A configured host also matches its subdomains.
+
+    Args:
+        url (str): URL of the page.
+        host_ttls (dict[str, int]): TTL in seconds per host.
+        default_ttl (int): TTL for hosts that are not configured.
+
+    Returns:
+        int: TTL in seconds.
+    """
+    host = (urlparse(url).hostname or "").lower()
+    for configured_host, ttl in host_ttls.items():
+        if host == configured_host or host.endswith(f".{configured_host}"):
+            return ttl
+    return default_ttl
+
+
+def revalidation_headers(page: CachedPage) -> dict[str, str]:
+    """
+    Conditional request headers that let the server answer 304 Not Modified for a cached page.
+    """
+    headers = {}
+    if page.etag:
+        headers["If-None-Match"] = page.etag
+    if page.last_modified:
+        headers["If-Modified-Since"] = page.last_modified
+    return headers
+
+
+def _last_access(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+class ScrapeCacheBackend(ABC):
+    """
+    Storage of scraped pages. Implementations must be safe to use from several threads.
+    """
+
+    @abstractmethod
+    def get(self, url: str, variant: str = "") -> CachedPage | None:
+        pass
+
+    @abstractmethod
+    def put(self, page: CachedPage) -> None:
+        pass
+
+    def is_fresh(self, page: CachedPage, ttl_seconds: int) -> bool:
+        """
+        Tells if a cached page can be served without revalidating it.
+        """
+        return time.time() - page.fetched_at < ttl_seconds
+
+
+class DiskScrapeCache(ScrapeCacheBackend):
+    """
+    Cache of scraped pages stored as one JSON file per URL, bounded in size with LRU eviction.
+    The modification time of a file is its last access time.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._sizes = {
+            path.name: path.stat().st_size for path in self.cache_dir.glob("*.json")
+        }
+        self._total_bytes = sum(self._sizes.values())
+
+    def _path(self, url: str, variant: str) -> Path:
+        return self.cache_dir / f"{cache_key(url, variant)}.json"
+
+    def get(self, url: str, variant: str = "") -> CachedPage | None:
+        path = self._path(url, variant)
+        try:
+            page = CachedPage.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {url}: {e}")
+            self._remove(path)
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return page
+
+    def put(self, page: CachedPage) -> None:
+        path = self._path(page.url, page.variant)
+        data = page.model_dump_json().encode()
+        if len(data) > self.max_bytes:
+            logger.warning(f"Page {page.url} is bigger than the whole cache, not caching it")
+            return
+
+        # Write to a temporary file first so readers never see a partial entry
+        temporary_path = path.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        temporary_path.write_bytes(data)
+        os.replace(temporary_path, path)
+
+        with self._lock:
+            self._total_bytes += len(data) - self._sizes.get(path.name, 0)
+            self._sizes[path.name] = len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _remove(self, path: Path) -> None:
+        with self._lock:
+            self._total_bytes -= self._sizes.pop(path.name, 0)
+        path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits in max_bytes. Caller holds the lock.
+        """
+        paths = sorted(self.cache_dir.glob("*.json"), key=_last_access)
+        for path in paths:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._total_bytes -= self._sizes.pop(path.name, 0)
+            path.unlink(missing_ok=True)
+            logger.debug(f"Evicted {path.name} from the scrape cache")
@@ -0,0 +1,158 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+from typing import Annotated, Literal
+
+
+class ScraperConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        validate_assignment=True,
+    )
+    """
+    Class that holds configuration values for the URL scraper tool.
+    """
+
+    USER_AGENT: Annotated[
+        str,
+        Field(
+            default="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+            description="User-Agent sent to the scraped sites, some of them block unknown clients.",
+        ),
+    ]
+    REQUEST_TIMEOUT_SECONDS: Annotated[
+        float,
+        Field(
+            default=10,
+            description="Timeout of every HTTP request.",
+            gt=0,
+        ),
+    ]
+    CACHE_DIR: Annotated[
+        str,
+        Field(
+            default="/tmp/lawyer_agent/scrape_cache",
+            description="Directory where the scraped pages (converted to Markdown) are cached.",
+        ),
+    ]
+    CACHE_MAX_BYTES: Annotated[
+        int,
+        Field(
+            default=256_000_000,
+            description="Maximum size of the cache directory. Least recently used pages are evicted first.",
+            gt=0,
+        ),
+    ]
+    CACHE_DEFAULT_TTL_SECONDS: Annotated[
+        int,
+        Field(
+            default=86_400,
+            description="Seconds a cached page is served without revalidating it, for hosts without a specific TTL.",
+            ge=0,
+        ),
+    ]
+    CACHE_HOST_TTL_SECONDS: Annotated[
+        dict[str, int],
+        Field(
+            default={
+                # DOF notes never change after publication
+                "dof.gob.mx": 365 * 86_400,
+                "diputados.gob.mx": 86_400,
+            },
+            description="TTL per host. A host also matches its subdomains, e.g. 'dof.gob.mx' matches 'www.dof.gob.mx'.",
+        ),
+    ]
+    MAX_CONNECTIONS: Annotated[
+        int,
+        Field(
+            default=20,
+            description="Size of the connection pool shared by every scrape.",
+            gt=0,
+        ),
+    ]
+    MAX_CONCURRENT_REQUESTS_PER_HOST: Annotated[
+        int,
+        Field(
+            default=4,
+            description="Maximum requests in flight to the same host, government sites throttle aggressive clients.",
+            gt=0,
+        ),
+    ]
+    MAX_URLS_PER_CALL: Annotated[
+        int,
+        Field(
+            default=10,
+            description="Maximum number of URLs accepted by a single scrape_urls call.",
+            gt=0,
+        ),
+    ]
+    PAGE_CHARS: Annotated[
+        int,
+        Field(
+            default=8_000,
+            description="Characters of Markdown returned per page, longer pages are returned in several pages.",
+            gt=0,
+        ),
+    ]
+    MAX_DOWNLOAD_BYTES: Annotated[
+        int,
+        Field(
+            default=20_000_000,
+            description="Downloads are aborted as soon as a response exceeds this size (DOF notes with annexes can weigh several MB).",
+            gt=0,
+        ),
+    ]
+    DEFAULT_CONVERTER: Annotated[
+        Literal["markdownify", "lxml"],
+        Field(
+            default="markdownify",
+            description="HTML to Markdown backend used when the request does not choose one.",
+        ),
+    ]
+    MAX_PDF_DOWNLOAD_BYTES: Annotated[
+        int,
+        Field(
+            default=60_000_000,
+            description="Download limit for PDFs, federal laws can have hundreds of pages.",
+            gt=0,
+        ),
+    ]
+    PREFETCH_ENABLED: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Warm the cache in the background with the URLs returned by BigQuery queries.",
+        ),
+    ]
+    PREFETCH_MAX_CONCURRENCY: Annotated[
+        int,
+        Field(
+            default=4,
+            description="Maximum prefetches in flight, on top of the per host limit.",
+            gt=0,
+        ),
+    ]
+    PREFETCH_URLS_PER_RUN: Annotated[
+        int,
+        Field(
+            default=20,
+            description="Maximum URLs prefetched for a single agent run.",
+            ge=0,
+        ),
+    ]
+    PREFETCH_WAIT_SECONDS: Annotated[
+        float,
+        Field(
+            default=10,
+            description="How long a scrape waits for an in-flight prefetch of the same URL before fetching it itself.",
+            ge=0,
+        ),
+    ]
+    DOF_BODIES_TABLE: Annotated[
+        str,
+        Field(
+            default="lawyer_agent.dof_bodies",
+            description="Table with the DOF note bodies ingested by the DOF pipeline ([project.]dataset.table). Empty disables the lookup.",
+        ),
+    ]
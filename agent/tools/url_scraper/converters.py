@@ -0,0 +1,155 @@
+from typing import Callable, Literal
+import re
+from lxml import etree, html as lxml_html
+from markdownify import markdownify as md
+from .extractors import extract_main_content, extract_main_element
+from .pagination import clean_markdown
+
+ConverterName = Literal["markdownify", "lxml"]
+
+HEADING_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "blockquote", "center", "dl", "dt", "dd", "figure",
+    "figcaption", "address", "caption",
+}
+SKIPPED_TAGS = {"head", "title", "meta", "link", "template"}
+
+_WHITESPACE = re.compile(r"\s+")
+# Same characters escaped by markdownify by default
+_MARKDOWN_SPECIAL = re.compile(r"([*_])")
+
+
+def markdownify_converter(url: str, content: bytes, encoding: str | None) -> str:
+    """
+    Reference converter: BeautifulSoup extraction followed by markdownify.
+    """
+    main_content = extract_main_content(url, content, encoding)
+    return clean_markdown(md(main_content, heading_style="ATX", strip=['script', 'style']))
+
+
+def _text(text: str | None, in_pre: bool) -> str:
+    if not text:
+        return ""
+    if in_pre:
+        return text
+    return _MARKDOWN_SPECIAL.sub(r"\\\1", _WHITESPACE.sub(" ", text))
+
+
+def _children(element: etree._Element, in_pre: bool = False) -> str:
+    parts = [_text(element.text, in_pre)]
+    for child in element:
+        parts.append(_convert(child, in_pre))
+        parts.append(_text(child.tail, in_pre))
+    return "".join(parts)
+
+
+def _inline(element: etree._Element) -> str:
+    return _children(element).strip()
+
+
+def _cell(element: etree._Element) -> str:
+    return _WHITESPACE.sub(" ", _children(element)).strip().replace("|", "\\|")
+
+
+def _convert_list(element: etree._Element, ordered: bool) -> str:
+    items = []
+    for index, item in enumerate(element.iterchildren("li"), start=1):
+        marker = f"{index}." if ordered else "*"
+        body = clean_markdown(_children(item)).replace("\n", "\n    ")
+        items.append(f"{marker} {body}")
+    return "\n\n" + "\n".join(items) + "\n\n"
+
+
+def _convert_table(element: etree._Element) -> str:
+    rows = element.xpath("./tr|./thead/tr|./tbody/tr|./tfoot/tr")
+    cells = [row.xpath("./td|./th") for row in rows]
+    columns = max((len(row_cells) for row_cells in cells), default=0)
+    is_layout = columns < 2 or element.xpath(".//table")
+    if is_layout:
+        # Layout tables (one column or nested tables) are rendered as plain blocks
+        return "".join(f"\n\n{_children(cell)}\n\n" for row_cells in cells for cell in row_cells)
+
+    lines = []
+    for index, row_cells in enumerate(cells):
+        values = [_cell(cell) for cell in row_cells]
+        values += [""] * (columns - len(values))
+        lines.append("| " + " | ".join(values) + " |")
+        if index == 0:
+            lines.append("| " + " | ".join(["---"] * columns) + " |")
+    return "\n\n" + "\n".join(lines) + "\n\n"
+
+
+def _convert(element: etree._Element, in_pre: bool = False) -> str:
+    # Comments and processing instructions have a non string tag
+    if not isinstance(element.tag, str):
+        return ""
+    tag = element.tag.lower()
+
+    if tag in SKIPPED_TAGS:
+        return ""
+    if tag in HEADING_LEVELS:
+        return f"\n\n{'#' * HEADING_LEVELS[tag]} {_inline(element)}\n\n"
+    if tag in BLOCK_TAGS:
+        return f"\n\n{_children(element, in_pre).strip()}\n\n"
+    if tag == "br":
+        return "  \n"
+    if tag == "hr":
+        return "\n\n---\n\n"
+    if tag in ("strong", "b"):
+        inner = _inline(element)
+        return f"**{inner}**" if inner else ""
+    if tag in ("em", "i"):
+        inner = _inline(element)
+        return f"*{inner}*" if inner else ""
+    if tag == "a":
+        inner = _inline(element)
+        href = element.get("href")
+        if href and inner and not href.startswith(("#", "javascript:")):
+            return f"[{inner}]({href})"
+        return inner
+    if tag == "img":
+        src = element.get("src")
+        return f"![{element.get('alt', '')}]({src})" if src else ""
+    if tag in ("ul", "ol"):
+        return _convert_list(element, ordered=tag == "ol")
+    if tag == "table":
+        return _convert_table(element)
+    if tag == "pre":
+        return f"\n\n```\n{element.text_content()}\n```\n\n"
+    if tag == "code" and not in_pre:
+        return f"`{element.text_content()}`"
+    return _children(element, in_pre)
+
+
+def lxml_converter(url: str, content: bytes, encoding: str | None) -> str:
+    """
+    Fast converter: parses with lxml (libxml2, written in C) and renders the tree to Markdown in a
+    single pass, without building BeautifulSoup objects.
+    """
+    if not content.strip():
+        return ""
+    parser = lxml_html.HTMLParser(encoding=encoding)
+    root = lxml_html.document_fromstring(content, parser=parser)
+    return clean_markdown(_convert(extract_main_element(url, root)))
+
+
+CONVERTERS: dict[str, Callable[[str, bytes, str | None], str]] = {
+    "markdownify": markdownify_converter,
+    "lxml": lxml_converter,
+}
+
+
+def convert_html(url: str, content: bytes, encoding: str | None, converter: ConverterName) -> str:
+    """
+    Convert the main content of an HTML page to Markdown with the chosen backend.
+
+    Args:
+        url (str): URL of the page, used to choose the site layout.
+        content (bytes): Raw HTML.
+        encoding (str | None): Charset declared by the server, detected from the document if None.
+        converter (ConverterName): Backend to use.
+
+    Returns:
+        str: The Markdown.
+    """
+    return CONVERTERS[converter](url, content, encoding)
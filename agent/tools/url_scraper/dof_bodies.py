@@ -0,0 +1,80 @@
+import datetime
+from urllib.parse import parse_qs, urlparse
+from google.cloud import bigquery
+from loguru import logger
+
+
+class DofBodyStore:
+    """
+    Read access to the DOF note bodies ingested by the DOF pipeline (`pipelines/dof/bodies.py`), so
+    nota_detalle pages are read from BigQuery instead of the DOF site. The table is partitioned by
+    published_date and clustered by link: with the date of the note (the `fecha` parameter of its
+    URL) a lookup reads one partition, without it every partition is probed.
+    Each lookup is a BigQuery job (around a second), still cheaper than requesting the DOF site.
+    """
+
+    def __init__(self, table_id: str):
+        self.table_id = table_id
+        self._client: bigquery.Client | None = None
+
+    def handles(self, url: str) -> bool:
+        """
+        Tells if a URL is a DOF note that may be stored.
+        """
+        host = (urlparse(url).hostname or "").lower()
+        return (host == "dof.gob.mx" or host.endswith(".dof.gob.mx")) and "nota_detalle" in url
+
+    @staticmethod
+    def note_date(url: str) -> datetime.date | None:
+        """
+        Publication date of a DOF note, from the `fecha` parameter of its URL (dd/mm/yyyy).
+        """
+        values = parse_qs(urlparse(url).query).get("fecha")
+        if not values:
+            return None
+        try:
+            return datetime.datetime.strptime(values[0], "%d/%m/%Y").date()
+        except ValueError:
+            return None
+
+    def lookup(self, url: str, published_date: datetime.date | None = None) -> str | None:
+        """
+        Markdown body of a DOF note.
+
+        Args:
+            url (str): Link of the note, as stored by the pipeline.
+            published_date (datetime.date | None): Publication date of the note, it restricts the
+                lookup to one partition. Default: the date in the URL, if any.
+
+        Returns:
+            str | None: The body, or None if it is not stored (or the table cannot be read).
+        """
+        if not self.handles(url):
+            return None
+        if self._client is None:
+            self._client = bigquery.Client()
+
+        published_date = published_date or self.note_date(url)
+        # The pipeline stores links with the www host, the model may drop it
+        candidates = list(dict.fromkeys([url, url.replace("://dof.gob.mx", "://www.dof.gob.mx")]))
+        query_parameters = [bigquery.ArrayQueryParameter("links", "STRING", candidates)]
+        date_filter = ""
+        if published_date:
+            # Partition pruning, otherwise the link clusters of every partition are read
+            date_filter = "AND published_date = @published_date"
+            query_parameters.append(bigquery.ScalarQueryParameter("published_date", "DATE", published_date))
+        query = f"""
+            SELECT body_markdown
+            FROM `{self.table_id}`
+            WHERE link IN UNNEST(@links) {date_filter}
+            ORDER BY fetched_at DESC
+            LIMIT 1
+        """
+        job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+        try:
+            rows = list(self._client.query(query, job_config=job_config).result())
+        except Exception as e:
+            logger.warning(f"Could not read the DOF bodies table {self.table_id}: {e}")
+            return None
+
+        return rows[0]["body_markdown"] if rows else None
@@ -0,0 +1,323 @@
+from typing import Callable
+from urllib.parse import urlparse
+import asyncio
+import hashlib
+import time
+import httpx
+from loguru import logger
+from .schemas import UrlScraperOutput, CachedPage
+from .config import ScraperConfig
+from .cache import ScrapeCacheBackend, ttl_for_url, revalidation_headers
+from .converters import ConverterName, convert_html
+from .pagination import split_pages
+from .pdf import is_pdf, extract_pdf_pages, has_pdf_pages, parse_page_range, render_pdf_pages
+
+
+class DownloadLimitExceeded(ValueError):
+    """
+    Raised when a response is bigger than the configured download limit.
+    """
+
+
+class ScrapeEngine:
+    """
+    Async scraper with a connection pool shared by every scrape and a concurrency limit per host,
+    so several pages of the same site reuse their TLS connections without flooding it.
+
+    httpx clients and asyncio semaphores are bound to the event loop that created them, so they are
+    rebuilt if the engine is used from a different loop (e.g. successive `agent.run_sync` calls);
+    the previous client is closed so its connection pool is released. `aclose` closes the current
+    one on shutdown.
+
+    An optional `content_lookup` (url -> Markdown or None) is tried on cache misses before the site
+    is requested, e.g. the DOF note bodies ingested by the pipeline.
+    """
+
+    def __init__(
+        self,
+        config: ScraperConfig,
+        cache: ScrapeCacheBackend,
+        content_lookup: Callable[[str], str | None] | None = None,
+    ):
+        self.config = config
+        self.cache = cache
+        self.content_lookup = content_lookup
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            if self._client is not None:
+                self._close_previous_client(self._client, self._loop, loop)
+            self._loop = loop
+            self._host_semaphores = {}
+            self._client = httpx.AsyncClient(
+                headers={
+                    # Add a user-agent to avoid being blocked by some sites
+                    "User-Agent": self.config.USER_AGENT
+                },
+                timeout=self.config.REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=self.config.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.config.MAX_CONNECTIONS,
+                ),
+                follow_redirects=True,
+                # Verify=False to handle sites with bad certs (common in gov sites)
+                verify=False,
+            )
+        return self._client
+
+    @staticmethod
+    def _close_previous_client(
+        client: httpx.AsyncClient,
+        client_loop: asyncio.AbstractEventLoop | None,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """
+        Close the client of a previous event loop: in that loop if it still runs, otherwise from the
+        current one (its connections can only be dropped then, errors are ignored).
+        """
+
+        async def close() -> None:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Could not close the HTTP client of a previous event loop: {e}")
+
+        if client_loop is not None and client_loop.is_running() and not client_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(close(), client_loop)
+        else:
+            loop.create_task(close())
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP client of the current event loop (e.g. on application shutdown).
+        """
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = (urlparse(url).hostname or "").lower()
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(
+                self.config.MAX_CONCURRENT_REQUESTS_PER_HOST
+            )
+        return self._host_semaphores[host]
+
+    async def _read_capped(self, response: httpx.Response, max_bytes: int) -> bytes:
+        """
+        Read a streamed response body, aborting as soon as it exceeds max_bytes.
+        """
+        declared_size = int(response.headers.get("Content-Length") or 0)
+        if declared_size > max_bytes:
+            raise DownloadLimitExceeded(
+                f"Page declares {declared_size} bytes, more than the download limit of {max_bytes} bytes."
+            )
+
+        chunks = []
+        downloaded = 0
+        async for chunk in response.aiter_bytes():
+            downloaded += len(chunk)
+            if downloaded > max_bytes:
+                raise DownloadLimitExceeded(
+                    f"Page exceeds the download limit of {max_bytes} bytes, download aborted."
+                )
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _convert(
+        self,
+        url: str,
+        content: bytes,
+        content_type: str | None,
+        encoding: str | None,
+        converter: ConverterName,
+        page_range: str | None = None,
+        pdf_pages: list[str | None] | None = None,
+    ) -> tuple[str, list[str | None] | None]:
+        """
+        Convert a downloaded body: PDFs to the text of the pages in page_range (added to the pages
+        already extracted), HTML to Markdown.
+        """
+        started_at = time.perf_counter()
+        if is_pdf(content_type, content):
+            pdf_pages = extract_pdf_pages(content, page_range, pdf_pages)
+            logger.info(
+                f"Extracted pages {page_range or 'all'} of a {len(pdf_pages)} page PDF ({len(content)} bytes) in "
+                f"{time.perf_counter() - started_at:.2f}s: {url}"
+            )
+            return "", pdf_pages
+
+        markdown_content = convert_html(url, content, encoding, converter)
+        logger.info(
+            f"Converted {len(content)} bytes to {len(markdown_content)} Markdown characters with "
+            f"{converter} in {time.perf_counter() - started_at:.2f}s: {url}"
+        )
+        return markdown_content, None
+
+    async def _fetch(self, url: str, converter: ConverterName, page_range: str | None = None) -> CachedPage:
+        client = self._get_client()
+
+        cached_page = await asyncio.to_thread(self.cache.get, url, converter)
+        ttl = ttl_for_url(
+            url,
+            self.config.CACHE_HOST_TTL_SECONDS,
+            self.config.CACHE_DEFAULT_TTL_SECONDS,
+        )
+        # A cached PDF may lack the requested pages (only the requested ones are extracted)
+        missing_pages = (
+            cached_page is not None
+            and cached_page.pdf_pages is not None
+            and not has_pdf_pages(cached_page.pdf_pages, page_range)
+        )
+        if cached_page and not missing_pages and self.cache.is_fresh(cached_page, ttl):
+            logger.info(f"Serving URL from cache: {url}")
+            return cached_page
+
+        if cached_page is None and self.content_lookup is not None:
+            stored_content = await asyncio.to_thread(self.content_lookup, url)
+            if stored_content is not None:
+                logger.info(f"Serving URL from the stored content: {url}")
+                page = CachedPage(url=url, content=stored_content, fetched_at=time.time(), variant=converter)
+                await asyncio.to_thread(self.cache.put, page)
+                return page
+
+        # The body is needed to extract missing pages, a 304 would not bring it
+        headers = revalidation_headers(cached_page) if cached_page and not missing_pages else {}
+        async with self._host_semaphore(url):
+            logger.info(f"Scraping URL: {url}")
+            async with client.stream("GET", url, headers=headers) as response:
+                if cached_page and response.status_code == 304:
+                    logger.info(f"Cached page is still valid (304 Not Modified): {url}")
+                    cached_page.fetched_at = time.time()
+                    await asyncio.to_thread(self.cache.put, cached_page)
+                    return cached_page
+
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type")
+                max_bytes = (
+                    self.config.MAX_PDF_DOWNLOAD_BYTES
+                    if is_pdf(content_type)
+                    else self.config.MAX_DOWNLOAD_BYTES
+                )
+                content = await self._read_capped(response, max_bytes)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                encoding = response.charset_encoding
+
+        content_hash = hashlib.sha256(content).hexdigest()
+        unchanged = cached_page is not None and cached_page.content_hash == content_hash
+        if unchanged and not missing_pages:
+            # Servers without ETag/Last-Modified (most gov sites) still avoid a new conversion
+            logger.info(f"Content unchanged (same hash), reusing the cached conversion: {url}")
+            markdown_content, pdf_pages = cached_page.content, cached_page.pdf_pages
+        else:
+            # Conversion is CPU bound, keep it out of the event loop. Pages of the same PDF are kept
+            markdown_content, pdf_pages = await asyncio.to_thread(
+                self._convert,
+                url,
+                content,
+                content_type,
+                encoding,
+                converter,
+                page_range,
+                cached_page.pdf_pages if unchanged else None,
+            )
+
+        page = CachedPage(
+            url=url,
+            content=markdown_content,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+            variant=converter,
+            content_hash=content_hash,
+            pdf_pages=pdf_pages,
+        )
+        await asyncio.to_thread(self.cache.put, page)
+
+        logger.info(f"Successfully scraped and converted to Markdown: {url}")
+        return page
+
+    async def scrape(
+        self,
+        url: str,
+        page: int = 1,
+        converter: ConverterName | None = None,
+        page_range: str | None = None,
+    ) -> UrlScraperOutput:
+        """
+        Fetch a URL (or serve it from the cache), convert its main content to Markdown and return
+        one page of it. Errors are reported in the status of the output, never raised.
+
+        Args:
+            url (str): URL to scrape.
+            page (int): Page of the Markdown to return, starting at 1.
+            converter (ConverterName | None): HTML to Markdown backend, DEFAULT_CONVERTER if None.
+            page_range (str | None): For PDFs, pages of the document to extract ('N' or 'N-M').
+
+        Returns:
+            UrlScraperOutput: Markdown page, page count and status.
+        """
+        try:
+            cached_page = await self._fetch(url, converter or self.config.DEFAULT_CONVERTER, page_range)
+            content_type, pdf_total_pages = "html", None
+            markdown_content = cached_page.content
+            if cached_page.pdf_pages is not None:
+                content_type, pdf_total_pages = "pdf", len(cached_page.pdf_pages)
+                first, last = parse_page_range(page_range, pdf_total_pages)
+                markdown_content = render_pdf_pages(cached_page.pdf_pages, first, last)
+
+            pages = split_pages(markdown_content, self.config.PAGE_CHARS)
+            if page > len(pages):
+                return UrlScraperOutput(
+                    content="",
+                    url=url,
+                    status=f"error: Page {page} does not exist, the content has {len(pages)} pages.",
+                    page=page,
+                    total_pages=len(pages),
+                    content_type=content_type,
+                    pdf_total_pages=pdf_total_pages,
+                )
+            return UrlScraperOutput(
+                content=pages[page - 1],
+                url=url,
+                status="success",
+                page=page,
+                total_pages=len(pages),
+                content_type=content_type,
+                pdf_total_pages=pdf_total_pages,
+            )
+        except httpx.HTTPError as e:
+            error_msg = f"Error fetching URL: {str(e) or type(e).__name__}"
+        except ValueError as e:
+            # Download limit and invalid page ranges
+            error_msg = str(e)
+        except Exception as e:
+            error_msg = f"Unexpected error scraping URL: {str(e)}"
+
+        logger.error(f"{error_msg} ({url})")
+        return UrlScraperOutput(content="", url=url, status=f"error: {error_msg}", page=page, total_pages=0)
+
+    async def scrape_many(
+        self, urls: list[str], converter: ConverterName | None = None
+    ) -> list[UrlScraperOutput]:
+        """
+        Scrape several URLs concurrently and return the first page of each one. Repeated URLs are
+        fetched once.
+
+        Args:
+            urls (list[str]): URLs to scrape.
+            converter (ConverterName | None): HTML to Markdown backend, DEFAULT_CONVERTER if None.
+
+        Returns:
+            list[UrlScraperOutput]: One output per URL, in the same order.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        outputs = await asyncio.gather(*(self.scrape(url, converter=converter) for url in unique_urls))
+        output_by_url = dict(zip(unique_urls, outputs))
+        return [output_by_url[url] for url in urls]
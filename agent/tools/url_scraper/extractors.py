@@ -0,0 +1,115 @@
+from urllib.parse import urlparse
+import re
+from bs4 import BeautifulSoup, Tag
+from lxml import etree
+
+# Elements that never hold the content of a page
+BOILERPLATE_TAGS = [
+    "script", "style", "noscript", "iframe", "nav", "header", "footer", "aside", "button", "svg",
+]
+
+# CSS selectors of the main content, tried in order, per host (subdomains included)
+SITE_CONTENT_SELECTORS = {
+    # nota_detalle.php: the body of the note is rendered inside DivDetalleNota
+    "dof.gob.mx": ["#DivDetalleNota", "div.DivDetalleNota", "#cuerpo"],
+    # LeyesBiblio pages: laws, reforms and indexes are laid out in the central content block
+    "diputados.gob.mx": ["#contenido", "div.contenido", "#content", "#main"],
+}
+
+# Fallback selectors for hosts without a specific layout
+GENERIC_CONTENT_SELECTORS = ["main", "article", "[role=main]", "#content", "#contenido"]
+
+
+def _host_selectors(url: str) -> list[str]:
+    host = (urlparse(url).hostname or "").lower()
+    for configured_host, selectors in SITE_CONTENT_SELECTORS.items():
+        if host == configured_host or host.endswith(f".{configured_host}"):
+            return selectors
+    return []
+
+
+MIN_CONTENT_CHARS = 200
+
+# Simple selectors used above: tag, #id, tag.class, [attr=value]
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<tag>[a-zA-Z][a-zA-Z0-9]*)?(?:#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+)|\[(?P<attr>[\w-]+)=(?P<value>[\w-]+)\])?$"
+)
+
+
+def css_to_xpath(selector: str) -> str:
+    """
+    Translate the simple CSS selectors used by the extractors to XPath, for the lxml backend.
+
+    Args:
+        selector (str): A selector like 'main', '#id', 'div.class' or '[role=main]'.
+
+    Returns:
+        str: The equivalent XPath expression.
+    """
+    match = _SIMPLE_SELECTOR.match(selector)
+    if match is None:
+        raise ValueError(f"Unsupported selector: {selector}")
+
+    condition = ""
+    if match["id"]:
+        condition = f"[@id='{match['id']}']"
+    elif match["cls"]:
+        condition = f"[contains(concat(' ', normalize-space(@class), ' '), ' {match['cls']} ')]"
+    elif match["attr"]:
+        condition = f"[@{match['attr']}='{match['value']}']"
+    return f"//{match['tag'] or '*'}{condition}"
+
+
+def _has_text(node: Tag, min_chars: int = MIN_CONTENT_CHARS) -> bool:
+    return len(node.get_text(" ", strip=True)) >= min_chars
+
+
+def extract_main_element(url: str, root: etree._Element) -> etree._Element:
+    """
+    lxml counterpart of extract_main_content: same selectors and fallback, on a parsed tree.
+
+    Args:
+        url (str): URL of the page, used to choose the site layout.
+        root (etree._Element): Parsed HTML document.
+
+    Returns:
+        etree._Element: The element with the main content.
+    """
+    etree.strip_elements(root, *BOILERPLATE_TAGS, with_tail=False)
+
+    for selector in _host_selectors(url) + GENERIC_CONTENT_SELECTORS:
+        nodes = root.xpath(css_to_xpath(selector))
+        if nodes and len(" ".join(nodes[0].itertext()).strip()) >= MIN_CONTENT_CHARS:
+            return nodes[0]
+
+    body = root.find("body")
+    return body if body is not None else root
+
+
+def extract_main_content(url: str, html_content: str | bytes, encoding: str | None = None) -> str:
+    """
+    Keep only the main content of a page, dropping navigation, menus and other boilerplate.
+    Site specific selectors are tried first, then generic ones; if none of them matches an element
+    with enough text, the whole body (without boilerplate) is kept.
+
+    Args:
+        url (str): URL of the page, used to choose the site layout.
+        html_content (str | bytes): HTML of the page.
+        encoding (str | None): Encoding of html_content when it is bytes, detected if None.
+
+    Returns:
+        str: HTML of the main content.
+    """
+    if isinstance(html_content, bytes):
+        soup = BeautifulSoup(html_content, "html.parser", from_encoding=encoding)
+    else:
+        soup = BeautifulSoup(html_content, "html.parser")
+    for element in soup.find_all(BOILERPLATE_TAGS):
+        element.decompose()
+
+    for selector in _host_selectors(url) + GENERIC_CONTENT_SELECTORS:
+        node = soup.select_one(selector)
+        if node is not None and _has_text(node):
+            return str(node)
+
+    return str(soup.body or soup)
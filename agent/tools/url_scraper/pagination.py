@@ -0,0 +1,41 @@
+import re
+
+_BLANK_LINES = re.compile(r"\n[ \t]*(\n[ \t]*)+")
+_TRAILING_SPACES = re.compile(r"[ \t]+\n")
+
+
+def clean_markdown(markdown_content: str) -> str:
+    """
+    Remove trailing spaces and collapse runs of blank lines left by the HTML conversion.
+    """
+    markdown_content = _TRAILING_SPACES.sub("\n", markdown_content)
+    return _BLANK_LINES.sub("\n\n", markdown_content).strip()
+
+
+def split_pages(markdown_content: str, page_chars: int) -> list[str]:
+    """
+    Split Markdown in pages of at most page_chars characters. Pages end at a paragraph break when
+    possible, then at a line break, and only cut a line when it is longer than a page.
+
+    Args:
+        markdown_content (str): The Markdown to split.
+        page_chars (int): Maximum characters per page.
+
+    Returns:
+        list[str]: The pages, at least one (empty if the content is empty).
+    """
+    pages = []
+    start = 0
+    while len(markdown_content) - start > page_chars:
+        end = start + page_chars
+        for separator in ("\n\n", "\n"):
+            cut = markdown_content.rfind(separator, start, end)
+            # Avoid tiny pages when the only break is close to the start
+            if cut > start + page_chars // 2:
+                end = cut
+                break
+        pages.append(markdown_content[start:end].strip())
+        start = end
+
+    pages.append(markdown_content[start:].strip())
+    return pages
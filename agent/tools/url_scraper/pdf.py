@@ -0,0 +1,92 @@
+from io import BytesIO
+import re
+from loguru import logger
+from pypdf import PdfReader
+
+PDF_MAGIC = b"%PDF-"
+_PAGE_RANGE = re.compile(r"^\s*(\d+)\s*(?:-\s*(\d+)\s*)?$")
+
+
+def is_pdf(content_type: str | None, content: bytes = b"") -> bool:
+    """
+    Tells if a response is a PDF, by its Content-Type or, for servers that send a generic type
+    (e.g. application/octet-stream), by the magic bytes of the body.
+    """
+    if content_type and "application/pdf" in content_type.lower():
+        return True
+    return content.startswith(PDF_MAGIC)
+
+
+def extract_pdf_pages(
+    content: bytes, page_range: str | None = None, pages: list[str | None] | None = None
+) -> list[str | None]:
+    """
+    Extract the text of the pages of a PDF in `page_range`, so a request for a few pages of a
+    long code does not parse the whole document. Pages are parsed one at a time, a page that
+    cannot be parsed is kept empty so the numbering of the rest does not change.
+
+    Args:
+        content (bytes): The PDF.
+        page_range (str | None): Pages to extract ('N' or 'N-M'), every page if None.
+        pages (list[str | None] | None): Pages already extracted from the same PDF, kept as they are.
+
+    Returns:
+        list[str | None]: Text per page (index 0 is page 1), None for the pages not extracted.
+    """
+    reader = PdfReader(BytesIO(content))
+    total_pages = len(reader.pages)
+    first, last = parse_page_range(page_range, total_pages)
+    extracted = list(pages) if pages is not None and len(pages) == total_pages else [None] * total_pages
+    for number in range(first, last + 1):
+        if extracted[number - 1] is not None:
+            continue
+        try:
+            extracted[number - 1] = (reader.pages[number - 1].extract_text() or "").strip()
+        except Exception as e:
+            logger.warning(f"Could not extract the text of PDF page {number}: {e}")
+            extracted[number - 1] = ""
+    return extracted
+
+
+def has_pdf_pages(pages: list[str | None], page_range: str | None) -> bool:
+    """
+    Tells if every page of a range was already extracted.
+    """
+    first, last = parse_page_range(page_range, len(pages))
+    return all(text is not None for text in pages[first - 1 : last])
+
+
+def parse_page_range(page_range: str | None, total_pages: int) -> tuple[int, int]:
+    """
+    Parse a page range like '5' or '5-12' (1-based, inclusive). The end is clamped to the last page.
+
+    Args:
+        page_range (str | None): The range, None means the whole document.
+        total_pages (int): Pages of the PDF.
+
+    Returns:
+        tuple[int, int]: First and last page.
+    """
+    if not page_range:
+        return 1, total_pages
+
+    match = _PAGE_RANGE.match(page_range)
+    if match is None:
+        raise ValueError(f"Invalid page range '{page_range}', use 'N' or 'N-M'.")
+
+    first = int(match[1])
+    last = int(match[2]) if match[2] else first
+    if first < 1 or first > last:
+        raise ValueError(f"Invalid page range '{page_range}', pages start at 1 and N must be <= M.")
+    if first > total_pages:
+        raise ValueError(f"Page {first} does not exist, the PDF has {total_pages} pages.")
+    return first, min(last, total_pages)
+
+
+def render_pdf_pages(pages: list[str], first: int, last: int) -> str:
+    """
+    Markdown of a range of PDF pages, each one under a 'Página N' heading so it can be cited.
+    """
+    return "\n\n".join(
+        f"## Página {number}\n\n{pages[number - 1]}" for number in range(first, last + 1)
+    )
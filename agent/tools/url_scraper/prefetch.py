@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import RLock, Thread
+import asyncio
+import pyarrow
+import pyarrow.compute as pc
+from loguru import logger
+from .engine import ScrapeEngine
+
+URL_PREFIXES = ("http://", "https://")
+# Share of the sampled values that must be URLs for a column to be a URL column
+URL_COLUMN_MIN_SHARE = 0.8
+URL_COLUMN_SAMPLE_ROWS = 50
+# Runs whose budget is remembered, older ones are forgotten
+MAX_TRACKED_RUNS = 256
+
+
+def find_url_columns(table: pyarrow.Table) -> list[str]:
+    """
+    Text columns whose values are URLs, judged on a sample of their first non null values.
+
+    Args:
+        table (pyarrow.Table): Results of a query.
+
+    Returns:
+        list[str]: Names of the URL columns.
+    """
+    url_columns = []
+    for name, column in zip(table.column_names, table.columns):
+        if not (pyarrow.types.is_string(column.type) or pyarrow.types.is_large_string(column.type)):
+            continue
+        sample = column.drop_null().slice(0, URL_COLUMN_SAMPLE_ROWS)
+        if len(sample) == 0:
+            continue
+        is_url = pc.or_(
+            pc.starts_with(sample, URL_PREFIXES[0]), pc.starts_with(sample, URL_PREFIXES[1])
+        )
+        if pc.sum(is_url).as_py() / len(sample) >= URL_COLUMN_MIN_SHARE:
+            url_columns.append(name)
+    return url_columns
+
+
+def extract_urls(table: pyarrow.Table, max_urls: int) -> list[str]:
+    """
+    Distinct URLs of the URL columns of a table, in row order.
+
+    Args:
+        table (pyarrow.Table): Results of a query.
+        max_urls (int): Maximum number of URLs returned.
+
+    Returns:
+        list[str]: The URLs.
+    """
+    urls: dict[str, None] = {}
+    for name in find_url_columns(table):
+        for value in table.column(name).to_pylist():
+            if len(urls) >= max_urls:
+                return list(urls)
+            if value and value.startswith(URL_PREFIXES):
+                urls[value] = None
+    return list(urls)
+
+
+class UrlPrefetcher:
+    """
+    Warms the scrape cache in the background with the URLs returned by queries, so the scrape the
+    model issues a few seconds later is served locally.
+
+    It runs its own event loop in a daemon thread (query tools run in worker threads) with its own
+    engine, which shares the cache with the engine of the tools. Concurrency is bounded and every
+    agent run has a budget of prefetched URLs.
+    """
+
+    def __init__(self, engine: ScrapeEngine, max_concurrency: int, urls_per_run: int):
+        self.engine = engine
+        self.max_concurrency = max_concurrency
+        self.urls_per_run = urls_per_run
+        # Reentrant: a future that is already done runs its callback in the submitting thread
+        self._lock = RLock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._in_flight: dict[str, Future] = {}
+        self._budgets: OrderedDict[str, int] = OrderedDict()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the background loop on first use. Caller holds the lock.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            Thread(target=self._loop.run_forever, name="url-prefetcher", daemon=True).start()
+        return self._loop
+
+    def _take_budget(self, run_id: str, requested: int) -> int:
+        """
+        Reserve up to `requested` URLs of the budget of a run. Caller holds the lock.
+        """
+        remaining = self._budgets.pop(run_id, self.urls_per_run)
+        granted = min(remaining, requested)
+        self._budgets[run_id] = remaining - granted
+        while len(self._budgets) > MAX_TRACKED_RUNS:
+            self._budgets.popitem(last=False)
+        return granted
+
+    async def _prefetch(self, url: str) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            output = await self.engine.scrape(url)
+        logger.debug(f"Prefetched {url}: {output.status}")
+
+    def _done(self, url: str) -> None:
+        with self._lock:
+            self._in_flight.pop(url, None)
+
+    def submit(self, run_id: str, urls: list[str]) -> int:
+        """
+        Schedule the prefetch of URLs that are not already being prefetched, within the budget of the run.
+
+        Args:
+            run_id (str): Identifier of the agent run that produced the URLs.
+            urls (list[str]): URLs to warm.
+
+        Returns:
+            int: Number of URLs scheduled.
+        """
+        with self._lock:
+            pending = [url for url in dict.fromkeys(urls) if url not in self._in_flight]
+            pending = pending[: self._take_budget(run_id, len(pending))]
+            if not pending:
+                return 0
+
+            loop = self._ensure_loop()
+            for url in pending:
+                future = asyncio.run_coroutine_threadsafe(self._prefetch(url), loop)
+                self._in_flight[url] = future
+                future.add_done_callback(lambda _, url=url: self._done(url))
+
+        logger.info(f"Prefetching {len(pending)} URLs for run {run_id}")
+        return len(pending)
+
+    async def wait(self, url: str, timeout: float) -> None:
+        """
+        Wait (at most `timeout` seconds) for an in-flight prefetch of the URL, so a scrape issued
+        while it is running reuses it instead of downloading the page again.
+        """
+        with self._lock:
+            future = self._in_flight.get(url)
+        if future is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        except Exception as e:
+            logger.debug(f"Not waiting for the prefetch of {url}: {type(e).__name__}")
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Annotated
+from typing import Annotated, Literal, Optional
 
 class UrlScraperInput(BaseModel):
     url: Annotated[
@@ -9,6 +9,30 @@ class UrlScraperInput(BaseModel):
             examples=["https://www.example.com", "https://dof.gob.mx/nota_detalle.php?codigo=5777376"]
         )
     ]
+    page: Annotated[
+        int,
+        Field(
+            default=1,
+            description="Page of the Markdown to return, starting at 1. Long pages are split; use total_pages of a previous call to request the next ones.",
+            ge=1,
+        )
+    ]
+    converter: Annotated[
+        Optional[Literal["markdownify", "lxml"]],
+        Field(
+            default=None,
+            description="HTML to Markdown backend. 'lxml' is several times faster on very large pages (e.g. DOF notes with annex tables). Defaults to the configured one.",
+        )
+    ]
+    page_range: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Only for PDFs: pages of the document to extract, e.g. '12' or '12-15'. Use it to read the relevant pages of long laws instead of the whole document.",
+            pattern=r"^\s*\d+\s*(-\s*\d+\s*)?$",
+            examples=["12", "12-15"],
+        )
+    ]
 
 class UrlScraperOutput(BaseModel):
     content: Annotated[
@@ -29,3 +53,93 @@ class UrlScraperOutput(BaseModel):
             description="Processing status, e.g., 'success' or an error message."
         )
     ]
+    page: Annotated[
+        int,
+        Field(
+            default=1,
+            description="Page of the Markdown returned in content."
+        )
+    ]
+    total_pages: Annotated[
+        int,
+        Field(
+            default=1,
+            description="Total pages of the Markdown of the URL."
+        )
+    ]
+    content_type: Annotated[
+        Literal["html", "pdf"],
+        Field(
+            default="html",
+            description="Kind of document scraped. PDF content has a 'Página N' heading per page of the document."
+        )
+    ]
+    pdf_total_pages: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            description="Pages of the PDF document (not of the Markdown), to choose a page_range."
+        )
+    ]
+
+
+class UrlScraperBatchInput(BaseModel):
+    urls: Annotated[
+        list[str],
+        Field(
+            description="The full URLs of the webpages to scrape and convert to Markdown. They are fetched in parallel.",
+            min_length=1,
+            examples=[["https://dof.gob.mx/nota_detalle.php?codigo=5777376", "https://dof.gob.mx/nota_detalle.php?codigo=5777377"]]
+        )
+    ]
+    converter: Annotated[
+        Optional[Literal["markdownify", "lxml"]],
+        Field(
+            default=None,
+            description="HTML to Markdown backend used for every URL, see UrlScraperInput.converter.",
+        )
+    ]
+
+
+class UrlScraperBatchOutput(BaseModel):
+    results: Annotated[
+        list[UrlScraperOutput],
+        Field(
+            description="One result per requested URL, in the same order. Each one has its own status."
+        )
+    ]
+
+
+class CachedPage(BaseModel):
+    url: Annotated[str, Field(description="The URL of the page.")]
+    content: Annotated[
+        str,
+        Field(description="The content of the page converted to Markdown."),
+    ]
+    etag: Annotated[
+        Optional[str],
+        Field(default=None, description="ETag header of the response, used to revalidate."),
+    ]
+    last_modified: Annotated[
+        Optional[str],
+        Field(default=None, description="Last-Modified header of the response, used to revalidate."),
+    ]
+    fetched_at: Annotated[
+        float,
+        Field(description="Unix timestamp of the last time the page was fetched or revalidated."),
+    ]
+    variant: Annotated[
+        str,
+        Field(default="", description="Conversion the content comes from (e.g. the converter), part of the cache key."),
+    ]
+    content_hash: Annotated[
+        Optional[str],
+        Field(default=None, description="SHA-256 of the downloaded body, a refetch with the same hash reuses the conversion."),
+    ]
+    pdf_pages: Annotated[
+        Optional[list[Optional[str]]],
+        Field(
+            default=None,
+            description="Text per page when the URL is a PDF (content is empty then), None for the pages not extracted yet.",
+        ),
+    ]
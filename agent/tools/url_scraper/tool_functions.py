@@ -1,17 +1,62 @@
 from pydantic_ai import RunContext
 from loguru import logger
-import requests
-import urllib3
-from markdownify import markdownify as md
-from .schemas import UrlScraperInput, UrlScraperOutput
+import asyncio
+import pyarrow
+from .schemas import (
+    UrlScraperInput,
+    UrlScraperOutput,
+    UrlScraperBatchInput,
+    UrlScraperBatchOutput,
+)
+from .config import ScraperConfig
+from .cache import DiskScrapeCache
+from .engine import ScrapeEngine
+from .prefetch import UrlPrefetcher, extract_urls
+from .dof_bodies import DofBodyStore
 
-# Suppress only the single InsecureRequestWarning from urllib3 needed
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+scraper_config = ScraperConfig()
+scrape_cache = DiskScrapeCache(
+    cache_dir=scraper_config.CACHE_DIR,
+    max_bytes=scraper_config.CACHE_MAX_BYTES,
+)
+dof_body_lookup = (
+    DofBodyStore(scraper_config.DOF_BODIES_TABLE).lookup if scraper_config.DOF_BODIES_TABLE else None
+)
+scrape_engine = ScrapeEngine(config=scraper_config, cache=scrape_cache, content_lookup=dof_body_lookup)
+url_prefetcher = UrlPrefetcher(
+    # Own engine: its client lives in the prefetcher loop, the cache is shared
+    engine=ScrapeEngine(config=scraper_config, cache=scrape_cache, content_lookup=dof_body_lookup),
+    max_concurrency=scraper_config.PREFETCH_MAX_CONCURRENCY,
+    urls_per_run=scraper_config.PREFETCH_URLS_PER_RUN,
+)
 
 
-def scrape_and_convert_to_markdown(ctx: RunContext, input_data: UrlScraperInput) -> UrlScraperOutput:
+def prefetch_urls_from_results(run_id: str, results_table: pyarrow.Table) -> int:
     """
-    Fetches the content of a given URL and converts it to Markdown.
+    Warm the scrape cache in the background with the URLs found in a query result.
+
+    Args:
+        run_id (str): Identifier of the agent run that executed the query.
+        results_table (pyarrow.Table): Results of the query.
+
+    Returns:
+        int: Number of URLs scheduled.
+    """
+    if not scraper_config.PREFETCH_ENABLED or not scraper_config.PREFETCH_URLS_PER_RUN:
+        return 0
+    urls = extract_urls(results_table, scraper_config.PREFETCH_URLS_PER_RUN)
+    return url_prefetcher.submit(run_id, urls) if urls else 0
+
+
+async def scrape_and_convert_to_markdown(ctx: RunContext, input_data: UrlScraperInput) -> UrlScraperOutput:
+    """
+    Fetches the content of a given URL and converts its main content (without menus and other
+    boilerplate) to Markdown. Long content is split in pages: the output tells the total pages and
+    later pages are requested with the page field.
+    PDFs (e.g. federal laws) are returned as text with a 'Página N' heading per page; use page_range
+    to read only the relevant pages of long documents.
+    Converted pages are cached: fresh entries are served locally and stale ones are revalidated
+    with ETag / Last-Modified.
 
     Args:
         ctx: The context of the agent run.
@@ -20,47 +65,41 @@ def scrape_and_convert_to_markdown(ctx: RunContext, input_data: UrlScraperInput)
     Returns:
         A UrlScraperOutput object containing the Markdown content and status.
     """
-    url = input_data.url
-    try:
-        logger.info(f"Scraping URL: {url}")
-        
-        # Add a user-agent to avoid being blocked by some sites
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        # Verify=False to handle sites with bad certs (common in gov sites)
-        response = requests.get(url, headers=headers, timeout=10, verify=False)
-        response.raise_for_status()
-        
-        html_content = response.text
-        markdown_content = md(html_content, heading_style="ATX", strip=['script', 'style'])
-        
-        # Truncate content if it's too long? 
-        # For now, let's keep it whole, but maybe add a warning if it's huge in log.
-        if len(markdown_content) > 20000:
-             logger.warning(f"Scraped content is very large: {len(markdown_content)} characters.")
+    await url_prefetcher.wait(input_data.url, scraper_config.PREFETCH_WAIT_SECONDS)
+    return await scrape_engine.scrape(
+        input_data.url, input_data.page, input_data.converter, input_data.page_range
+    )
 
-        logger.info("Successfully scraped and converted to Markdown.")
-        return UrlScraperOutput(
-            content=markdown_content,
-            url=url,
-            status="success"
-        )
 
-    except requests.exceptions.RequestException as e:
-        error_msg = f"Error fetching URL: {str(e)}"
-        logger.error(error_msg)
-        return UrlScraperOutput(
-            content="",
-            url=url,
-            status=f"error: {error_msg}"
-        )
-    except Exception as e:
-        error_msg = f"Unexpected error scraping URL: {str(e)}"
-        logger.error(error_msg)
-        return UrlScraperOutput(
+async def scrape_urls(ctx: RunContext, input_data: UrlScraperBatchInput) -> UrlScraperBatchOutput:
+    """
+    Fetches several URLs in parallel and converts each one to Markdown, returning the first page
+    of each. Use it instead of several scrape_and_convert_to_markdown calls when more than one page
+    is needed, e.g. all the DOF links returned by a query; request later pages of a URL with
+    scrape_and_convert_to_markdown.
+
+    Args:
+        ctx: The context of the agent run.
+        input_data: The input data containing the URLs to scrape.
+
+    Returns:
+        A UrlScraperBatchOutput object with the Markdown content and status of every URL.
+    """
+    urls = input_data.urls
+    max_urls = scraper_config.MAX_URLS_PER_CALL
+    if len(urls) > max_urls:
+        logger.warning(f"Received {len(urls)} URLs, only the first {max_urls} are scraped.")
+
+    await asyncio.gather(
+        *(url_prefetcher.wait(url, scraper_config.PREFETCH_WAIT_SECONDS) for url in urls[:max_urls])
+    )
+    results = await scrape_engine.scrape_many(urls[:max_urls], input_data.converter)
+    results.extend(
+        UrlScraperOutput(
             content="",
             url=url,
-            status=f"error: {error_msg}"
+            status=f"error: Only {max_urls} URLs are scraped per call, request this one again.",
         )
+        for url in urls[max_urls:]
+    )
+    return UrlScraperBatchOutput(results=results)
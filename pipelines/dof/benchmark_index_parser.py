@@ -0,0 +1,83 @@
+"""
+Benchmark of the DOF index parsers over the synthetic index pages in fixtures/index_pages:
+
+    - html.parser: full BeautifulSoup tree with the pure Python parser (reference output)
+    - strainer: html.parser building only the section headers and links (SoupStrainer)
+    - lxml: libxml2 tree and a single XPath query
+
+Every parser must return exactly the same news as the reference for every page, otherwise the
+benchmark fails. It reports the pages per second of each parser (best of `repeat` runs).
+
+Usage:
+    uv run --group dof_pipeline -m pipelines.dof.benchmark_index_parser --repeat 20
+"""
+
+import argparse
+import time
+from pathlib import Path
+from .index_parser import INDEX_PARSERS
+
+REFERENCE_PARSER = "html.parser"
+PAGES_DIR = Path(__file__).parent / "fixtures" / "index_pages"
+
+
+def run_benchmark(pages_dir: Path, repeat: int) -> list[dict]:
+    """
+    Parse every saved page with every parser and check that they all match the reference.
+
+    Args:
+        pages_dir (Path): Directory with the saved index pages (*.html), named YYYY-MM-DD.html.
+        repeat (int): Runs over the whole set per parser, the best time is kept.
+
+    Returns:
+        list[dict]: One dictionary of metrics per parser.
+    """
+    pages = sorted(pages_dir.glob("*.html"))
+    if not pages:
+        raise ValueError(f"No saved index pages (*.html) found in {pages_dir}")
+    contents = [(path.name, path.read_bytes(), "/".join(reversed(path.stem.split("-")))) for path in pages]
+
+    reference = {name: INDEX_PARSERS[REFERENCE_PARSER](content, date_str) for name, content, date_str in contents}
+
+    metrics = []
+    for parser_name, parser in INDEX_PARSERS.items():
+        for name, content, date_str in contents:
+            if parser(content, date_str) != reference[name]:
+                raise AssertionError(f"{parser_name} output differs from {REFERENCE_PARSER} for {name}")
+
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _, content, date_str in contents:
+                parser(content, date_str)
+            best = min(best, time.perf_counter() - start)
+
+        metrics.append(
+            {
+                "parser": parser_name,
+                "pages": len(contents),
+                "news": sum(len(news) for news in reference.values()),
+                "seconds": best,
+                "pages_per_second": len(contents) / best if best else float("inf"),
+            }
+        )
+
+    reference_seconds = metrics[0]["seconds"]
+    for run in metrics:
+        run["speedup"] = reference_seconds / run["seconds"] if run["seconds"] else float("inf")
+    return metrics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the DOF index parsers.")
+    parser.add_argument("--pages-dir", type=Path, default=PAGES_DIR, help="Directory with saved index pages")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs over the whole set per parser")
+    args = parser.parse_args()
+
+    print(f"{'parser':<12} {'pages':>6} {'news':>6} {'seconds':>9} {'pages/s':>9} {'speedup':>8}")
+    for run in run_benchmark(args.pages_dir, args.repeat):
+        print(
+            f"{run['parser']:<12} {run['pages']:>6} {run['news']:>6} {run['seconds']:>9.4f} "
+            f"{run['pages_per_second']:>9.1f} {run['speedup']:>8.1f}"
+        )
+    print("All parsers returned the same news as the reference.")
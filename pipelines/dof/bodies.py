@@ -0,0 +1,109 @@
+import concurrent.futures
+import datetime
+import hashlib
+import re
+import sys
+from typing import List, Dict, Optional, Tuple
+import urllib3
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+from .config import settings
+from .scraper import rate_limiter, session
+
+# Disable SSL warnings when importing the module
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Elements that never hold the content of a note
+BOILERPLATE_TAGS = ["script", "style", "noscript", "iframe", "nav", "header", "footer", "aside", "button"]
+# The body of a note is rendered inside DivDetalleNota
+NOTE_SELECTORS = ["#DivDetalleNota", "div.DivDetalleNota", "#cuerpo"]
+
+_BLANK_LINES = re.compile(r"\n[ \t]*(\n[ \t]*)+")
+_TRAILING_SPACES = re.compile(r"[ \t]+\n")
+
+
+def note_to_markdown(html_content: bytes) -> str:
+    """
+    Converts the body of a nota_detalle page to clean Markdown, without menus and other boilerplate.
+
+    Args:
+        html_content (bytes): The HTML of the page.
+
+    Returns:
+        str: The Markdown of the note.
+    """
+    soup = BeautifulSoup(html_content, 'html.parser')
+    for element in soup.find_all(BOILERPLATE_TAGS):
+        element.decompose()
+
+    node = None
+    for selector in NOTE_SELECTORS:
+        node = soup.select_one(selector)
+        if node is not None:
+            break
+    if node is None:
+        node = soup.body or soup
+
+    markdown_content = md(str(node), heading_style="ATX")
+    markdown_content = _TRAILING_SPACES.sub("\n", markdown_content)
+    return _BLANK_LINES.sub("\n\n", markdown_content).strip()
+
+
+def fetch_note_body(link: str) -> Optional[str]:
+    """
+    Fetches a nota_detalle page and converts it to Markdown.
+
+    Args:
+        link (str): URL of the note.
+
+    Returns:
+        Optional[str]: The Markdown of the note, None if it could not be fetched.
+    """
+    try:
+        rate_limiter.acquire()
+        response = session.get(link, timeout=settings.BODY_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return note_to_markdown(response.content)
+    except Exception as e:
+        print(f"Error fetching DOF note {link}: {e}", file=sys.stderr)
+        return None
+
+
+def scrape_note_bodies(
+    news_items: List[Dict], skip_links: Optional[set] = None
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Fetches the body of every note of the index, converted to Markdown with its content hash.
+    Notes are fetched concurrently (MAX_WORKERS) under the shared rate limiter.
+
+    Args:
+        news_items (List[Dict]): Rows already transformed for BigQuery (published_date, section, title, link).
+        skip_links (Optional[set]): Links whose body is already stored.
+
+    Returns:
+        Tuple[List[Dict], List[Dict]]: Rows for the bodies table, and the index rows of the notes
+        whose body could not be fetched.
+    """
+    skip_links = skip_links or set()
+    pending = {}
+    for item in news_items:
+        link = item["link"]
+        if link and link not in skip_links and link not in pending and "nota_detalle" in link:
+            pending[link] = item
+
+    bodies, failed = [], []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
+        for item, body in zip(pending.values(), executor.map(fetch_note_body, pending)):
+            if body is None:
+                failed.append(item)
+                continue
+            bodies.append({
+                "published_date": item["published_date"],
+                "link": item["link"],
+                "body_markdown": body,
+                "content_hash": hashlib.sha256(body.encode()).hexdigest(),
+                "fetched_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            })
+
+    return bodies, failed
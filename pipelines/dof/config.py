@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic_settings import BaseSettings
 
 class DofConfig(BaseSettings):
@@ -6,5 +7,33 @@ class DofConfig(BaseSettings):
     TABLE_NAME: str = "dof"
     DOF_BASE_URL: str = "https://www.dof.gob.mx/index.php"
     DOF_BASE_HOST: str = "https://www.dof.gob.mx"
+    # Parser of the index pages, lxml is the fastest (see benchmark_index_parser.py)
+    INDEX_PARSER: Literal["html.parser", "strainer", "lxml"] = "lxml"
+    # Incremental mode: dates after the last ingested published_date, at most INCREMENTAL_MAX_DAYS per run
+    INCREMENTAL_MAX_DAYS: int = 31
+    # Rows are loaded into a temporary staging table and merged on (published_date, link)
+    STAGING_TABLE_EXPIRATION_HOURS: int = 6
+    # Loads are sent as Parquet files with this compression codec
+    PARQUET_COMPRESSION: Literal["zstd", "snappy", "gzip"] = "zstd"
+    # Note counts per date, section, authority and document type, refreshed after every load
+    STATS_TABLE_NAME: str = "dof_stats"
+    # Backfill mode: the range is processed in monthly chunks, each one loaded and checkpointed
+    BACKFILL_CHECKPOINT_TABLE_NAME: str = "dof_backfill_checkpoints"
+    # Stop starting chunks after this time, below the function timeout, the next call resumes
+    BACKFILL_MAX_SECONDS: int = 3300
+    # Concurrency and politeness towards dof.gob.mx
+    MAX_WORKERS: int = 8
+    REQUESTS_PER_SECOND: float = 4.0
+    RATE_LIMIT_BURST: int = 4
+    # Retries of the HTTP session and rounds over the dates that still failed
+    RETRY_TOTAL: int = 5
+    RETRY_BACKOFF_FACTOR: float = 1.0
+    FAILED_DATES_RETRY_ROUNDS: int = 2
+    FAILED_DATES_TABLE_NAME: str = "dof_failed_dates"
+    # Note bodies (nota_detalle pages converted to Markdown)
+    INGEST_BODIES: bool = True
+    BODIES_TABLE_NAME: str = "dof_bodies"
+    BODY_REQUEST_TIMEOUT: int = 60
+    FAILED_BODIES_TABLE_NAME: str = "dof_failed_bodies"
 
 settings = DofConfig()
@@ -0,0 +1,214 @@
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+# Acronym of the issuing authority, by keyword of the (accent free, upper case) section name.
+# The first keyword found wins, so the more specific ones go first.
+AUTHORITY_KEYWORDS = [
+    # Ministries are anchored on their full name, "MUJERES" alone would also match INMUJERES
+    ("SECRETARIA DE HACIENDA Y CREDITO PUBLICO", "SHCP"),
+    ("SECRETARIA DE GOBERNACION", "SEGOB"),
+    ("SECRETARIA DE RELACIONES EXTERIORES", "SRE"),
+    ("SECRETARIA DE LA DEFENSA NACIONAL", "SEDENA"),
+    ("SECRETARIA DE MARINA", "SEMAR"),
+    ("SECRETARIA DE SEGURIDAD Y PROTECCION CIUDADANA", "SSPC"),
+    ("SECRETARIA DE BIENESTAR", "BIENESTAR"),
+    ("SECRETARIA DEL BIENESTAR", "BIENESTAR"),
+    ("SECRETARIA DE MEDIO AMBIENTE Y RECURSOS NATURALES", "SEMARNAT"),
+    ("SECRETARIA DE ENERGIA", "SENER"),
+    ("SECRETARIA DE ECONOMIA", "SE"),
+    ("SECRETARIA DE AGRICULTURA", "SADER"),
+    ("SECRETARIA DE INFRAESTRUCTURA, COMUNICACIONES Y TRANSPORTES", "SICT"),
+    ("SECRETARIA DE COMUNICACIONES Y TRANSPORTES", "SICT"),
+    ("SECRETARIA DE LA FUNCION PUBLICA", "SFP"),
+    ("SECRETARIA ANTICORRUPCION Y BUEN GOBIERNO", "SABG"),
+    ("SECRETARIA DE EDUCACION PUBLICA", "SEP"),
+    ("SECRETARIA DE CIENCIA, HUMANIDADES, TECNOLOGIA E INNOVACION", "SECIHTI"),
+    ("SECRETARIA DE SALUD", "SSA"),
+    ("SECRETARIA DEL TRABAJO Y PREVISION SOCIAL", "STPS"),
+    ("SECRETARIA DE DESARROLLO AGRARIO, TERRITORIAL Y URBANO", "SEDATU"),
+    ("SECRETARIA DE CULTURA", "CULTURA"),
+    ("SECRETARIA DE TURISMO", "SECTUR"),
+    ("SECRETARIA DE LAS MUJERES", "SEMUJERES"),
+    ("INSTITUTO NACIONAL DE LAS MUJERES", "INMUJERES"),
+    ("CONSEJERIA JURIDICA", "CJEF"),
+    ("SUPREMA CORTE DE JUSTICIA", "SCJN"),
+    ("CONSEJO DE LA JUDICATURA FEDERAL", "CJF"),
+    ("TRIBUNAL ELECTORAL", "TEPJF"),
+    ("BANCO DE MEXICO", "BANXICO"),
+    ("INSTITUTO NACIONAL ELECTORAL", "INE"),
+    ("INSTITUTO NACIONAL DE ESTADISTICA Y GEOGRAFIA", "INEGI"),
+    ("COMISION NACIONAL DE LOS DERECHOS HUMANOS", "CNDH"),
+    ("INSTITUTO MEXICANO DEL SEGURO SOCIAL", "IMSS"),
+    ("INSTITUTO DE SEGURIDAD Y SERVICIOS SOCIALES DE LOS TRABAJADORES DEL ESTADO", "ISSSTE"),
+    ("COMISION FEDERAL DE ELECTRICIDAD", "CFE"),
+    ("PETROLEOS MEXICANOS", "PEMEX"),
+    ("COMISION NACIONAL BANCARIA Y DE VALORES", "CNBV"),
+    ("COMISION FEDERAL DE COMPETENCIA ECONOMICA", "COFECE"),
+    ("INSTITUTO FEDERAL DE TELECOMUNICACIONES", "IFT"),
+    ("COMISION REGULADORA DE ENERGIA", "CRE"),
+    ("FISCALIA GENERAL DE LA REPUBLICA", "FGR"),
+    ("CONSEJO DE SALUBRIDAD GENERAL", "CSG"),
+    ("TRIBUNAL FEDERAL DE JUSTICIA ADMINISTRATIVA", "TFJA"),
+    ("AVISOS JUDICIALES", "AVISOS"),
+    ("CONVOCATORIAS PARA CONCURSOS", "CONVOCATORIAS"),
+]
+
+# Document type by the first words of the (accent free, lower case) title
+DOCUMENT_TYPE_PREFIXES = [
+    ("proyecto de norma oficial mexicana", "proy-nom"),
+    ("norma oficial mexicana", "nom"),
+    ("norma mexicana", "nmx"),
+    ("decreto", "decreto"),
+    ("acuerdo", "acuerdo"),
+    ("aviso", "aviso"),
+    ("convocatoria", "convocatoria"),
+    ("resolucion", "resolucion"),
+    ("circular", "circular"),
+    ("lineamientos", "lineamientos"),
+    ("reglas", "reglas"),
+    ("reglamento", "reglamento"),
+    ("convenio", "convenio"),
+    ("contrato", "contrato"),
+    ("extracto", "extracto"),
+    ("sentencia", "sentencia"),
+    ("edicto", "edicto"),
+    ("declaratoria", "declaratoria"),
+    ("estatuto", "estatuto"),
+    ("manual", "manual"),
+    ("programa", "programa"),
+    ("tasas de interes", "indicador"),
+    ("tipo de cambio", "indicador"),
+    ("valor de la unidad de inversion", "indicador"),
+    ("indice nacional de precios", "indicador"),
+]
+OTHER_DOCUMENT_TYPE = "otro"
+
+# Name of a law: its kind followed by capitalized words and the connectors between them
+_LAW = re.compile(
+    r"\b(?:Ley|Código|Codigo|Reglamento|Constitución Política|Constitucion Politica)"
+    r"(?:\s+(?:de|del|la|las|los|el|para|en|y|e|sobre|a|al|contra)\b|\s+[A-ZÁÉÍÓÚÑ][\wáéíóúñü]*)+"
+)
+# "Ley Federal del Trabajo y del Código Fiscal..." are two references
+_LAW_SEPARATOR = re.compile(
+    r",?\s+(?:y|e)\s+(?:(?:del?|la|las|los|el)\s+)*(?=(?:Ley|Código|Codigo|Reglamento|Constitución|Constitucion)\b)"
+)
+_TRAILING_CONNECTORS = re.compile(r"(?:\s+(?:de|del|la|las|los|el|para|en|y|e|sobre|a|al|contra))+$")
+# "artículo 27", "artículos 4o., 5 Bis y 123", "Art. 14"
+_ARTICLES = re.compile(
+    r"\b(?:art[ií]culos?|arts?\.)\s+"
+    r"((?:\d+\s*(?:o\.|°|º)?(?:\s*(?:bis|ter|qu[aá]ter|quinquies)\b)?(?:\s*(?:,|y|e)\s*)?)+)",
+    re.IGNORECASE,
+)
+_ARTICLE_NUMBER = re.compile(r"(\d+)\s*(?:o\.|°|º)?(?:\s*(bis|ter|qu[aá]ter|quinquies)\b)?", re.IGNORECASE)
+
+MAX_REFERENCED_LAWS = 20
+MAX_ARTICLE_NUMBERS = 50
+
+
+def normalize(text: str) -> str:
+    """
+    Upper case text without accents, to compare names written with and without them.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).upper().strip()
+
+
+def extract_authority(section: Optional[str]) -> Optional[str]:
+    """
+    Acronym of the authority that issued a note (SHCP, SEGOB...), from the section it is listed
+    under. Unknown sections are kept as their normalized name.
+
+    Args:
+        section (Optional[str]): Section of the DOF index.
+
+    Returns:
+        Optional[str]: The authority, None without section.
+    """
+    if not section or section == "No Section":
+        return None
+    normalized_section = normalize(section)
+    for keyword, acronym in AUTHORITY_KEYWORDS:
+        if keyword in normalized_section:
+            return acronym
+    return normalized_section
+
+
+def extract_document_type(title: Optional[str]) -> str:
+    """
+    Type of a note (decreto, acuerdo, nom, aviso, convocatoria...), from the first words of its title.
+
+    Args:
+        title (Optional[str]): Title of the note.
+
+    Returns:
+        str: The document type, 'otro' if it is not recognized.
+    """
+    normalized_title = normalize(title or "").lower()
+    for prefix, document_type in DOCUMENT_TYPE_PREFIXES:
+        if normalized_title.startswith(prefix):
+            return document_type
+    return OTHER_DOCUMENT_TYPE
+
+
+def extract_referenced_laws(text: str) -> List[str]:
+    """
+    Laws, codes, regulations and the Constitution mentioned in a text, in order of appearance.
+
+    Args:
+        text (str): Title and body of the note.
+
+    Returns:
+        List[str]: The names, without repetitions.
+    """
+    laws: Dict[str, str] = {}
+    for match in _LAW.finditer(text):
+        for name in _LAW_SEPARATOR.split(match.group(0)):
+            name = _TRAILING_CONNECTORS.sub("", name).strip()
+            # A bare "Ley" or "Reglamento" (e.g. "la presente Ley") is not a reference
+            if " " not in name:
+                continue
+            laws.setdefault(normalize(name), name)
+            if len(laws) >= MAX_REFERENCED_LAWS:
+                return list(laws.values())
+    return list(laws.values())
+
+
+def extract_article_numbers(text: str) -> List[str]:
+    """
+    Article numbers mentioned in a text ('27', '4 BIS'), in order of appearance.
+
+    Args:
+        text (str): Title and body of the note.
+
+    Returns:
+        List[str]: The article numbers, without repetitions.
+    """
+    articles: Dict[str, None] = {}
+    for match in _ARTICLES.finditer(text):
+        for number, suffix in _ARTICLE_NUMBER.findall(match.group(1)):
+            article = f"{int(number)} {normalize(suffix)}" if suffix else str(int(number))
+            articles[article] = None
+            if len(articles) >= MAX_ARTICLE_NUMBERS:
+                return list(articles)
+    return list(articles)
+
+
+def enrich_row(row: Dict, body: Optional[str] = None) -> Dict:
+    """
+    Adds the structured columns of a note to its index row: authority, document_type,
+    referenced_laws and article_numbers (from the title and, when available, the body).
+
+    Args:
+        row (Dict): Index row (published_date, section, title, link).
+        body (Optional[str]): Markdown of the note.
+
+    Returns:
+        Dict: The same row, with the new columns.
+    """
+    text = f"{row.get('title') or ''}\n{body or ''}"
+    row["authority"] = extract_authority(row.get("section"))
+    row["document_type"] = extract_document_type(row.get("title"))
+    row["referenced_laws"] = extract_referenced_laws(text)
+    row["article_numbers"] = extract_article_numbers(text)
+    return row
@@ -0,0 +1,119 @@
+from typing import Callable, Dict, List, Literal
+
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
+from .config import settings
+
+IndexParserName = Literal["html.parser", "strainer", "lxml"]
+
+SECTION_CLASS = "subtitle_azul"
+NEWS_CLASS = "enlaces"
+
+# Only the section headers and the links of the index are built, the rest of the page is skipped.
+# The strainer sees the raw class attribute (e.g. "enlaces txt_gris"), so it is split here.
+_INDEX_STRAINER = SoupStrainer(
+    ['td', 'a'],
+    class_=lambda classes: bool(classes) and not {SECTION_CLASS, NEWS_CLASS}.isdisjoint(classes.split()),
+)
+_INDEX_XPATH = (
+    f"//td[contains(concat(' ', normalize-space(@class), ' '), ' {SECTION_CLASS} ')]"
+    f" | //a[contains(concat(' ', normalize-space(@class), ' '), ' {NEWS_CLASS} ')]"
+)
+
+
+def _absolute_link(href: str) -> str:
+    if href and not href.startswith('http'):
+        return f"{settings.DOF_BASE_HOST}/{href}" if href.startswith('nota_detalle') else f"{settings.DOF_BASE_HOST}{href}"
+    return href
+
+
+def _news_item(date_str: str, section: str, text: str, href: str) -> Dict | None:
+    # Basic cleaning filters
+    if len(text) < 5 or "búsqueda avanzada" in text.lower():
+        return None
+    return {
+        'Fecha': date_str,
+        'Sección': section,
+        'Título': text,
+        'Link': _absolute_link(href)
+    }
+
+
+def _parse_soup(soup: BeautifulSoup, date_str: str) -> List[Dict]:
+    news_list = []
+    current_section = "No Section"
+
+    # Find subtitles (sections) and links (news) in order
+    for el in soup.find_all(['td', 'a'], class_=[SECTION_CLASS, NEWS_CLASS]):
+        if el.name == 'td' and SECTION_CLASS in el.get('class', []):
+            current_section = el.get_text(strip=True)
+
+        elif el.name == 'a' and NEWS_CLASS in el.get('class', []):
+            item = _news_item(date_str, current_section, el.get_text(strip=True), el.get('href', ''))
+            if item:
+                news_list.append(item)
+
+    return news_list
+
+
+def parse_with_html_parser(content: bytes, date_str: str) -> List[Dict]:
+    """
+    Reference parser: full BeautifulSoup tree with the pure Python html.parser.
+    """
+    return _parse_soup(BeautifulSoup(content, 'html.parser'), date_str)
+
+
+def parse_with_strainer(content: bytes, date_str: str) -> List[Dict]:
+    """
+    html.parser restricted by a SoupStrainer: only the section headers and links become objects.
+    """
+    return _parse_soup(BeautifulSoup(content, 'html.parser', parse_only=_INDEX_STRAINER), date_str)
+
+
+def _lxml_text(element) -> str:
+    # Same as BeautifulSoup get_text(strip=True): every text node stripped, empty ones dropped
+    return "".join(text.strip() for text in element.itertext() if text.strip())
+
+
+def parse_with_lxml(content: bytes, date_str: str) -> List[Dict]:
+    """
+    Fast parser: libxml2 (C) builds the tree and a single XPath query returns the section headers
+    and links in document order, without creating BeautifulSoup objects.
+    """
+    if not content.strip():
+        return []
+    root = lxml_html.document_fromstring(content)
+
+    news_list = []
+    current_section = "No Section"
+    for el in root.xpath(_INDEX_XPATH):
+        if el.tag == 'td':
+            current_section = _lxml_text(el)
+        else:
+            item = _news_item(date_str, current_section, _lxml_text(el), el.get('href', ''))
+            if item:
+                news_list.append(item)
+
+    return news_list
+
+
+INDEX_PARSERS: Dict[str, Callable[[bytes, str], List[Dict]]] = {
+    "html.parser": parse_with_html_parser,
+    "strainer": parse_with_strainer,
+    "lxml": parse_with_lxml,
+}
+
+
+def parse_dof_index(content: bytes, date_str: str, parser: IndexParserName | None = None) -> List[Dict]:
+    """
+    Extracts the news of a DOF index page, each one with the section it is listed under.
+
+    Args:
+        content (bytes): HTML of the index page.
+        date_str (str): Date of the page, DD/MM/YYYY.
+        parser (IndexParserName | None): Backend to use, INDEX_PARSER if None.
+
+    Returns:
+        List[Dict]: The news (Fecha, Sección, Título, Link), in page order.
+    """
+    return INDEX_PARSERS[parser or settings.INDEX_PARSER](content, date_str)
@@ -1,11 +1,46 @@
 import functions_framework
 from flask import Request
+from google.api_core.exceptions import NotFound
 import sys
 import datetime
+import time
 from loguru import logger
 from .config import settings
-from .scraper import scrape_dof
-from .bq_utils import insert_rows_from_json
+from .scraper import scrape_dof, fetch_dates, parse_date
+from .bodies import scrape_note_bodies
+from .enrichment import enrich_row
+from .bq_utils import (
+    insert_rows_from_json,
+    create_table_if_not_exists,
+    get_stored_bodies,
+    get_all_rows,
+    get_distinct_dates,
+    get_max_date,
+    merge_rows,
+    insert_rows_as_parquet,
+    truncate_table,
+    get_checkpoint,
+    save_checkpoint,
+    refresh_aggregates,
+)
+from .schemas import (
+    DOF_TABLE_SCHEMA,
+    DOF_PARTITION_FIELD,
+    DOF_CLUSTERING_FIELDS,
+    DOF_MERGE_KEYS,
+    DOF_ENRICHMENT_FIELDS,
+    BODIES_TABLE_SCHEMA,
+    BODIES_PARTITION_FIELD,
+    BODIES_CLUSTERING_FIELDS,
+    FAILED_DATES_TABLE_SCHEMA,
+    FAILED_BODIES_TABLE_SCHEMA,
+    BACKFILL_CHECKPOINT_TABLE_SCHEMA,
+    STATS_TABLE_DESCRIPTION,
+    STATS_TABLE_SCHEMA,
+    STATS_PARTITION_FIELD,
+    STATS_GROUP_FIELDS,
+    STATS_CLUSTERING_FIELDS,
+)
 
 # Logging configuration
 logger.remove()
@@ -40,50 +75,99 @@ def scrape_dof_function(request: Request):
     elif request_json and 'end_date' in request_json:
         end_date = request_json['end_date']
 
+    # incremental: dates after the last ingested one (default without dates), range: the given dates,
+    # backfill: the given dates in monthly chunks, resumable
+    mode = "range" if start_date else "incremental"
+    if request_args and 'mode' in request_args:
+        mode = request_args['mode']
+    elif request_json and 'mode' in request_json:
+        mode = request_json['mode']
+
+    include_bodies = settings.INGEST_BODIES
+    if request_args and 'include_bodies' in request_args:
+        include_bodies = str(request_args['include_bodies']).lower() in ("1", "true", "yes")
+    elif request_json and 'include_bodies' in request_json:
+        include_bodies = bool(request_json['include_bodies'])
+
     # Simple health check if no parameters and method is GET
     if request.method == 'GET' and not start_date and not end_date and request.path == '/health':
          return {"status": "ok", "service": "dof-scraper-function"}, 200
 
     try:
-        # 1. Scraping
-        logger.info(f"Starting scraping: start={start_date}, end={end_date}")
-        raw_data = scrape_dof(start_date, end_date)
-        
+        if mode not in ("incremental", "range", "backfill"):
+            raise ValueError(f"Unknown mode '{mode}', use 'incremental', 'range' or 'backfill'.")
+
+        # The pipeline owns the layout of the table: partitioned by date and clustered by section
+        create_table_if_not_exists(
+            table_name=settings.TABLE_NAME,
+            dataset_name=settings.DATASET_NAME,
+            project_id=settings.PROJECT_ID,
+            schema=DOF_TABLE_SCHEMA,
+            partition_field=DOF_PARTITION_FIELD,
+            clustering_fields=DOF_CLUSTERING_FIELDS,
+        )
+
+        # Bodies that failed in previous runs, before the new failures of this run are recorded
+        retried_bodies_count = retry_failed_bodies() if include_bodies else 0
+
+        if mode == "backfill":
+            if not start_date or not end_date:
+                raise ValueError("The backfill mode needs a start_date and an end_date.")
+            return run_backfill(parse_date(start_date), parse_date(end_date), include_bodies), 200
+
+        watermark = None
+        if mode == "incremental":
+            watermark = get_watermark()
+            start_date, end_date = incremental_range(watermark)
+
+        # 1. Scraping, including the dates that failed in previous runs
+        previous_failed_dates = get_failed_dates()
+        logger.info(
+            f"Starting scraping ({mode}): start={start_date}, end={end_date}, "
+            f"previously failed dates={len(previous_failed_dates)}"
+        )
+        if start_date is None:
+            # Already up to date, only the dates that failed before are retried
+            raw_data, failed_dates = fetch_dates(previous_failed_dates)
+        else:
+            raw_data, failed_dates = scrape_dof(start_date, end_date, extra_dates=previous_failed_dates)
+        failed_dates_iso = [date_obj.isoformat() for date_obj in failed_dates]
+
         if not raw_data:
+            record_failed_dates(failed_dates)
             return {
+                "status": "partial" if failed_dates else "success",
                 "message": "No news found for the selected range.",
+                "mode": mode,
+                "watermark": watermark.isoformat() if watermark else None,
                 "count": 0,
-                "data": []
+                "data": [],
+                "failed_dates": failed_dates_iso,
             }, 200
 
-        # 2. Data transformation for BigQuery
-        bq_rows = []
-        for item in raw_data:
-            bq_rows.append({
-                "published_date": parse_date_for_bq(item["Fecha"]),
-                "section": item["Sección"],
-                "title": item["Título"],
-                "link": item["Link"]
-            })
-            
-        # 3. BigQuery Insertion
-        logger.info(f"Inserting {len(bq_rows)} rows into {settings.DATASET_NAME}.{settings.TABLE_NAME}")
-        logger.debug(f"table_name = {settings.TABLE_NAME}")
-        logger.debug(f"dataset_name = {settings.DATASET_NAME}")
-        logger.debug(f"project_id = {settings.PROJECT_ID}")
-        insert_rows_from_json(
-            table_name=settings.TABLE_NAME,
-            dataset_name=settings.DATASET_NAME,
-            project_id=settings.PROJECT_ID,
-            rows=bq_rows
-        )
-        
-        return {
-            "status": "success",
-            "message": f"Inserted {len(bq_rows)} news items into BigQuery.",
-            "count": len(bq_rows),
+        # 2 and 3. Data transformation, enrichment and BigQuery insertion (plus the note bodies)
+        bq_rows, inserted_count, bodies_count = load_news(raw_data, include_bodies)
+        # Only after the load succeeded, otherwise the retried dates would be dropped from the table
+        record_failed_dates(failed_dates)
+
+        response = {
+            "status": "partial" if failed_dates else "success",
+            "message": f"Inserted {inserted_count} news items into BigQuery.",
+            "mode": mode,
+            "watermark": watermark.isoformat() if watermark else None,
+            "count": inserted_count,
+            "scraped_count": len(bq_rows),
             "bq_target": f"{settings.PROJECT_ID}.{settings.DATASET_NAME}.{settings.TABLE_NAME}",
-        }, 200
+            # Recorded in FAILED_DATES_TABLE_NAME, the next run retries them
+            "failed_dates": failed_dates_iso,
+        }
+
+        if include_bodies:
+            response["bodies_count"] = bodies_count
+            response["retried_bodies_count"] = retried_bodies_count
+            response["bodies_target"] = f"{settings.PROJECT_ID}.{settings.DATASET_NAME}.{settings.BODIES_TABLE_NAME}"
+
+        return response, 200
 
     except ValueError as e:
         logger.error(f"Validation error: {e}")
@@ -92,6 +176,464 @@ def scrape_dof_function(request: Request):
         logger.exception(f"Internal error: {e}")
         return {"error": f"Internal Server Error: {str(e)}"}, 500
 
+def load_news(raw_data: list[dict], include_bodies: bool) -> tuple[list[dict], int, int]:
+    """
+    Transforms the scraped news into BigQuery rows, enriches them with the structured columns
+    (authority, document type, referenced laws and articles) and merges them into the DOF table
+    on (published_date, link), so re-runs do not duplicate rows. Note bodies are fetched first
+    so the enrichment can read them, and loaded after the index. Rows whose body is already stored
+    (e.g. re-enriched by a backfill) are enriched with the stored body. Bodies that could not be
+    fetched are recorded in FAILED_BODIES_TABLE_NAME for the next runs.
+
+    Args:
+        raw_data (list[dict]): News as returned by the scraper.
+        include_bodies (bool): Whether to fetch and load the note bodies.
+
+    Returns:
+        tuple[list[dict], int, int]: The rows, how many of them were new (or enriched) and how
+        many bodies were loaded.
+    """
+    bq_rows = []
+    for item in raw_data:
+        bq_rows.append({
+            "published_date": parse_date_for_bq(item["Fecha"]),
+            "section": item["Sección"],
+            "title": item["Título"],
+            "link": item["Link"]
+        })
+
+    # Note bodies, so the agent does not have to scrape them at chat time
+    body_by_link = get_stored_note_bodies(bq_rows)
+    bodies, failed_bodies = (
+        fetch_new_note_bodies(bq_rows, stored_links=set(body_by_link)) if include_bodies else ([], [])
+    )
+    body_by_link.update({body["link"]: body["body_markdown"] for body in bodies})
+    for row in bq_rows:
+        enrich_row(row, body_by_link.get(row["link"]))
+
+    inserted_count = merge_news(bq_rows)
+    bodies_count = store_note_bodies(bodies)
+    # Only after the load, like the failed dates
+    record_failed_bodies(failed_bodies)
+    return bq_rows, inserted_count, bodies_count
+
+def merge_news(bq_rows: list[dict]) -> int:
+    """
+    Merges enriched rows into the DOF table and refreshes the statistics of their dates.
+
+    Args:
+        bq_rows (list[dict]): Enriched index rows.
+
+    Returns:
+        int: How many of them were new or enriched.
+    """
+    logger.info(f"Merging {len(bq_rows)} rows into {settings.DATASET_NAME}.{settings.TABLE_NAME}")
+    logger.debug(f"table_name = {settings.TABLE_NAME}")
+    logger.debug(f"dataset_name = {settings.DATASET_NAME}")
+    logger.debug(f"project_id = {settings.PROJECT_ID}")
+    inserted_count = merge_rows(
+        table_name=settings.TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        rows=bq_rows,
+        schema=DOF_TABLE_SCHEMA,
+        key_fields=DOF_MERGE_KEYS,
+        staging_expiration_hours=settings.STAGING_TABLE_EXPIRATION_HOURS,
+        partition_field=DOF_PARTITION_FIELD,
+        compression=settings.PARQUET_COMPRESSION,
+        update_fields=DOF_ENRICHMENT_FIELDS,
+    )
+    refresh_stats(bq_rows, inserted_count)
+    return inserted_count
+
+def refresh_stats(bq_rows: list[dict], inserted_count: int) -> None:
+    """
+    Keeps the aggregates table up to date: the counts of the dates just loaded are recomputed
+    (the whole history when the table is created).
+
+    Args:
+        bq_rows (list[dict]): Rows just merged into the DOF table.
+        inserted_count (int): How many of them were new or enriched, nothing changes if 0.
+
+    Returns:
+        None
+    """
+    created = create_table_if_not_exists(
+        table_name=settings.STATS_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        schema=STATS_TABLE_SCHEMA,
+        partition_field=STATS_PARTITION_FIELD,
+        clustering_fields=STATS_CLUSTERING_FIELDS,
+        partition_type="MONTH",
+        description=STATS_TABLE_DESCRIPTION,
+    )
+    if not created and not inserted_count:
+        return
+
+    published_dates = [row["published_date"] for row in bq_rows]
+    refresh_aggregates(
+        table_name=settings.STATS_TABLE_NAME,
+        source_table_name=settings.TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        group_fields=STATS_GROUP_FIELDS,
+        date_field=STATS_PARTITION_FIELD,
+        start_date=None if created else min(published_dates),
+        end_date=None if created else max(published_dates),
+    )
+
+def month_chunks(start_date: datetime.date, end_date: datetime.date) -> list[tuple[datetime.date, datetime.date]]:
+    """
+    Splits a range into calendar months (the first and last ones may be partial).
+
+    Args:
+        start_date (datetime.date): First date.
+        end_date (datetime.date): Last date.
+
+    Returns:
+        list[tuple[datetime.date, datetime.date]]: First and last date of every chunk.
+    """
+    chunks = []
+    chunk_start = start_date
+    while chunk_start <= end_date:
+        next_month = (chunk_start.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+        chunk_end = min(end_date, next_month - datetime.timedelta(days=1))
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = next_month
+    return chunks
+
+def run_backfill(start_date: datetime.date, end_date: datetime.date, include_bodies: bool) -> dict:
+    """
+    Backfills a long range month by month. Every chunk is scraped, merged into BigQuery (plus its
+    note bodies) and checkpointed before the next one starts, so memory stays bounded to one month
+    and a run that is interrupted, or stops at BACKFILL_MAX_SECONDS, resumes after the last loaded
+    chunk when it is called again with the same range.
+
+    Args:
+        start_date (datetime.date): First date of the backfill.
+        end_date (datetime.date): Last date of the backfill.
+        include_bodies (bool): Whether to ingest the note bodies of every chunk.
+
+    Returns:
+        dict: The response, with the progress of the backfill.
+    """
+    if start_date > end_date:
+        raise ValueError("Start date is after end date.")
+
+    started_at = time.monotonic()
+    backfill_id = f"{start_date.isoformat()}_{end_date.isoformat()}"
+    create_table_if_not_exists(
+        table_name=settings.BACKFILL_CHECKPOINT_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        schema=BACKFILL_CHECKPOINT_TABLE_SCHEMA,
+    )
+    checkpoint = get_checkpoint(
+        table_name=settings.BACKFILL_CHECKPOINT_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        backfill_id=backfill_id,
+    )
+    resume_date = start_date
+    rows_inserted = 0
+    if checkpoint:
+        resume_date = checkpoint["last_completed_date"] + datetime.timedelta(days=1)
+        rows_inserted = checkpoint["rows_inserted"]
+        logger.info(f"Resuming backfill {backfill_id} from {resume_date} ({rows_inserted} rows already inserted)")
+
+    all_chunks = month_chunks(start_date, end_date)
+    chunks = month_chunks(resume_date, end_date) if resume_date <= end_date else []
+    chunks_done = len(all_chunks) - len(chunks)
+
+    # Failures are added to the failed dates table, which the incremental runs retry
+    failed_dates = set(get_failed_dates())
+    bodies_count = 0
+    last_completed_date = resume_date - datetime.timedelta(days=1)
+    for chunk_start, chunk_end in chunks:
+        if time.monotonic() - started_at > settings.BACKFILL_MAX_SECONDS:
+            logger.warning(f"Backfill {backfill_id} reached BACKFILL_MAX_SECONDS, stopping at {last_completed_date}")
+            break
+
+        dates = [chunk_start + datetime.timedelta(days=offset) for offset in range((chunk_end - chunk_start).days + 1)]
+        raw_data, chunk_failed_dates = fetch_dates(dates)
+        if raw_data:
+            _, inserted_count, chunk_bodies_count = load_news(raw_data, include_bodies)
+            rows_inserted += inserted_count
+            bodies_count += chunk_bodies_count
+        if chunk_failed_dates:
+            failed_dates.update(chunk_failed_dates)
+            record_failed_dates(sorted(failed_dates))
+
+        save_checkpoint(
+            table_name=settings.BACKFILL_CHECKPOINT_TABLE_NAME,
+            dataset_name=settings.DATASET_NAME,
+            project_id=settings.PROJECT_ID,
+            backfill_id=backfill_id,
+            start_date=start_date,
+            end_date=end_date,
+            last_completed_date=chunk_end,
+            rows_inserted=rows_inserted,
+        )
+        last_completed_date = chunk_end
+        chunks_done += 1
+        logger.info(
+            f"Backfill {backfill_id}: chunk {chunk_start}..{chunk_end} loaded ({len(raw_data)} news, "
+            f"{len(chunk_failed_dates)} failed dates), {chunks_done}/{len(all_chunks)} chunks, "
+            f"{rows_inserted} rows inserted, {time.monotonic() - started_at:.0f}s"
+        )
+
+    complete = last_completed_date >= end_date
+    response = {
+        "status": "complete" if complete else "incomplete",
+        "message": (
+            f"Backfill {backfill_id} complete." if complete
+            else f"Backfill {backfill_id} stopped at {last_completed_date}, call again with the same range to resume."
+        ),
+        "mode": "backfill",
+        "backfill_id": backfill_id,
+        "resumed_from": resume_date.isoformat() if checkpoint else None,
+        "last_completed_date": last_completed_date.isoformat() if last_completed_date >= start_date else None,
+        "chunks_done": chunks_done,
+        "chunks_total": len(all_chunks),
+        "count": rows_inserted,
+        "bq_target": f"{settings.PROJECT_ID}.{settings.DATASET_NAME}.{settings.TABLE_NAME}",
+        "failed_dates": sorted(date_obj.isoformat() for date_obj in failed_dates),
+    }
+    if include_bodies:
+        response["bodies_count"] = bodies_count
+    return response
+
+def get_watermark() -> datetime.date | None:
+    """
+    Last published_date ingested into the DOF table, read once per run.
+
+    Returns:
+        datetime.date | None: The watermark, None if the table is empty.
+    """
+    watermark = get_max_date(
+        table_name=settings.TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+    )
+    logger.info(f"Watermark of {settings.TABLE_NAME}: {watermark}")
+    return watermark
+
+def incremental_range(watermark: datetime.date | None) -> tuple[str | None, str | None]:
+    """
+    Dates from the watermark up to today, at most INCREMENTAL_MAX_DAYS (a longer gap is closed by
+    the following runs, or with a backfill). The watermark day is scraped again: vespertine or
+    extraordinary editions may be published after the last run, and the merge skips known notes.
+
+    Args:
+        watermark (datetime.date | None): Last ingested date, None scrapes today only.
+
+    Returns:
+        tuple[str | None, str | None]: Start and end dates (YYYY-MM-DD), (None, None) if up to date.
+    """
+    today = datetime.datetime.now().date()
+    start = watermark or today
+    if start > today:
+        return None, None
+    end = min(today, start + datetime.timedelta(days=settings.INCREMENTAL_MAX_DAYS - 1))
+    return start.isoformat(), end.isoformat()
+
+def get_failed_dates() -> list[datetime.date]:
+    """
+    Dates that could not be fetched in previous runs.
+
+    Returns:
+        list[datetime.date]: The dates to retry.
+    """
+    create_table_if_not_exists(
+        table_name=settings.FAILED_DATES_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        schema=FAILED_DATES_TABLE_SCHEMA,
+    )
+    return get_distinct_dates(
+        table_name=settings.FAILED_DATES_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+    )
+
+def record_failed_dates(failed_dates: list[datetime.date]) -> None:
+    """
+    Replaces the recorded failed dates with the ones that still failed in this run (previous
+    failures were retried in this run, so the ones that succeeded are dropped).
+
+    Args:
+        failed_dates (list[datetime.date]): Dates that could not be fetched.
+
+    Returns:
+        None
+    """
+    if failed_dates:
+        logger.error(f"Could not fetch {len(failed_dates)} dates: {[str(date_obj) for date_obj in failed_dates]}")
+        failed_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        insert_rows_from_json(
+            table_name=settings.FAILED_DATES_TABLE_NAME,
+            dataset_name=settings.DATASET_NAME,
+            project_id=settings.PROJECT_ID,
+            rows=[{"published_date": date_obj.isoformat(), "failed_at": failed_at} for date_obj in failed_dates],
+            write_disposition="WRITE_TRUNCATE",
+        )
+    else:
+        truncate_table(
+            table_name=settings.FAILED_DATES_TABLE_NAME,
+            dataset_name=settings.DATASET_NAME,
+            project_id=settings.PROJECT_ID,
+        )
+
+def get_stored_note_bodies(bq_rows: list[dict]) -> dict[str, str]:
+    """
+    Reads the bodies already stored for the notes, so rows enriched again are not left with
+    the title only.
+
+    Args:
+        bq_rows (list[dict]): Index rows (published_date, section, title, link).
+
+    Returns:
+        dict[str, str]: Body by link, empty if the bodies table does not exist yet.
+    """
+    published_dates = [row["published_date"] for row in bq_rows]
+    try:
+        return get_stored_bodies(
+            table_name=settings.BODIES_TABLE_NAME,
+            dataset_name=settings.DATASET_NAME,
+            project_id=settings.PROJECT_ID,
+            start_date=min(published_dates),
+            end_date=max(published_dates),
+            links=[row["link"] for row in bq_rows],
+        )
+    except NotFound:
+        return {}
+
+def fetch_new_note_bodies(bq_rows: list[dict], stored_links: set[str]) -> tuple[list[dict], list[dict]]:
+    """
+    Fetches the body of the notes that are not stored yet.
+
+    Args:
+        bq_rows (list[dict]): Index rows (published_date, section, title, link).
+        stored_links (set[str]): Links whose body is already stored.
+
+    Returns:
+        tuple[list[dict], list[dict]]: Rows for the bodies table, and the index rows whose body
+        could not be fetched.
+    """
+    create_table_if_not_exists(
+        table_name=settings.BODIES_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        schema=BODIES_TABLE_SCHEMA,
+        partition_field=BODIES_PARTITION_FIELD,
+        clustering_fields=BODIES_CLUSTERING_FIELDS,
+    )
+
+    logger.info(f"Fetching note bodies ({len(stored_links)} already stored)")
+    return scrape_note_bodies(bq_rows, skip_links=stored_links)
+
+def retry_failed_bodies() -> int:
+    """
+    Fetches again the bodies that failed in previous runs, loads them and enriches their notes
+    with them. The ones that still fail stay recorded for the next run.
+
+    Returns:
+        int: Number of bodies loaded.
+    """
+    create_table_if_not_exists(
+        table_name=settings.FAILED_BODIES_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        schema=FAILED_BODIES_TABLE_SCHEMA,
+    )
+    failed_rows = get_all_rows(
+        table_name=settings.FAILED_BODIES_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+    )
+    if not failed_rows:
+        return 0
+
+    rows_by_link = {
+        row["link"]: {
+            "published_date": row["published_date"].isoformat(),
+            "section": row["section"],
+            "title": row["title"],
+            "link": row["link"],
+        }
+        for row in failed_rows
+    }
+    logger.info(f"Retrying {len(rows_by_link)} note bodies that failed before")
+    bodies, still_failed = scrape_note_bodies(list(rows_by_link.values()))
+    if bodies:
+        enriched_rows = [enrich_row(rows_by_link[body["link"]], body["body_markdown"]) for body in bodies]
+        merge_news(enriched_rows)
+    bodies_count = store_note_bodies(bodies)
+    record_failed_bodies(still_failed, replace=True)
+    return bodies_count
+
+def record_failed_bodies(failed_rows: list[dict], replace: bool = False) -> None:
+    """
+    Records the notes whose body could not be fetched, so the next runs retry them.
+
+    Args:
+        failed_rows (list[dict]): Index rows (published_date, section, title, link).
+        replace (bool): Replace the recorded notes (after a retry) instead of adding to them.
+
+    Returns:
+        None
+    """
+    if failed_rows:
+        logger.error(f"Could not fetch {len(failed_rows)} note bodies")
+        failed_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        insert_rows_from_json(
+            table_name=settings.FAILED_BODIES_TABLE_NAME,
+            dataset_name=settings.DATASET_NAME,
+            project_id=settings.PROJECT_ID,
+            rows=[
+                {
+                    "published_date": str(row["published_date"]),
+                    "section": row.get("section"),
+                    "title": row.get("title"),
+                    "link": row["link"],
+                    "failed_at": failed_at,
+                }
+                for row in failed_rows
+            ],
+            write_disposition="WRITE_TRUNCATE" if replace else "WRITE_APPEND",
+        )
+    elif replace:
+        truncate_table(
+            table_name=settings.FAILED_BODIES_TABLE_NAME,
+            dataset_name=settings.DATASET_NAME,
+            project_id=settings.PROJECT_ID,
+        )
+
+def store_note_bodies(bodies: list[dict]) -> int:
+    """
+    Loads note bodies into the bodies table.
+
+    Args:
+        bodies (list[dict]): Rows for the bodies table.
+
+    Returns:
+        int: Number of bodies inserted.
+    """
+    if not bodies:
+        return 0
+
+    logger.info(f"Inserting {len(bodies)} note bodies into {settings.DATASET_NAME}.{settings.BODIES_TABLE_NAME}")
+    insert_rows_as_parquet(
+        table_name=settings.BODIES_TABLE_NAME,
+        dataset_name=settings.DATASET_NAME,
+        project_id=settings.PROJECT_ID,
+        rows=bodies,
+        schema=BODIES_TABLE_SCHEMA,
+        compression=settings.PARQUET_COMPRESSION,
+    )
+    return len(bodies)
+
 def parse_date_for_bq(date_str: str) -> str:
     """
     Transforms DD/MM/YYYY to YYYY-MM-DD for BigQuery DATE type.
@@ -114,6 +656,16 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run DOF scraper locally.")
     parser.add_argument("--start_date", type=str, help="Start date in DD/MM/YYYY format")
     parser.add_argument("--end_date", type=str, help="End date in DD/MM/YYYY format")
+    parser.add_argument(
+        "--mode",
+        type=str,
+        choices=["incremental", "range", "backfill"],
+        help=(
+            "incremental (default without dates): dates after the last ingested one; range: the given dates; "
+            "backfill: the given dates in resumable monthly chunks"
+        ),
+    )
+    parser.add_argument("--skip_bodies", action="store_true", help="Do not fetch the note bodies")
     args = parser.parse_args()
 
     class MockRequest:
@@ -134,6 +686,10 @@ if __name__ == "__main__":
         request_args['start_date'] = args.start_date
     if args.end_date:
         request_args['end_date'] = args.end_date
+    if args.mode:
+        request_args['mode'] = args.mode
+    if args.skip_bodies:
+        request_args['include_bodies'] = "false"
 
     logger.info(f"Arguments: {request_args}")
 
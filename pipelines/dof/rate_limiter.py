@@ -0,0 +1,37 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: allows `rate` requests per second on average with bursts of up to
+    `capacity` requests. Shared by every worker so the total request rate to the site is bounded
+    whatever the number of workers.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self) -> None:
+        """
+        Blocks until a token is available and consumes it.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
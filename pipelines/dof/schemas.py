@@ -0,0 +1,107 @@
+from google.cloud import bigquery
+
+# Index of the DOF: one row per note
+DOF_TABLE_SCHEMA = [
+    bigquery.SchemaField(
+        "published_date", "DATE", mode="REQUIRED",
+        description="Publication date. The table is partitioned by it, filter on it to scan only those days",
+    ),
+    bigquery.SchemaField(
+        "section", "STRING",
+        description="Issuing authority the note is listed under. The table is clustered by it",
+    ),
+    bigquery.SchemaField("title", "STRING", description="Title of the note"),
+    bigquery.SchemaField("link", "STRING", mode="REQUIRED", description="URL of the note on dof.gob.mx"),
+    # Structured columns extracted from the title and body (enrichment.py), for equality filters
+    bigquery.SchemaField(
+        "authority", "STRING",
+        description="Acronym of the issuing authority: SHCP, SEGOB, SE, SSA, SEMARNAT, SENER, SEP, STPS, BANXICO, INE, SCJN... (other authorities keep their upper case name without accents). The table is clustered by it",
+    ),
+    bigquery.SchemaField(
+        "document_type", "STRING",
+        description="Type of document, lower case: decreto, acuerdo, nom, proy-nom, nmx, aviso, convocatoria, resolucion, circular, lineamientos, reglas, reglamento, convenio, contrato, extracto, sentencia, edicto, declaratoria, estatuto, manual, programa, indicador or otro. The table is clustered by it",
+    ),
+    bigquery.SchemaField(
+        "referenced_laws", "STRING", mode="REPEATED",
+        description="Laws, codes, regulations and the Constitution mentioned, as written (e.g. Ley Federal del Trabajo). Filter with EXISTS(SELECT 1 FROM UNNEST(referenced_laws) AS law WHERE ...)",
+    ),
+    bigquery.SchemaField(
+        "article_numbers", "STRING", mode="REPEATED",
+        description="Article numbers mentioned (e.g. '27', '4 BIS'). Filter with '27' IN UNNEST(article_numbers)",
+    ),
+]
+DOF_PARTITION_FIELD = "published_date"
+# Queries filter by authority and document type (and section), clustering reads only their blocks
+DOF_CLUSTERING_FIELDS = ["authority", "document_type", "section"]
+# Filled by the enrichment, rows loaded before it are enriched when their dates are loaded again
+# (document_type goes first: it is never NULL once enriched)
+DOF_ENRICHMENT_FIELDS = ["document_type", "authority", "referenced_laws", "article_numbers"]
+# A note is identified by its link within its publication date, re-runs must not duplicate it
+DOF_MERGE_KEYS = ["published_date", "link"]
+
+# Body of every DOF note, one row per link
+BODIES_TABLE_SCHEMA = [
+    bigquery.SchemaField("published_date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("link", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("body_markdown", "STRING", mode="REQUIRED", description="Note converted to Markdown"),
+    bigquery.SchemaField("content_hash", "STRING", mode="REQUIRED", description="SHA-256 of body_markdown"),
+    bigquery.SchemaField("fetched_at", "TIMESTAMP", mode="REQUIRED"),
+]
+BODIES_PARTITION_FIELD = "published_date"
+# Clustering by link makes the lookup of a single note read a few blocks only
+BODIES_CLUSTERING_FIELDS = ["link"]
+
+# Dates whose index could not be fetched, retried by the next runs until they succeed
+FAILED_DATES_TABLE_SCHEMA = [
+    bigquery.SchemaField("published_date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("failed_at", "TIMESTAMP", mode="REQUIRED"),
+]
+
+# Notes whose body could not be fetched, retried (and re-enriched) by the next runs until they succeed
+FAILED_BODIES_TABLE_SCHEMA = [
+    bigquery.SchemaField("published_date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("section", "STRING"),
+    bigquery.SchemaField("title", "STRING"),
+    bigquery.SchemaField("link", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("failed_at", "TIMESTAMP", mode="REQUIRED"),
+]
+
+# Progress of every backfill, one row per requested range
+BACKFILL_CHECKPOINT_TABLE_SCHEMA = [
+    bigquery.SchemaField("backfill_id", "STRING", mode="REQUIRED", description="start_end of the range, YYYY-MM-DD"),
+    bigquery.SchemaField("start_date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("end_date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("last_completed_date", "DATE", mode="REQUIRED", description="Last day of the last loaded chunk"),
+    bigquery.SchemaField("rows_inserted", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("updated_at", "TIMESTAMP", mode="REQUIRED"),
+]
+
+# Pre-aggregated note counts of the dof table, maintained after every load
+STATS_TABLE_DESCRIPTION = (
+    "Number of DOF notes per publication date, section, authority and document type, derived from "
+    "the dof table. Use it for counts and trends (e.g. decretos of the SHCP per month): "
+    "SUM(notes_count) grouped by DATE_TRUNC(published_date, MONTH), authority or document_type."
+)
+STATS_TABLE_SCHEMA = [
+    bigquery.SchemaField(
+        "published_date", "DATE", mode="REQUIRED",
+        description="Publication date. The table is partitioned by month on it",
+    ),
+    bigquery.SchemaField("section", "STRING", description="Section of the DOF index, as in the dof table"),
+    bigquery.SchemaField(
+        "authority", "STRING",
+        description="Acronym of the issuing authority (SHCP, SEGOB, BANXICO...), as in the dof table",
+    ),
+    bigquery.SchemaField(
+        "document_type", "STRING",
+        description="Type of document (decreto, acuerdo, nom, aviso, convocatoria...), as in the dof table",
+    ),
+    bigquery.SchemaField(
+        "notes_count", "INTEGER", mode="REQUIRED",
+        description="Number of notes of the group, add it up with SUM(notes_count)",
+    ),
+    bigquery.SchemaField("updated_at", "TIMESTAMP", mode="REQUIRED"),
+]
+STATS_PARTITION_FIELD = "published_date"
+STATS_GROUP_FIELDS = ["section", "authority", "document_type"]
+STATS_CLUSTERING_FIELDS = ["authority", "document_type"]
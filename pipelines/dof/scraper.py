@@ -1,16 +1,53 @@
+import concurrent.futures
 import datetime
 import sys
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import urllib3
 
 import requests
-from bs4 import BeautifulSoup
 from .config import settings
+from .index_parser import parse_dof_index
+from .rate_limiter import TokenBucket
 
 # Disable SSL warnings when importing the module
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Shared by every worker (index and note bodies) to bound the request rate to dof.gob.mx
+rate_limiter = TokenBucket(rate=settings.REQUESTS_PER_SECOND, capacity=settings.RATE_LIMIT_BURST)
+
+def build_session() -> requests.Session:
+    """
+    Creates the HTTP session shared by every worker: a connection pool sized for MAX_WORKERS (TCP and
+    TLS connections are reused across dates) and a retry policy with exponential backoff for
+    transient errors.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    retry = requests.adapters.Retry(
+        total=settings.RETRY_TOTAL,
+        backoff_factor=settings.RETRY_BACKOFF_FACTOR,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.MAX_WORKERS,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # DOF certificates are not always valid
+    session.verify = False
+    return session
+
+
+session = build_session()
+
+
 def get_dof_news_by_date(date_obj: datetime.date) -> List[Dict]:
     """
     Gets news for a specific date from the DOF website.
@@ -20,72 +57,90 @@ def get_dof_news_by_date(date_obj: datetime.date) -> List[Dict]:
 
     Returns:
         List[Dict]: A list of dictionaries containing news details.
+
+    Raises:
+        requests.RequestException: If the index could not be fetched after the retries.
+    """
+    params = {
+        'year': date_obj.year,
+        'month': date_obj.month,
+        'day': date_obj.day
+    }
+
+    rate_limiter.acquire()
+    # 30-second timeout for robustness
+    response = session.get(settings.DOF_BASE_URL, params=params, timeout=30)
+    response.raise_for_status()
+
+    # Checked on the bytes (the phrase is ASCII), decoding the whole page is not needed
+    if b"No hay datos para la fecha seleccionada" in response.content:
+        return []
+
+    return parse_dof_index(response.content, date_obj.strftime("%d/%m/%Y"))
+
+def _fetch_date(date_obj: datetime.date) -> Optional[List[Dict]]:
+    """
+    Gets the news of a date, None if it failed (the error is logged, the date is retried later).
     """
     try:
-        params = {
-            'year': date_obj.year,
-            'month': date_obj.month,
-            'day': date_obj.day
-        }
-        
-        # 30-second timeout for robustness
-        response = requests.get(settings.DOF_BASE_URL, params=params, verify=False, timeout=30)
-        response.raise_for_status()
-        
-        if "No hay datos para la fecha seleccionada" in response.text:
-            return []
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        news_list = []
-        current_section = "No Section"
-        date_str = date_obj.strftime("%d/%m/%Y")
-        
-        # Find subtitles (sections) and links (news) in order
-        elements = soup.find_all(['td', 'a'], class_=['subtitle_azul', 'enlaces'])
-        
-        for el in elements:
-            if el.name == 'td' and 'subtitle_azul' in el.get('class', []):
-                current_section = el.get_text(strip=True)
-            
-            elif el.name == 'a' and 'enlaces' in el.get('class', []):
-                text = el.get_text(strip=True)
-                
-                # Basic cleaning filters
-                if len(text) < 5 or "búsqueda avanzada" in text.lower():
-                    continue
-                    
-                href = el.get('href', '')
-                if href and not href.startswith('http'):
-                    link_final = f"{settings.DOF_BASE_HOST}/{href}" if href.startswith('nota_detalle') else f"{settings.DOF_BASE_HOST}{href}"
-                else:
-                    link_final = href
-
-                item = {
-                    'Fecha': date_str,
-                    'Sección': current_section,
-                    'Título': text,
-                    'Link': link_final
-                }
-                news_list.append(item)
-            
-        return news_list
-    
+        return get_dof_news_by_date(date_obj)
     except Exception as e:
         print(f"Error fetching DOF for {date_obj}: {e}", file=sys.stderr)
-        return []
+        return None
 
-def scrape_dof(start_date_str: Optional[str] = None, end_date_str: Optional[str] = None) -> List[Dict]:
+def fetch_dates(dates: List[datetime.date]) -> Tuple[List[Dict], List[datetime.date]]:
+    """
+    Fetches the news of several dates concurrently (MAX_WORKERS) under the shared rate limiter.
+    Dates that fail are retried in up to FAILED_DATES_RETRY_ROUNDS extra rounds.
+
+    Args:
+        dates (List[datetime.date]): Dates to fetch.
+
+    Returns:
+        Tuple[List[Dict], List[datetime.date]]: The news, in date order, and the dates that still failed.
+    """
+    news_by_date: Dict[datetime.date, List[Dict]] = {}
+    pending = sorted(set(dates))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
+        for attempt in range(settings.FAILED_DATES_RETRY_ROUNDS + 1):
+            if not pending:
+                break
+            if attempt:
+                print(f"Retrying {len(pending)} failed dates (round {attempt})", file=sys.stderr)
+                time.sleep(settings.RETRY_BACKOFF_FACTOR * 2 ** attempt)
+
+            failed = []
+            # map keeps the order of the dates whatever the order in which they finish
+            for date_obj, news_day in zip(pending, executor.map(_fetch_date, pending)):
+                if news_day is None:
+                    failed.append(date_obj)
+                else:
+                    news_by_date[date_obj] = news_day
+            pending = failed
+
+    all_news = [item for date_obj in sorted(news_by_date) for item in news_by_date[date_obj]]
+    return all_news, pending
+
+def scrape_dof(
+    start_date_str: Optional[str] = None,
+    end_date_str: Optional[str] = None,
+    extra_dates: Optional[List[datetime.date]] = None,
+) -> Tuple[List[Dict], List[datetime.date]]:
     """
     Executes the pipeline for a date range.
     If start_date is None, uses today. Accepted formats: 'DD/MM/YYYY' or 'YYYY-MM-DD'.
+    Dates are fetched concurrently (MAX_WORKERS) under the shared rate limiter, the news are
+    returned in date order.
 
     Args:
         start_date_str (Optional[str]): Start date string. Defaults to None.
         end_date_str (Optional[str]): End date string. Defaults to None.
+        extra_dates (Optional[List[datetime.date]]): Dates fetched besides the range, e.g. dates
+            that failed in previous runs.
 
     Returns:
-        List[Dict]: A list of all scraped news items.
+        Tuple[List[Dict], List[datetime.date]]: All scraped news items and the dates that could not be fetched.
     """
     # Date normalization
     now = datetime.datetime.now().date()
@@ -103,18 +158,11 @@ def scrape_dof(start_date_str: Optional[str] = None, end_date_str: Optional[str]
     if start_date > end_date:
         raise ValueError("Start date is after end date.")
 
-    all_news = []
-    current_date = start_date
-    delta = datetime.timedelta(days=1)
-    
-    while current_date <= end_date:
-        news_day = get_dof_news_by_date(current_date)
-        all_news.extend(news_day)
-        current_date += delta
-        # Small throttle to avoid blocks
-        time.sleep(0.5)
-        
-    return all_news
+    dates = [
+        start_date + datetime.timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
+    return fetch_dates(dates + list(extra_dates or []))
 
 def parse_date(date_str: str) -> datetime.date:
     """
@@ -0,0 +1,175 @@
+from collections import Counter
+from io import BytesIO
+from typing import BinaryIO
+import re
+import unicodedata
+from loguru import logger
+from pypdf import PdfReader
+
+# "Artículo 1o.-", "Artículo 27.", "ARTÍCULO 3o. Bis.-", "Artículo 17-A.-", "Artículo 41 Ter 1.-"
+# Only capitalized headings count: a reference wrapped to the start of a line is lower case.
+_ARTICLE_HEADING = re.compile(
+    r"^(?:Artículo|ARTÍCULO|Articulo|ARTICULO)\s+(\d+)\s*(?:o|º|°)?\.?"
+    r"(?:\s*-\s*([A-Z])\b)?"
+    r"(?:\s*(Bis|Ter|Qu[aá]ter|Quinquies|Sexies|Septies|Octies|BIS|TER|QU[AÁ]TER|QUINQUIES|SEXIES|SEPTIES|OCTIES)\.?"
+    r"(?:\s*(\d+))?)?"
+    r"\s*(?:\.\s*-|\.|-|–)\s*(.*)$"
+)
+# Whole lines with a numeral ("TÍTULO PRIMERO", "Capítulo IV", "CAPÍTULO ÚNICO"), so a sentence
+# starting with "Título de concesión" is not a heading
+_ORDINAL = r"(?:[IVXLC]+|[A-ZÁÉÍÓÚ][A-Za-záéíóú]+(?:\s+[A-ZÁÉÍÓÚ][A-Za-záéíóú]+)?)(?:\s+(?:Bis|BIS))?\.?"
+_TITLE_HEADING = re.compile(rf"^(?:TÍTULO|TITULO|Título|Titulo)\s+{_ORDINAL}$")
+_CHAPTER_HEADING = re.compile(rf"^(?:CAPÍTULO|CAPITULO|Capítulo|Capitulo)\s+{_ORDINAL}$")
+# The transitory articles of the reform decrees follow the body of the law and repeat its numbering
+_TRANSITORIOS = re.compile(r"^(?:ARTÍCULOS?\s+)?TRANSITORIOS?\.?$", re.IGNORECASE)
+_PAGE_NUMBER = re.compile(r"^\d+\s+de\s+\d+$")
+# Lines present in at least this share of the pages are running headers or footers
+REPEATED_LINE_MIN_SHARE = 0.5
+# A heading is followed by its name on the next line when it is short
+MAX_HEADING_NAME_CHARS = 150
+
+
+def normalize(text: str) -> str:
+    """
+    Upper case text without accents and with single spaces, to compare law names.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return " ".join("".join(char for char in decomposed if not unicodedata.combining(char)).upper().split())
+
+
+def article_id(number: str, letter: str | None = None, suffix: str | None = None, ordinal: str | None = None) -> str:
+    """
+    Normalized article number: '27', '4 BIS', '17-A', '41 TER 1'.
+    """
+    article = str(int(number))
+    if letter:
+        article += f"-{letter.upper()}"
+    if suffix:
+        article += f" {normalize(suffix)}"
+    if ordinal:
+        article += f" {int(ordinal)}"
+    return article
+
+
+def extract_pdf_pages(content: bytes | BinaryIO) -> list[str]:
+    """
+    Text of every page of a PDF (bytes or a seekable file), a page that cannot be parsed is kept empty.
+    """
+    reader = PdfReader(BytesIO(content) if isinstance(content, bytes) else content)
+    pages = []
+    for number, page in enumerate(reader.pages, start=1):
+        try:
+            pages.append(page.extract_text() or "")
+        except Exception as e:
+            logger.warning(f"Could not extract the text of PDF page {number}: {e}")
+            pages.append("")
+    return pages
+
+
+def _content_lines(pages: list[str]) -> list[tuple[int, str]]:
+    """
+    (page, line) of the text of the law, without empty lines, page numbers and the running headers
+    and footers (e.g. 'CÁMARA DE DIPUTADOS DEL H. CONGRESO DE LA UNIÓN', 'Última Reforma DOF ...').
+    """
+    page_lines = [[line.strip() for line in page.splitlines() if line.strip()] for page in pages]
+    occurrences = Counter(line for lines in page_lines for line in set(lines))
+    min_pages = max(2, int(len(pages) * REPEATED_LINE_MIN_SHARE))
+    repeated = {line for line, count in occurrences.items() if count >= min_pages}
+
+    return [
+        (page_number, line)
+        for page_number, lines in enumerate(page_lines, start=1)
+        for line in lines
+        if line not in repeated and not _PAGE_NUMBER.match(line)
+    ]
+
+
+def _heading_name(lines: list[tuple[int, str]], index: int) -> str:
+    # "TÍTULO PRIMERO" is followed by its name ("Principios Generales") on the next line
+    heading = lines[index][1]
+    if index + 1 < len(lines):
+        name = lines[index + 1][1]
+        is_structure = _ARTICLE_HEADING.match(name) or _TITLE_HEADING.match(name) or _CHAPTER_HEADING.match(name)
+        if not is_structure and len(name) <= MAX_HEADING_NAME_CHARS:
+            return f"{heading}. {name}"
+    return heading
+
+
+def parse_articles(pages: list[str]) -> list[dict]:
+    """
+    Split the text of a law into its articles, each one with the title and chapter it belongs to
+    and the pages it spans. Parsing stops at the transitory articles. Headings whose number is
+    lower than the previous article are references that start a line, not articles.
+
+    Args:
+        pages (list[str]): Text per page of the law PDF, index 0 is page 1.
+
+    Returns:
+        list[dict]: Articles with article, article_order, title, chapter, text, page_start and page_end.
+    """
+    lines = _content_lines(pages)
+    articles: list[dict] = []
+    seen: set[str] = set()
+    current_title, current_chapter = None, None
+    current: dict | None = None
+
+    for index, (page_number, line) in enumerate(lines):
+        if articles and _TRANSITORIOS.match(line):
+            break
+        if _TITLE_HEADING.match(line):
+            current_title, current_chapter = _heading_name(lines, index), None
+            current = None
+            continue
+        if _CHAPTER_HEADING.match(line):
+            current_chapter = _heading_name(lines, index)
+            current = None
+            continue
+
+        match = _ARTICLE_HEADING.match(line)
+        if match:
+            number, letter, suffix, ordinal, first_line = match.groups()
+            article = article_id(number, letter, suffix, ordinal)
+            if article not in seen and (not articles or int(number) >= articles[-1]["number"]):
+                seen.add(article)
+                current = {
+                    "article": article,
+                    "number": int(number),
+                    "article_order": len(articles) + 1,
+                    "title": current_title,
+                    "chapter": current_chapter,
+                    "lines": [first_line] if first_line else [],
+                    "page_start": page_number,
+                    "page_end": page_number,
+                }
+                articles.append(current)
+                continue
+
+        if current is not None:
+            current["lines"].append(line)
+            current["page_end"] = page_number
+
+    for article in articles:
+        article["text"] = "\n".join(article.pop("lines")).strip()
+        del article["number"]
+    return articles
+
+
+def extract_law_articles(content: bytes | BinaryIO, law_name: str) -> list[dict]:
+    """
+    Articles of a law PDF.
+
+    Args:
+        content (bytes | BinaryIO): The PDF, as bytes or a seekable file.
+        law_name (str): Name of the law.
+
+    Returns:
+        list[dict]: Articles (see parse_articles) with law and law_key.
+    """
+    articles = parse_articles(extract_pdf_pages(content))
+    law_key = normalize(law_name)
+    for article in articles:
+        article["law"] = law_name
+        article["law_key"] = law_key
+    if not articles:
+        logger.warning(f"No articles found in the PDF of {law_name}")
+    return articles
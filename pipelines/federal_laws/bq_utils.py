@@ -0,0 +1,125 @@
+import datetime
+import uuid
+from google.cloud import bigquery
+from loguru import logger
+
+# Create a general BigQuery client
+client = bigquery.Client()
+
+ARTICLES_TABLE_DESCRIPTION = (
+    "Articles of the Mexican federal laws, extracted from the PDFs of the Chamber of Deputies. "
+    "One row per article of the current text of each law (transitory articles excluded), clustered "
+    "by law_key and article: filter by both for a lookup."
+)
+ARTICLES_TABLE_SCHEMA = [
+    bigquery.SchemaField("law", "STRING", mode="REQUIRED", description="Name of the law."),
+    bigquery.SchemaField(
+        "law_key", "STRING", mode="REQUIRED", description="Name of the law in upper case, without accents."
+    ),
+    bigquery.SchemaField(
+        "article", "STRING", mode="REQUIRED", description="Article number, e.g. '27', '4 BIS', '17-A'."
+    ),
+    bigquery.SchemaField("article_order", "INTEGER", description="Position of the article in the law."),
+    bigquery.SchemaField("title", "STRING", description="Title (Título) of the law the article belongs to."),
+    bigquery.SchemaField("chapter", "STRING", description="Chapter (Capítulo) the article belongs to."),
+    bigquery.SchemaField("text", "STRING", description="Text of the article."),
+    bigquery.SchemaField("page_start", "INTEGER", description="First page of the article in the PDF."),
+    bigquery.SchemaField("page_end", "INTEGER", description="Last page of the article in the PDF."),
+    bigquery.SchemaField("source_url", "STRING", description="URL of the law PDF."),
+    bigquery.SchemaField("last_update_date", "DATE", description="Date of the last reform of the law."),
+    bigquery.SchemaField("updated_at", "TIMESTAMP", description="When the text of the article last changed."),
+]
+ARTICLES_CLUSTERING_FIELDS = ["law_key", "article"]
+ARTICLES_KEY_FIELDS = ["law_key", "article"]
+
+
+def create_articles_table_if_not_exists(table_name: str, dataset_name: str, project_id: str) -> None:
+    """
+    Create the law articles table, clustered by law and article.
+
+    Args:
+        table_name (str): The name of the table.
+        dataset_name (str): The name of the dataset where the table is located.
+        project_id (str): The project ID where the dataset is located.
+    """
+    table = bigquery.Table(f"{project_id}.{dataset_name}.{table_name}", schema=ARTICLES_TABLE_SCHEMA)
+    table.clustering_fields = ARTICLES_CLUSTERING_FIELDS
+    table.description = ARTICLES_TABLE_DESCRIPTION
+    client.create_table(table, exists_ok=True)
+
+
+def replace_law_articles(
+    table_name: str,
+    dataset_name: str,
+    project_id: str,
+    rows: list[dict],
+    law_keys: list[str],
+    staging_expiration_hours: int = 6,
+) -> int:
+    """
+    Replace the articles of the given laws with `rows`: new articles are inserted, articles whose
+    text changed are updated (with a new updated_at) and articles that are no longer in a law are
+    deleted. Unchanged articles are not touched, so updated_at tells readers what to refresh.
+    The rows are loaded into a staging table (unique per call) and applied with a single MERGE.
+
+    Args:
+        table_name (str): The name of the articles table.
+        dataset_name (str): The name of the dataset where the table is located.
+        project_id (str): The project ID where the dataset is located.
+        rows (list[dict]): Articles of the laws, without updated_at.
+        law_keys (list[str]): Laws that were extracted, their other articles are deleted.
+        staging_expiration_hours (int): Expiration of the staging table, in case it cannot be deleted.
+
+    Returns:
+        int: Number of articles inserted, updated or deleted.
+    """
+    if not law_keys:
+        return 0
+
+    staging_table_name = f"{table_name}_staging_{uuid.uuid4().hex[:12]}"
+    staging_schema = [field for field in ARTICLES_TABLE_SCHEMA if field.name != "updated_at"]
+    staging_table = bigquery.Table(f"{project_id}.{dataset_name}.{staging_table_name}", schema=staging_schema)
+    staging_table.expires = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        hours=staging_expiration_hours
+    )
+    client.create_table(staging_table)
+
+    try:
+        if rows:
+            load_job = client.load_table_from_json(
+                rows,
+                staging_table.reference,
+                job_config=bigquery.LoadJobConfig(schema=staging_schema, write_disposition="WRITE_TRUNCATE"),
+            )
+            load_job.result()
+
+        columns = [field.name for field in staging_schema]
+        query = f"""
+            MERGE `{project_id}.{dataset_name}.{table_name}` AS target
+            USING (
+                SELECT *
+                FROM `{project_id}.{dataset_name}.{staging_table_name}`
+                WHERE TRUE
+                QUALIFY ROW_NUMBER() OVER (PARTITION BY law_key, article ORDER BY article_order) = 1
+            ) AS source
+            ON target.law_key = source.law_key AND target.article = source.article
+            WHEN MATCHED AND (
+                {" OR ".join(f"target.{column} IS DISTINCT FROM source.{column}" for column in columns)}
+            ) THEN UPDATE SET
+                {", ".join(f"{column} = source.{column}" for column in columns)},
+                updated_at = CURRENT_TIMESTAMP()
+            WHEN NOT MATCHED THEN
+                INSERT ({", ".join(columns)}, updated_at)
+                VALUES ({", ".join(f"source.{column}" for column in columns)}, CURRENT_TIMESTAMP())
+            WHEN NOT MATCHED BY SOURCE AND target.law_key IN UNNEST(@law_keys) THEN DELETE
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ArrayQueryParameter("law_keys", "STRING", law_keys)]
+        )
+        merge_job = client.query(query, job_config=job_config)
+        merge_job.result()
+        changed_rows = merge_job.num_dml_affected_rows or 0
+        logger.info(f"Merged {len(rows)} articles of {len(law_keys)} laws into {table_name}: {changed_rows} changed")
+        return changed_rows
+    finally:
+        client.delete_table(staging_table.reference, not_found_ok=True)
@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic_settings import BaseSettings
 
 class ScraperSettings(BaseSettings):
@@ -8,4 +9,20 @@ class ScraperSettings(BaseSettings):
     BASE_URL: str = "https://www.diputados.gob.mx/LeyesBiblio/"
     MAX_WORKERS: int = 5
 
-settings = ScraperSettings()
\ No newline at end of file
+    # Article-level extraction of the law PDFs into a BigQuery table
+    EXTRACT_ARTICLES: bool = True
+    DATASET_NAME: str = "lawyer_agent"
+    ARTICLES_TABLE_NAME: str = "federal_law_articles"
+    STAGING_TABLE_EXPIRATION_HOURS: int = 6
+
+    # Change detection: manifest of the mirrored PDFs ('gcs' in the bucket, 'local' for local runs)
+    MANIFEST_BACKEND: Literal["gcs", "local"] = "gcs"
+    MANIFEST_BLOB_NAME: str = "federal_laws/manifest.json"
+    MANIFEST_LOCAL_PATH: str = ".federal_laws_manifest.json"
+    HEAD_TIMEOUT: int = 30
+
+    # Streaming transfer: the PDFs are piped from the site into resumable uploads
+    DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
+    UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024  # Multiple of 256 KiB
+
+settings = ScraperSettings()
@@ -1,6 +1,8 @@
 from google.cloud import storage
 from loguru import logger
 from io import BytesIO
+from typing import BinaryIO, Iterable
+import hashlib
 
 
 # Create a general storage client
@@ -62,4 +64,73 @@ def upload_bytes(
         blob.make_public()
         return blob.public_url
 
-    logger.info("Bytes data successfully stored in GCS bucket")
\ No newline at end of file
+    logger.info("Bytes data successfully stored in GCS bucket")
+
+
+def get_bucket(bucket_name: str) -> storage.Bucket:
+    """
+    Bucket handle, checked once so the uploads that use it do not check it again.
+
+        Args:
+            bucket_name: str -> Name of the bucket
+
+        Return:
+            storage.Bucket -> The bucket.
+    """
+    if not bucket_exists(bucket_name):
+        raise ValueError(f"The bucket {bucket_name} does not exists")
+    return client.bucket(bucket_name)
+
+
+def upload_stream(
+    bucket: storage.Bucket,
+    blob_name: str,
+    content_type: str,
+    chunks: Iterable[bytes],
+    chunk_size: int,
+    copy_to: BinaryIO | None = None,
+) -> tuple[int, str]:
+    """
+    Pipe chunks (e.g. an HTTP response body) into a resumable upload, so memory stays at one
+    upload chunk whatever the size of the file. The size and SHA-256 are computed on the fly.
+    If the chunks fail, the upload is cancelled and the blob is not written.
+
+    Args:
+        bucket: storage.Bucket -> Bucket checked with get_bucket.
+        blob_name: str -> Path + name of the file to be stored. ex: "my_folder/my_file.bin"
+        content_type: str -> Content type of the file.
+        chunks: Iterable[bytes] -> Content of the file.
+        chunk_size: int -> Bytes sent per request of the resumable upload (multiple of 256 KiB).
+        copy_to: BinaryIO | None -> File that also receives the chunks (e.g. a temporary file to parse).
+
+    Return:
+        tuple[int, str] -> Size in bytes and SHA-256 hex digest of the content.
+    """
+    content_hash = hashlib.sha256()
+    size = 0
+    blob = bucket.blob(blob_name, chunk_size=chunk_size)
+    with blob.open("wb", content_type=content_type) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+            content_hash.update(chunk)
+            size += len(chunk)
+            if copy_to is not None:
+                copy_to.write(chunk)
+
+    logger.info(f"Streamed {size} bytes to gs://{bucket.name}/{blob_name}")
+    return size, content_hash.hexdigest()
+
+
+def upload_file(bucket: storage.Bucket, blob_name: str, content_type: str, file: BinaryIO, chunk_size: int) -> None:
+    """
+    Upload an open file from its current position with a resumable upload, one chunk at a time.
+
+    Args:
+        bucket: storage.Bucket -> Bucket checked with get_bucket.
+        blob_name: str -> Path + name of the file to be stored.
+        content_type: str -> Content type of the file.
+        file: BinaryIO -> The file.
+        chunk_size: int -> Bytes sent per request of the resumable upload (multiple of 256 KiB).
+    """
+    bucket.blob(blob_name, chunk_size=chunk_size).upload_from_file(file, content_type=content_type)
+    logger.info(f"Uploaded gs://{bucket.name}/{blob_name}")
@@ -0,0 +1,93 @@
+from pathlib import Path
+from typing import Dict, Protocol
+import json
+import os
+from loguru import logger
+from .gcs_utils import client
+
+
+class ManifestStore(Protocol):
+    """
+    Where the manifest of the mirrored laws is kept: one entry per PDF URL with url, law_name,
+    last_update_date, size, etag, content_hash, blob_name, articles and checked_at.
+    """
+
+    def load(self) -> Dict[str, Dict]: ...
+
+    def save(self, manifest: Dict[str, Dict]) -> None: ...
+
+
+class GcsManifestStore:
+    """
+    Manifest as a JSON blob of the bucket the PDFs are mirrored to.
+    """
+
+    def __init__(self, bucket_name: str, blob_name: str):
+        self.bucket_name = bucket_name
+        self.blob_name = blob_name
+
+    def load(self) -> Dict[str, Dict]:
+        blob = client.bucket(self.bucket_name).blob(self.blob_name)
+        if not blob.exists():
+            logger.info(f"No manifest at gs://{self.bucket_name}/{self.blob_name}, every law is new")
+            return {}
+        return json.loads(blob.download_as_bytes())
+
+    def save(self, manifest: Dict[str, Dict]) -> None:
+        blob = client.bucket(self.bucket_name).blob(self.blob_name)
+        blob.upload_from_string(json.dumps(manifest, ensure_ascii=False, indent=1), content_type="application/json")
+        logger.info(f"Saved the manifest of {len(manifest)} laws to gs://{self.bucket_name}/{self.blob_name}")
+
+
+class LocalManifestStore:
+    """
+    Manifest as a local JSON file, the stand-in of the GCS manifest for local runs.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, Dict]:
+        if not self.path.exists():
+            logger.info(f"No manifest at {self.path}, every law is new")
+            return {}
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+    def save(self, manifest: Dict[str, Dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(temporary_path, self.path)
+        logger.info(f"Saved the manifest of {len(manifest)} laws to {self.path}")
+
+
+def get_manifest_store(backend: str, bucket_name: str, blob_name: str, local_path: str) -> ManifestStore:
+    """
+    The manifest store of the configured backend ('gcs' or 'local').
+    """
+    if backend == "gcs":
+        return GcsManifestStore(bucket_name, blob_name)
+    if backend == "local":
+        return LocalManifestStore(local_path)
+    raise ValueError(f"Unknown manifest backend {backend}, expected 'gcs' or 'local'.")
+
+
+def is_unchanged(entry: Dict | None, last_update_date: str, etag: str | None, size: int | None) -> bool:
+    """
+    Tells if a law can be skipped without downloading it: same reform date as in the manifest and
+    same ETag (or, for a server that sends none, same Content-Length).
+
+    Args:
+        entry (Dict | None): Manifest entry of the PDF URL.
+        last_update_date (str): Reform date listed on the index page.
+        etag (str | None): ETag of a HEAD request to the PDF.
+        size (int | None): Content-Length of the HEAD request.
+
+    Returns:
+        bool: True if the stored PDF is current.
+    """
+    if not entry or entry.get("last_update_date") != last_update_date:
+        return False
+    if etag:
+        return entry.get("etag") == etag
+    return size is not None and entry.get("size") == size
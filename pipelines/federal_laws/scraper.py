@@ -7,9 +7,14 @@ import sys
 from datetime import datetime
 import unicodedata
 import concurrent.futures
+import hashlib
+import tempfile
 from loguru import logger
 from .config import settings
-from .gcs_utils import upload_bytes, bucket_exists
+from .gcs_utils import get_bucket, upload_stream, upload_file
+from .articles import extract_law_articles
+from .manifest import get_manifest_store, is_unchanged
+from .bq_utils import create_articles_table_if_not_exists, replace_law_articles
 
 # Regex Patterns
 NAME_DATE_PATTERN = re.compile(r"^(.*?)(DOF\s+\d{2}/\d{2}/\d{4})", re.IGNORECASE)
@@ -49,10 +54,68 @@ def format_date_iso(date_str):
     except ValueError:
         return None
 
-def process_law(row):
+def create_session():
     """
-    Downloads and uploads a single law PDF to GCS.
+    Session with retry logic, shared by the workers so the requests to the site reuse one
+    connection pool.
+    """
+    session = requests.Session()
+    retry = requests.adapters.Retry(
+        total=5, 
+        backoff_factor=1, 
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"]
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        max_retries=retry, pool_connections=settings.MAX_WORKERS, pool_maxsize=settings.MAX_WORKERS
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def head_pdf(session, pdf_url):
+    """
+    ETag and Content-Length of a PDF, without downloading it. (None, None) if the server does not answer.
+    """
+    try:
+        response = session.head(pdf_url, timeout=settings.HEAD_TIMEOUT, allow_redirects=True)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.warning(f"HEAD request failed for {pdf_url}, downloading it: {e}")
+        return None, None
+    size = response.headers.get("Content-Length")
+    return response.headers.get("ETag"), int(size) if size and size.isdigit() else None
+
+def spool(chunks, file):
+    """
+    Write chunks to a file, computing their size and SHA-256 on the fly.
+    """
+    content_hash = hashlib.sha256()
+    size = 0
+    for chunk in chunks:
+        file.write(chunk)
+        content_hash.update(chunk)
+        size += len(chunk)
+    return size, content_hash.hexdigest()
+
+def process_law(row, manifest_entry, session, bucket):
+    """
+    Downloads and uploads a single law PDF to GCS and, if EXTRACT_ARTICLES, extracts its articles.
+    Laws with the same reform date and ETag as in the manifest are skipped without downloading
+    them, and downloaded PDFs with the same content hash are not uploaded nor extracted again.
+    The PDF is streamed from the site into a resumable upload (and, to extract it, a temporary
+    file), so memory does not depend on its size.
     Using global constants for simplicity in this script context.
+
+    Args:
+        row: Law listed on the index page.
+        manifest_entry: Entry of its PDF URL in the manifest, None if it is new.
+        session: Shared requests session.
+        bucket: Bucket the PDFs are mirrored to, checked once per run.
+
+    Returns:
+        dict: status ('new', 'updated', 'unchanged' or 'error'), law_name, file_name, articles,
+        manifest_entry (the entry to save) and error.
     """
     pdf_url = row['url_pdf']
     clean_name = row['cleaned_law_name']
@@ -61,43 +124,91 @@ def process_law(row):
     file_name = f"{clean_name}-{formatted_date}.pdf"
     file_name = file_name.replace("_-", "-").replace("-_", "-")
     blob_path = f"{settings.GCS_FOLDER}/{file_name}"
+    checked_at = datetime.now().isoformat(timespec="seconds")
+    result = {
+        "status": "error",
+        "law_name": row['law_name'],
+        "file_name": file_name,
+        "articles": [],
+        "manifest_entry": manifest_entry,
+        "error": None,
+    }
+    # A law mirrored before the article extraction was enabled is processed again
+    needs_articles = settings.EXTRACT_ARTICLES and (manifest_entry or {}).get("articles") is None
     
     try:
-        # Create a session with retry logic
-        session = requests.Session()
-        retry = requests.adapters.Retry(
-            total=5, 
-            backoff_factor=1, 
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET"]
-        )
-        adapter = requests.adapters.HTTPAdapter(max_retries=retry)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-
-        # Download with the session
-        pdf_response = session.get(pdf_url, timeout=120)  # Increased timeout
-        pdf_response.raise_for_status()
-        pdf_bytes = pdf_response.content
-        
-        # Upload
-        upload_bytes(
-            blob_name=blob_path,
-            bucket_name=settings.BUCKET_NAME,
-            content_type="application/pdf",
-            bytes_data=pdf_bytes
-        )
-        return f"SUCCESS: {file_name}"
+        etag, size = head_pdf(session, pdf_url)
+        if not needs_articles and is_unchanged(manifest_entry, formatted_date, etag, size):
+            result["status"] = "unchanged"
+            result["manifest_entry"] = {**manifest_entry, "checked_at": checked_at}
+            return result
+
+        # Download with the session, the body is streamed in chunks
+        with session.get(pdf_url, timeout=120, stream=True) as pdf_response, tempfile.TemporaryFile() as pdf_file:
+            pdf_response.raise_for_status()
+            chunks = pdf_response.iter_content(chunk_size=settings.DOWNLOAD_CHUNK_SIZE)
+
+            # Same blob (same reform date, new ETag): spooled to disk first, so identical bytes are not uploaded
+            same_blob = bool(manifest_entry) and manifest_entry.get("blob_name") == blob_path
+            if same_blob:
+                size, content_hash = spool(chunks, pdf_file)
+            else:
+                size, content_hash = upload_stream(
+                    bucket=bucket,
+                    blob_name=blob_path,
+                    content_type="application/pdf",
+                    chunks=chunks,
+                    chunk_size=settings.UPLOAD_CHUNK_SIZE,
+                    copy_to=pdf_file if settings.EXTRACT_ARTICLES else None,
+                )
+            entry = {
+                "url": pdf_url,
+                "law_name": row['law_name'],
+                "last_update_date": formatted_date,
+                "size": size,
+                "etag": pdf_response.headers.get("ETag") or etag,
+                "content_hash": content_hash,
+                "blob_name": blob_path,
+                "articles": None,
+                "checked_at": checked_at,
+            }
+
+            if same_blob:
+                if manifest_entry.get("content_hash") == content_hash and not needs_articles:
+                    # Same bytes under a new ETag: only the manifest is refreshed
+                    result["status"] = "unchanged"
+                    result["manifest_entry"] = {**entry, "articles": manifest_entry.get("articles")}
+                    return result
+                pdf_file.seek(0)
+                upload_file(bucket, blob_path, "application/pdf", pdf_file, settings.UPLOAD_CHUNK_SIZE)
+
+            articles = []
+            if settings.EXTRACT_ARTICLES:
+                pdf_file.seek(0)
+                articles = extract_law_articles(pdf_file, row['law_name'])
+                last_update_date = formatted_date if formatted_date != "unknown" else None
+                for article in articles:
+                    article["source_url"] = pdf_url
+                    article["last_update_date"] = last_update_date
+                entry["articles"] = len(articles)
+
+        result["status"] = "updated" if manifest_entry else "new"
+        result["articles"] = articles
+        result["manifest_entry"] = entry
+        return result
     except Exception as e:
         logger.error(f"Error processing {file_name}: {e}")
-        return f"ERROR: {file_name} -> {str(e)}"
+        result["error"] = f"{file_name} -> {str(e)}"
+        return result
 
 def run_pipeline():
     """
     Main execution function to scrape and upload laws.
     """
     logger.info(f"Connecting to GCS Bucket: {settings.BUCKET_NAME}")
-    if not bucket_exists(settings.BUCKET_NAME):
+    try:
+        bucket = get_bucket(settings.BUCKET_NAME)
+    except ValueError:
         logger.error(f"Bucket {settings.BUCKET_NAME} does not exist or is inaccessible.")
         return {"status": "error", "message": "Bucket not found"}
 
@@ -189,24 +300,70 @@ def run_pipeline():
     df = pd.DataFrame(data)
     logger.info(f"Extracted {len(df)} laws. Starting parallel download/upload.")
 
+    manifest_store = get_manifest_store(
+        settings.MANIFEST_BACKEND, settings.BUCKET_NAME, settings.MANIFEST_BLOB_NAME, settings.MANIFEST_LOCAL_PATH
+    )
+    manifest = manifest_store.load()
+    session = create_session()
+
     results = []
+    articles = []
     # Convert to list of dicts for processing
     rows_to_process = [row for _, row in df.iterrows()]
     
     with concurrent.futures.ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
-        future_to_law = {executor.submit(process_law, row): row for row in rows_to_process}
+        future_to_law = {
+            executor.submit(process_law, row, manifest.get(row['url_pdf']), session, bucket): row
+            for row in rows_to_process
+        }
         for future in concurrent.futures.as_completed(future_to_law):
-            results.append(future.result())
+            result = future.result()
+            results.append(result)
+            articles.extend(result["articles"])
 
-    errors = [r for r in results if r.startswith("ERROR")]
+    laws_by_status = {status: [] for status in ("new", "updated", "unchanged", "error")}
+    for result in results:
+        laws_by_status[result["status"]].append(result["law_name"])
+    errors = [result["error"] for result in results if result["status"] == "error"]
     success_count = len(results) - len(errors)
     
-    logger.info(f"Process finished. Success: {success_count}, Errors: {len(errors)}")
+    logger.info(
+        f"Process finished. New: {len(laws_by_status['new'])}, Updated: {len(laws_by_status['updated'])}, "
+        f"Unchanged: {len(laws_by_status['unchanged'])}, Errors: {len(errors)}"
+    )
+
+    changed_articles = 0
+    if settings.EXTRACT_ARTICLES and articles:
+        # Only the laws with articles are replaced: a failed download or extraction keeps the stored ones
+        law_keys = sorted({article["law_key"] for article in articles})
+        create_articles_table_if_not_exists(settings.ARTICLES_TABLE_NAME, settings.DATASET_NAME, settings.PROJECT_ID)
+        changed_articles = replace_law_articles(
+            table_name=settings.ARTICLES_TABLE_NAME,
+            dataset_name=settings.DATASET_NAME,
+            project_id=settings.PROJECT_ID,
+            rows=articles,
+            law_keys=law_keys,
+            staging_expiration_hours=settings.STAGING_TABLE_EXPIRATION_HOURS,
+        )
+        logger.info(f"Extracted {len(articles)} articles of {len(law_keys)} laws, {changed_articles} changed")
+
+    # Saved last, so the laws of a run that failed before this point are processed again
+    for result in results:
+        if result["status"] != "error" and result["manifest_entry"]:
+            manifest[result["manifest_entry"]["url"]] = result["manifest_entry"]
+    manifest_store.save(manifest)
     
     return {
         "status": "success",
         "total": len(results),
         "success": success_count,
+        "new": len(laws_by_status["new"]),
+        "updated": len(laws_by_status["updated"]),
+        "unchanged": len(laws_by_status["unchanged"]),
         "errors": len(errors),
+        "new_laws": laws_by_status["new"],
+        "updated_laws": laws_by_status["updated"],
+        "articles": len(articles),
+        "changed_articles": changed_articles,
         "error_details": errors[:10] # Return first 10 errors sample
     }
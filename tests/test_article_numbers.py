@@ -0,0 +1,68 @@
+import importlib.util
+from pathlib import Path
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Loaded by path: the agent.tools package creates Google Cloud clients on import
+agent_articles = _load("agent_articles", _ROOT / "agent" / "tools" / "federal_laws" / "articles.py")
+pipeline_articles = _load("pipeline_articles", _ROOT / "pipelines" / "federal_laws" / "articles.py")
+
+SUFFIXES = ["Bis", "Ter", "Quáter", "Quater", "Quinquies", "Sexies", "Septies", "Octies"]
+
+
+@pytest.mark.parametrize("suffix", SUFFIXES)
+@pytest.mark.parametrize("ordinal", [None, "1"])
+def test_suffixes_match_the_pipeline(suffix, ordinal):
+    expected = pipeline_articles.article_id("10", suffix=suffix, ordinal=ordinal)
+    text = f"10 {suffix}" + (f" {ordinal}" if ordinal else "")
+
+    assert agent_articles.normalize_article(text) == expected
+    assert agent_articles.normalize_article(text.lower()) == expected
+    assert agent_articles.normalize_article(f"Artículo {text.upper()}") == expected
+
+
+@pytest.mark.parametrize("letter", ["A", "B", "O"])
+def test_letters_match_the_pipeline(letter):
+    expected = pipeline_articles.article_id("17", letter=letter)
+
+    assert agent_articles.normalize_article(f"17-{letter}") == expected
+    assert agent_articles.normalize_article(f"artículo 17-{letter.lower()}") == expected
+
+
+@pytest.mark.parametrize("text", ["4o.", "4º", "Artículo 4°", "4"])
+def test_ordinal_marks_are_dropped(text):
+    assert agent_articles.normalize_article(text) == pipeline_articles.article_id("4")
+
+
+def test_pipeline_headings_match_the_agent():
+    pages = [
+        "Artículo 1o.- Primero.\nArtículo 10 Octies.- Octavo.\nArtículo 17-A.- Letra.\n"
+        "ARTÍCULO 41 TER 1.- Ordinal."
+    ]
+
+    articles = [article["article"] for article in pipeline_articles.parse_articles(pages)]
+
+    assert articles == ["1", "10 OCTIES", "17-A", "41 TER 1"]
+    assert [agent_articles.normalize_article(text) for text in ["1o", "10 octies", "17-a", "41 ter 1"]] == articles
+
+
+@pytest.mark.parametrize(
+    "law, acronym",
+    [
+        ("LEY FEDERAL DEL TRABAJO", "LFT"),
+        ("LEY DEL IMPUESTO SOBRE LA RENTA", "LISR"),
+        ("LEY FEDERAL CONTRA LA DELINCUENCIA ORGANIZADA", "LFCDO"),
+        ("LEY SOBRE EL CONTRATO DE SEGURO", "LCS"),
+    ],
+)
+def test_official_acronyms(law, acronym):
+    assert acronym in agent_articles.acronyms(law)
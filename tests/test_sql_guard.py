@@ -0,0 +1,53 @@
+import importlib.util
+from pathlib import Path
+import pytest
+
+# Loaded by path: importing the agent.tools.bigquery package creates a BigQuery client
+_SPEC = importlib.util.spec_from_file_location(
+    "sql_guard", Path(__file__).resolve().parents[1] / "agent" / "tools" / "bigquery" / "sql_guard.py"
+)
+sql_guard = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(sql_guard)
+
+
+def test_line_comment_keeps_the_rest_of_the_query():
+    query = "SELECT title -- the title\nFROM `p.d.t` WHERE section = 'x'"
+
+    prepared = sql_guard.prepare_read_query(query, max_rows=1000)
+
+    assert "FROM `p.d.t`" in prepared
+    assert "WHERE section = 'x'" in prepared
+    assert prepared.endswith("LIMIT 1000")
+
+
+def test_string_literals_are_not_rewritten():
+    query = "SELECT title FROM `p.d.t` WHERE title LIKE '%Ley  Federal%'"
+
+    assert "'%Ley  Federal%'" in sql_guard.prepare_read_query(query, max_rows=1000)
+
+
+def test_equivalent_spellings_are_prepared_alike():
+    assert sql_guard.prepare_read_query("SELECT  a\nFROM `p.d.t`;", max_rows=10) == sql_guard.prepare_read_query(
+        "select a from `p.d.t`", max_rows=10
+    )
+
+
+def test_write_statements_are_rejected():
+    with pytest.raises(ValueError):
+        sql_guard.prepare_read_query("DELETE FROM `p.d.t` WHERE TRUE", max_rows=1000)
+
+
+def test_equality_of_unqualified_columns_is_not_a_join_predicate():
+    with pytest.raises(ValueError, match="Cross joins"):
+        sql_guard.prepare_read_query("SELECT x FROM `p.d.a`, `p.d.b` WHERE x = y", max_rows=1000)
+
+
+def test_equality_between_the_joined_relations_is_a_join_predicate():
+    query = "SELECT a.x FROM `p.d.a` AS a, `p.d.b` AS b WHERE a.id = b.id"
+
+    assert "LIMIT 1000" in sql_guard.prepare_read_query(query, max_rows=1000)
+
+
+def test_equality_with_an_unknown_relation_is_not_a_join_predicate():
+    with pytest.raises(ValueError, match="Cross joins"):
+        sql_guard.prepare_read_query("SELECT a.x FROM `p.d.a` AS a, `p.d.b` AS b WHERE b.id = c.id", max_rows=1000)